@@ -7,11 +7,11 @@ Method: Account number analysis and systematic group ID generation
 """
 
 import json
-import requests
-import time
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from group_id_probe import GroupIdProber
+
 class AccountBasedGroupDiscovery:
     """Discover group IDs using account numbers and systematic search"""
     
@@ -42,6 +42,9 @@ class AccountBasedGroupDiscovery:
             }
         }
         
+        # One keep-alive session, rate limit and result cache for all customers
+        self.prober = GroupIdProber(timeout=10)
+        
         print("🎯 Account-Based Group ID Discovery")
         print("   📊 Using known account numbers for targeted search")
         print("   🔍 JPMC: Account 334224")
@@ -114,39 +117,28 @@ class AccountBasedGroupDiscovery:
     
     def test_group_id_accessibility(self, group_id: str) -> Dict:
         """Test if a group ID is accessible/valid"""
-        test_url = f"https://access.redhat.com/groups/{group_id}"
-        
-        try:
-            response = requests.head(test_url, timeout=10, allow_redirects=True)
-            
-            result = {
-                'group_id': group_id,
-                'url': test_url,
-                'http_status': response.status_code,
-                'accessible': response.status_code in [200, 301, 302, 403],
-                'response_time': response.elapsed.total_seconds(),
-                'confidence': 'none'
-            }
-            
-            # Determine confidence level
-            if response.status_code == 200:
-                result['confidence'] = 'high'  # Group exists and is accessible
-            elif response.status_code == 403:
-                result['confidence'] = 'medium'  # Group exists but access denied
-            elif response.status_code in [301, 302]:
-                result['confidence'] = 'medium'  # Redirect might indicate group
-            elif response.status_code == 404:
-                result['confidence'] = 'none'  # Group doesn't exist
-            
+        return self._score_probe(self.prober.probe(group_id))
+    
+    def _score_probe(self, probe: Dict) -> Dict:
+        """Add accessibility and confidence to a GroupIdProber result"""
+        result = dict(probe, confidence='none')
+        if 'error' in probe:
             return result
-            
-        except requests.RequestException as e:
-            return {
-                'group_id': group_id,
-                'url': test_url,
-                'error': str(e),
-                'confidence': 'none'
-            }
+        
+        status = probe['http_status']
+        result['accessible'] = status in [200, 301, 302, 403]
+        
+        # Determine confidence level
+        if status == 200:
+            result['confidence'] = 'high'  # Group exists and is accessible
+        elif status == 403:
+            result['confidence'] = 'medium'  # Group exists but access denied
+        elif status in [301, 302]:
+            result['confidence'] = 'medium'  # Redirect might indicate group
+        elif status == 404:
+            result['confidence'] = 'none'  # Group doesn't exist
+        
+        return result
     
     def discover_customer_group_id(self, customer_key: str) -> Dict:
         """Discover group ID for a specific customer"""
@@ -160,20 +152,25 @@ class AccountBasedGroupDiscovery:
         # Generate candidates
         candidates = self.generate_group_id_candidates(account_number)
         
-        # Test top candidates (limit to avoid too many requests)
+        # Test top candidates (limit to avoid too many requests); stops at the first accessible group
         test_limit = 100
         print(f"\n🧪 Testing top {test_limit} candidates...")
         
-        results = []
-        for i, candidate in enumerate(candidates[:test_limit]):
-            if i % 10 == 0:
-                print(f"   Testing candidate {i+1}/{test_limit}: {candidate}")
-            
-            result = self.test_group_id_accessibility(candidate)
-            results.append(result)
-            
-            # Small delay to be respectful
-            time.sleep(0.2)
+        done = []
+        
+        def show_progress(index: int, probe: Dict):
+            done.append(index)
+            if len(done) % 10 == 1:
+                print(f"   Tested {len(done)}/{test_limit}: {probe['group_id']}")
+        
+        probed_before, cached_before = self.prober.stats['probed'], self.prober.stats['cached']
+        results = [self._score_probe(p) for p in self.prober.probe_all(candidates[:test_limit], on_result=show_progress)]
+        probed = self.prober.stats['probed'] - probed_before
+        cached = self.prober.stats['cached'] - cached_before
+        stopped_early = self.prober.stats['stopped_early']
+        print(f"   ✅ {len(results)} candidates checked ({probed} requests, {cached} from cache)")
+        if stopped_early:
+            print("   🎯 Accessible group found - remaining candidates skipped")
         
         # Sort results by confidence
         results.sort(key=lambda x: {
@@ -211,6 +208,9 @@ class AccountBasedGroupDiscovery:
             'customer': customer_info['name'],
             'account_number': account_number,
             'total_candidates_tested': len(results),
+            'requests_sent': probed,
+            'cached_results': cached,
+            'stopped_early': stopped_early,
             'high_confidence_candidates': high_confidence,
             'medium_confidence_candidates': medium_confidence,
             'all_results': results
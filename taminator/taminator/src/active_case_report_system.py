@@ -12,10 +12,70 @@ import json
 import subprocess
 import re
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 
+# The taminator package lives next to this script (src/taminator); keep it importable however
+# the script is started
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from taminator.core.file_io import JsonFileCache
+
+# Concurrent `rhcase show` processes when case details cannot come from Hydra
+RHCASE_SHOW_MAX_WORKERS = 4
+
+
+def _case_detail_ttl() -> float:
+    """Seconds cached case details without a lastModified date are reused (TAMINATOR_CASE_DETAIL_TTL)"""
+    try:
+        return float(os.environ.get('TAMINATOR_CASE_DETAIL_TTL') or 3600)
+    except ValueError:
+        return 3600.0
+
+
+# Cached case details are reused while the case's lastModified date is unchanged; when that date is
+# unknown (rhcase fallback) they are reused for CASE_DETAIL_TTL seconds
+CASE_DETAIL_TTL = _case_detail_ttl()
+
+
+class CaseDetailCache:
+    """Case details (jira_refs, created/updated dates) on disk, keyed by case number + lastModified."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._cache = JsonFileCache(path or Path.home() / '.config' / 'taminator' / 'case_details_cache.json', 'cases')
+
+    def get(self, case_number: str, last_modified: Optional[str] = None) -> Optional[Dict]:
+        """Details for case_number if cached for this lastModified (or, with none given, cached recently)."""
+        entry = self._cache.get(case_number)
+        if not entry:
+            return None
+        if last_modified:
+            if entry.get('last_modified') != last_modified:
+                return None
+        elif time.time() - entry.get('fetched_at', 0) > CASE_DETAIL_TTL:
+            return None
+        return dict(entry['details'])
+
+    def put(self, case_number: str, details: Dict, last_modified: Optional[str] = None) -> None:
+        self._cache.put(case_number, {
+            'last_modified': last_modified or details.get('updated_date') or '',
+            'fetched_at': time.time(),
+            'details': details,
+        })
+
+    def save(self) -> None:
+        """Write changed entries back (see JsonFileCache.save); write errors are ignored."""
+        try:
+            self._cache.save()
+        except OSError:
+            pass
+
 @dataclass
 class CaseInfo:
     """Represents a single RFE/Bug case with all relevant information"""
@@ -65,6 +125,9 @@ class ActiveCaseReportSystem:
             'Delivered'
         ]
         
+        # Case details by case number + lastModified (see enrich_case_data)
+        self.detail_cache = CaseDetailCache()
+        
         self.logger.info("Active Case Report System initialized")
     
     def _setup_logging(self) -> logging.Logger:
@@ -275,19 +338,35 @@ class ActiveCaseReportSystem:
         return filtered_cases
     
     def enrich_case_data(self, cases: List[CaseInfo]) -> List[CaseInfo]:
-        """Enrich case data with additional information"""
-        
+        """
+        Enrich case data with additional information
+
+        Details for all cases come from one bulk Hydra query (by case number); cases Hydra
+        cannot serve fall back to `rhcase show`, RHCASE_SHOW_MAX_WORKERS at a time. Details are
+        cached on disk by case number and lastModified (see CaseDetailCache).
+        """
+        cache = self.detail_cache
+        details_by_case = self._get_case_details_bulk([c.case_number for c in cases], cache)
+
+        missing = [c.case_number for c in cases if c.case_number not in details_by_case]
+        if missing:
+            self.logger.info(f"Fetching details for {len(missing)} case(s) via rhcase show")
+            with ThreadPoolExecutor(max_workers=min(RHCASE_SHOW_MAX_WORKERS, len(missing))) as pool:
+                for case_number, details in zip(missing, pool.map(lambda n: self._get_case_details(n, cache), missing)):
+                    if details:
+                        details_by_case[case_number] = details
+        cache.save()
+
         enriched_cases = []
         
         for case in cases:
             try:
-                # Get detailed case information
-                detailed_case = self._get_case_details(case.case_number)
+                detailed_case = details_by_case.get(case.case_number)
                 if detailed_case:
                     # Merge detailed information
                     case.jira_refs = detailed_case.get('jira_refs', [])
-                    case.created_date = detailed_case.get('created_date', case.created_date)
-                    case.updated_date = detailed_case.get('updated_date', case.updated_date)
+                    case.created_date = detailed_case.get('created_date') or case.created_date
+                    case.updated_date = detailed_case.get('updated_date') or case.updated_date
                 
                 enriched_cases.append(case)
                 
@@ -296,10 +375,67 @@ class ActiveCaseReportSystem:
                 enriched_cases.append(case)  # Add case without enrichment
         
         return enriched_cases
+
+    def _get_case_details_bulk(self, case_numbers: List[str], cache: CaseDetailCache) -> Dict[str, Dict]:
+        """Details for many cases from one Hydra search; {} when Hydra or its credentials are unavailable."""
+        if not case_numbers:
+            return {}
+        try:
+            from taminator.core.hydra_search import (
+                search_cases_by_case_numbers, refetch_docs_without_jira, jira_ids_from_doc,
+                get_bearer_token_from_env, get_basic_auth_from_env,
+            )
+        except ImportError:
+            return {}
+        basic_auth = get_basic_auth_from_env()
+        token = None if basic_auth else get_bearer_token_from_env()
+        if not basic_auth and not token:
+            try:
+                from taminator.core.hybrid_auth import hybrid_auth
+                token = hybrid_auth.get_token('portal', required=False)
+            except Exception:
+                token = None
+        if not basic_auth and not token:
+            return {}
+        try:
+            docs = search_cases_by_case_numbers(
+                token=token,
+                case_numbers=case_numbers,
+                basic_auth=basic_auth,
+                max_rows=len(case_numbers),
+                profile='case-detail',
+            )
+            # Same JIRA recall as `rhcase show`: cases whose projected doc has no key are re-read in full
+            docs = refetch_docs_without_jira(docs, 'case-detail', token=token, basic_auth=basic_auth)
+        except Exception as e:
+            self.logger.warning(f"Bulk Hydra case lookup failed ({e}); falling back to rhcase show")
+            return {}
+
+        details_by_case = {}
+        for doc in docs:
+            case_number = str(doc.get('case_number') or '').strip()
+            if not case_number:
+                continue
+            last_modified = doc.get('case_lastModifiedDate') or ''
+            details = cache.get(case_number, last_modified) if last_modified else None
+            if details is None:
+                details = {
+                    'jira_refs': [{'jira_id': j} for j in jira_ids_from_doc(doc)],
+                    'created_date': doc.get('case_createdDate') or '',
+                    'updated_date': last_modified,
+                }
+                cache.put(case_number, details, last_modified)
+            details_by_case[case_number] = details
+        self.logger.info(f"Hydra returned details for {len(details_by_case)} of {len(case_numbers)} case(s)")
+        return details_by_case
     
-    def _get_case_details(self, case_number: str) -> Optional[Dict]:
+    def _get_case_details(self, case_number: str, cache: Optional[CaseDetailCache] = None) -> Optional[Dict]:
         """Get detailed information for a specific case"""
         
+        if cache is not None:
+            cached = cache.get(case_number)
+            if cached is not None:
+                return cached
         try:
             # Use rhcase to get case details
             result = subprocess.run(
@@ -314,6 +450,8 @@ class ActiveCaseReportSystem:
             
             # Parse detailed case information
             details = self._parse_case_details(result.stdout)
+            if cache is not None:
+                cache.put(case_number, details)
             return details
             
         except Exception as e:
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+"""
+Group ID Probe - Shared candidate probing for group ID discovery
+Purpose: HEAD-check https://access.redhat.com/groups/<id> candidates quickly and politely
+Features: Keep-alive session, bounded parallelism under one request rate, stop on first 200,
+          on-disk cache of known hits and known 404s so re-runs skip them
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# The taminator package lives next to this script (src/taminator); keep it importable however
+# the script is started
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from taminator.core.file_io import JsonFileCache
+
+GROUP_URL = "https://access.redhat.com/groups/{group_id}"
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name) or default)
+    except ValueError:
+        return default
+
+
+# Probes in flight at once (TAMINATOR_PROBE_WORKERS) and requests per second across all of them
+# (TAMINATOR_PROBE_RATE); the old sequential loops paused 0.2-0.5s between requests
+PROBE_MAX_WORKERS = max(1, int(_env_number('TAMINATOR_PROBE_WORKERS', 8)))
+PROBE_RATE = _env_number('TAMINATOR_PROBE_RATE', 5)
+
+# Status codes worth remembering: groups that exist (or redirect) and groups that do not.
+# Errors, 429 and 5xx are never cached.
+HIT_STATUSES = (200, 301, 302, 403)
+MISS_STATUSES = (404, 410)
+HIT_TTL = 30 * 86400
+MISS_TTL = 7 * 86400
+
+
+def _fresh(entry: Dict, now: float) -> bool:
+    ttl = HIT_TTL if entry.get('http_status') in HIT_STATUSES else MISS_TTL
+    return now - entry.get('checked_at', 0) <= ttl
+
+
+class ProbeCache:
+    """Last HTTP status per group ID, in ~/.config/taminator/group_id_probe_cache.json"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._cache = JsonFileCache(
+            path or Path.home() / '.config' / 'taminator' / 'group_id_probe_cache.json', 'groups')
+
+    def get(self, group_id: str) -> Optional[Dict]:
+        """Cached {'http_status', 'checked_at'} for group_id while still fresh, else None"""
+        entry = self._cache.get(group_id)
+        if not entry or not _fresh(entry, time.time()):
+            return None
+        return entry
+
+    def put(self, group_id: str, http_status: int) -> None:
+        if http_status not in HIT_STATUSES and http_status not in MISS_STATUSES:
+            return
+        self._cache.put(group_id, {'http_status': http_status, 'checked_at': time.time()})
+
+    def save(self) -> None:
+        """Write new results back, dropping expired ones (see JsonFileCache.save); write errors are ignored"""
+        now = time.time()
+        try:
+            self._cache.save(keep=lambda _group_id, entry: isinstance(entry, dict) and _fresh(entry, now))
+        except OSError:
+            pass
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            slot = max(time.monotonic(), self._next)
+            self._next = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class GroupIdProber:
+    """HEAD-probes group ID candidates over one keep-alive session"""
+
+    def __init__(self, timeout: float = 10, max_workers: int = PROBE_MAX_WORKERS,
+                 rate: float = PROBE_RATE, cache: Optional[ProbeCache] = None):
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = _RateLimiter(rate)
+        self.cache = cache if cache is not None else ProbeCache()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.stats = {'probed': 0, 'cached': 0, 'stopped_early': False}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def probe(self, group_id: str) -> Dict:
+        """
+        Status of one candidate: {'group_id', 'url', 'http_status', 'response_time', 'cached'}, or
+        {'group_id', 'url', 'error'} when the request failed
+        """
+        url = GROUP_URL.format(group_id=group_id)
+        entry = self.cache.get(group_id)
+        if entry:
+            self._count('cached')
+            return {'group_id': group_id, 'url': url, 'http_status': entry['http_status'],
+                    'response_time': 0.0, 'cached': True}
+        self.rate_limiter.wait()
+        self._count('probed')
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+        except requests.RequestException as e:
+            return {'group_id': group_id, 'url': url, 'error': str(e)}
+        self.cache.put(group_id, response.status_code)
+        return {'group_id': group_id, 'url': url, 'http_status': response.status_code,
+                'response_time': response.elapsed.total_seconds(), 'cached': False}
+
+    def probe_all(self, candidates: List[str], stop_on_hit: bool = True,
+                  on_result: Optional[Callable[[int, Dict], None]] = None) -> List[Dict]:
+        """
+        Probe candidates with up to max_workers requests in flight, in candidate order.
+
+        With stop_on_hit, no new candidates are started once one answers 200 (probes already in
+        flight still finish). on_result(index, result) is called from this thread as results arrive.
+        Returns the results of the probed candidates in candidate order.
+        """
+        results: Dict[int, Dict] = {}
+        self.stats['stopped_early'] = False
+        pending = iter(enumerate(candidates))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+            hit = False
+            while True:
+                while not hit and len(running) < self.max_workers:
+                    item = next(pending, None)
+                    if item is None:
+                        break
+                    running[pool.submit(self.probe, item[1])] = item[0]
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    results[index] = future.result()
+                    if on_result:
+                        on_result(index, results[index])
+                    if stop_on_hit and results[index].get('http_status') == 200:
+                        hit = True
+            if hit and len(results) < len(candidates):
+                self.stats['stopped_early'] = True
+        self.cache.save()
+        return [results[i] for i in sorted(results)]
@@ -8,11 +8,60 @@ Integrates: JWT authentication + 3-table RFE system + Customer portal management
 
 import os
 import json
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from redhat_portal_api_client import RedHatPortalAPIClient
 from customer_template_renderer import CustomerTemplateRenderer
 
+# Portal write rate per endpoint: (requests per second, burst). One discussion post every
+# 2 seconds matches the pause post_to_all_customers used to sleep between posts. Override
+# per endpoint with TAMINATOR_RATE_LIMIT_<ENDPOINT>="<rate>[:<burst>]", e.g.
+# TAMINATOR_RATE_LIMIT_CREATE_GROUP_DISCUSSION=0.2:1
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "create_group_discussion": (0.5, 1),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, at most `burst` saved up."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = max(rate, 1e-6)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def _rate_limit_for(endpoint: str) -> Tuple[float, int]:
+    rate, burst = DEFAULT_RATE_LIMITS.get(endpoint, (0.5, 1))
+    raw = os.environ.get(f"TAMINATOR_RATE_LIMIT_{endpoint.upper()}", "").strip()
+    if raw:
+        try:
+            parts = raw.split(":", 1)
+            rate = float(parts[0])
+            burst = int(parts[1]) if len(parts) > 1 else burst
+        except ValueError:
+            pass
+    return rate, burst
+
 class RFEDiscussionAPIClient:
     """Enhanced API client for posting RFE discussions to customer portal groups"""
     
@@ -55,6 +104,10 @@ class RFEDiscussionAPIClient:
             }
         }
         
+        # One token bucket per portal endpoint, shared by every thread posting through this client
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        self._rate_limiters_lock = threading.Lock()
+        
         print(f"🎯 RFE Discussion API Client initialized for {environment.upper()}")
         print(f"   Managing {len(self.customer_groups)} customer groups")
     
@@ -136,7 +189,16 @@ class RFEDiscussionAPIClient:
         total_cases = rfe_count + bug_count
         return f"RFE/Bug Tracker Update - {customer_name} - {total_cases} Cases ({rfe_count} RFE, {bug_count} Bug) - {timestamp}"
     
-    def post_rfe_discussion(self, customer_key: str, cases: List[Dict], update_existing: bool = False) -> Optional[Dict]:
+    def rate_limiter(self, endpoint: str) -> TokenBucket:
+        """Token bucket throttling calls to one portal endpoint (see DEFAULT_RATE_LIMITS)."""
+        with self._rate_limiters_lock:
+            bucket = self._rate_limiters.get(endpoint)
+            if bucket is None:
+                bucket = self._rate_limiters[endpoint] = TokenBucket(*_rate_limit_for(endpoint))
+            return bucket
+    
+    def post_rfe_discussion(self, customer_key: str, cases: List[Dict], update_existing: bool = False,
+                            discussion_body: Optional[str] = None) -> Optional[Dict]:
         """
         Post RFE/Bug tracker content as a discussion to customer portal group
         
@@ -144,6 +206,7 @@ class RFEDiscussionAPIClient:
             customer_key: Customer identifier (e.g., 'wellsfargo', 'jpmc')
             cases: List of RFE/Bug cases with enriched data
             update_existing: Whether to update existing discussion or create new one
+            discussion_body: Already-rendered portal content for these cases (skips rendering here)
             
         Returns:
             Dict with posting result or None if failed
@@ -178,11 +241,12 @@ class RFEDiscussionAPIClient:
         )
         
         # Generate 3-table markdown content using customer template
-        discussion_body = self.template_renderer.render_portal_content(
-            cases, 
-            customer_name, 
-            template_key
-        )
+        if discussion_body is None:
+            discussion_body = self.template_renderer.render_portal_content(
+                cases, 
+                customer_name, 
+                template_key
+            )
         
         # Add API posting header
         api_header = self._generate_api_header()
@@ -191,8 +255,11 @@ class RFEDiscussionAPIClient:
         print(f"   📄 Generated {len(discussion_body)} characters of content")
         print(f"   📝 Title: {discussion_title}")
         
-        # Post to customer portal group
+        # Post to customer portal group (throttled per endpoint; waits here instead of sleeping between posts)
         try:
+            waited = self.rate_limiter("create_group_discussion").acquire()
+            if waited:
+                print(f"   ⏱️  Waited {waited:.1f}s for the portal rate limit")
             result = self.portal_client.create_group_discussion(
                 group_id=group_id,
                 title=discussion_title,
@@ -285,14 +352,9 @@ class RFEDiscussionAPIClient:
                 results[customer_key] = None
                 continue
                 
+            # Pacing between posts comes from the per-endpoint rate limiter in post_rfe_discussion
             result = self.post_rfe_discussion(customer_key, cases)
             results[customer_key] = result
-            
-            # Add delay between posts to be respectful to API
-            if result:
-                print("   ⏱️  Waiting 2 seconds before next post...")
-                import time
-                time.sleep(2)
         
         # Summary
         successful_posts = sum(1 for r in results.values() if r is not None)
@@ -13,14 +13,48 @@ import yaml
 import time
 import subprocess
 import logging
+import random
 import requests
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import traceback
 
-class TestResult(Enum):
+# The taminator package lives next to this script (src/taminator); keep it importable however
+# the script is started
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from taminator.core.file_io import JsonFileCache
+
+def _suite_max_workers() -> int:
+    try:
+        return max(1, int(os.environ.get('TAMINATOR_VERIFY_WORKERS') or 6))
+    except ValueError:
+        return 6
+
+
+# Tests running at once across the suite (TAMINATOR_VERIFY_WORKERS=1 runs them one by one) and per
+# category (network checks wait on remote hosts). Tests in EXCLUSIVE_CATEGORIES are timed, so one
+# only starts when nothing else runs and nothing else starts until it finished.
+SUITE_MAX_WORKERS = _suite_max_workers()
+CATEGORY_MAX_WORKERS = {'connectivity': 3}
+DEFAULT_CATEGORY_WORKERS = 2
+EXCLUSIVE_CATEGORIES = frozenset({'performance'})
+# Retries wait retry_delay * 2**attempt seconds (with jitter), never longer than this
+RETRY_BACKOFF_MAX = 30.0
+# Passing-run latencies kept per test; a test is flagged once it has LATENCY_MIN_SAMPLES and the
+# current run is REGRESSION_FACTOR times slower than its p95 (and at least half a second slower)
+LATENCY_HISTORY_SIZE = 50
+LATENCY_MIN_SAMPLES = 5
+REGRESSION_FACTOR = 1.5
+
+class TestStatus(Enum):
     """Test result status"""
     PASS = "PASS"
     FAIL = "FAIL"
@@ -51,12 +85,78 @@ class TestCase:
 class TestResult:
     """Represents a test result"""
     test_name: str
-    status: TestResult
+    status: TestStatus
     execution_time: float
     output: str
     error: Optional[str] = None
     timestamp: str = None
     retry_attempts: int = 0
+    latency: float = 0.0  # duration of the last attempt, without retry waits
+
+def _percentile(samples: List[float], pct: float) -> float:
+    """Linear-interpolated percentile (0-100) of samples"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+class LatencyHistory:
+    """Per-test latencies of previous passing runs, in ~/.config/taminator/verification_latency.json"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._cache = JsonFileCache(path or Path.home() / '.config' / 'taminator' / 'verification_latency.json', 'tests')
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, List[float]] = {}  # this run's samples, appended to the file's on save
+
+    def _samples(self, test_name: str) -> List[float]:
+        try:
+            return [float(x) for x in self._cache.get(test_name) or []]
+        except (TypeError, ValueError):
+            return []
+
+    def stats(self, test_name: str, latency: float) -> Dict[str, Any]:
+        """Percentiles of earlier runs of test_name and whether latency is a regression against them"""
+        samples = self._samples(test_name)
+        stats = {'current': round(latency, 3), 'samples': len(samples)}
+        if samples:
+            p95 = _percentile(samples, 95)
+            stats.update({
+                'p50': round(_percentile(samples, 50), 3),
+                'p90': round(_percentile(samples, 90), 3),
+                'p95': round(p95, 3),
+                'max': round(max(samples), 3),
+            })
+            stats['regression'] = (
+                len(samples) >= LATENCY_MIN_SAMPLES
+                and latency > p95 * REGRESSION_FACTOR
+                and latency - p95 >= 0.5
+            )
+        else:
+            stats['regression'] = False
+        return stats
+
+    def record(self, test_name: str, latency: float) -> None:
+        with self._lock:
+            self._recorded.setdefault(test_name, []).append(round(latency, 3))
+            samples = self._samples(test_name) + [round(latency, 3)]
+            self._cache.put(test_name, samples[-LATENCY_HISTORY_SIZE:])
+
+    def save(self) -> None:
+        """Append this run's samples to the history file (see JsonFileCache.save); write errors are ignored"""
+        def merge(test_name: str, on_disk: Any, ours: List[float]) -> List[float]:
+            # Another run may have saved since we loaded: keep its samples and add only ours
+            earlier = on_disk if isinstance(on_disk, list) else []
+            return (earlier + self._recorded.get(test_name, []))[-LATENCY_HISTORY_SIZE:]
+
+        with self._lock:
+            try:
+                self._cache.save(merge=merge)
+                self._recorded = {}
+            except OSError:
+                pass
 
 class RFEVerificationSystem:
     """Comprehensive verification system for RFE automation tool"""
@@ -66,7 +166,7 @@ class RFEVerificationSystem:
         
         # Test configuration
         self.test_timeout = 300  # 5 minutes max for full test suite
-        self.retry_delay = 2     # 2 seconds between retries
+        self.retry_delay = 2     # first retry waits ~2 seconds, doubling after each failed attempt
         
         # Test results storage
         self.test_results = []
@@ -82,6 +182,10 @@ class RFEVerificationSystem:
         # Define comprehensive test cases
         self.test_cases = self._define_test_cases()
         
+        # Latencies of earlier runs, for percentiles and regression flags in the report
+        self.latency_history = LatencyHistory()
+        self.latency_regressions = []
+        
         self.logger.info("RFE Verification System initialized")
     
     def _setup_logging(self) -> logging.Logger:
@@ -165,7 +269,8 @@ class RFEVerificationSystem:
                 severity=TestSeverity.HIGH,
                 category="connectivity",
                 command="curl -s --connect-timeout 10 https://gitlab.cee.redhat.com",
-                expected_result="200"
+                expected_result="200",
+                dependencies=["redhat_vpn_connectivity"]
             ),
             TestCase(
                 name="redhat_ai_models_access",
@@ -173,7 +278,8 @@ class RFEVerificationSystem:
                 severity=TestSeverity.HIGH,
                 category="connectivity",
                 command="curl -s --connect-timeout 10 https://developer.models.corp.redhat.com",
-                expected_result="200"
+                expected_result="200",
+                dependencies=["redhat_vpn_connectivity"]
             ),
             
             # Authentication Tests
@@ -183,7 +289,8 @@ class RFEVerificationSystem:
                 severity=TestSeverity.CRITICAL,
                 category="authentication",
                 command="rhcase list 838043 --months 1",
-                expected_result="cases found"
+                expected_result="cases found",
+                dependencies=["system_rhcase_available", "redhat_vpn_connectivity"]
             ),
             TestCase(
                 name="redhat_sso_credentials",
@@ -243,7 +350,8 @@ class RFEVerificationSystem:
                 severity=TestSeverity.CRITICAL,
                 category="components",
                 command="python3 -c 'from rfe_discussion_api_client import RFEDiscussionAPIClient; print(\"OK\")'",
-                expected_result="OK"
+                expected_result="OK",
+                dependencies=["python_requests_available"]
             ),
             
             # Configuration Tests
@@ -290,7 +398,8 @@ class RFEVerificationSystem:
                 category="performance",
                 command="time rhcase list 838043 --months 1",
                 expected_result="real",
-                timeout_seconds=60
+                timeout_seconds=60,
+                dependencies=["rhcase_authentication"]
             ),
             TestCase(
                 name="python_import_performance",
@@ -298,12 +407,18 @@ class RFEVerificationSystem:
                 severity=TestSeverity.LOW,
                 category="performance",
                 command="time python3 -c 'import requests, yaml, json'",
-                expected_result="real"
+                expected_result="real",
+                dependencies=["python_requests_available", "python_yaml_available"]
             ),
         ]
         
         return test_cases
     
+    def _retry_backoff(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt (0-based): retry_delay doubled per attempt, capped, with jitter"""
+        delay = min(RETRY_BACKOFF_MAX, self.retry_delay * (2 ** attempt))
+        return delay * random.uniform(0.75, 1.0)
+    
     def run_single_test(self, test_case: TestCase) -> TestResult:
         """Run a single test case with retry logic"""
         
@@ -311,8 +426,10 @@ class RFEVerificationSystem:
         
         start_time = time.time()
         last_error = None
+        latency = 0.0
         
         for attempt in range(test_case.retry_count):
+            attempt_start = time.time()
             try:
                 # Execute the test command
                 result = subprocess.run(
@@ -324,6 +441,7 @@ class RFEVerificationSystem:
                 )
                 
                 execution_time = time.time() - start_time
+                latency = time.time() - attempt_start
                 
                 # Check if test passed
                 if result.returncode == 0:
@@ -332,11 +450,12 @@ class RFEVerificationSystem:
                         if test_case.expected_result in result.stdout:
                             return TestResult(
                                 test_name=test_case.name,
-                                status=TestResult.PASS,
+                                status=TestStatus.PASS,
                                 execution_time=execution_time,
                                 output=result.stdout,
                                 timestamp=datetime.now().isoformat(),
-                                retry_attempts=attempt
+                                retry_attempts=attempt,
+                                latency=latency
                             )
                         else:
                             last_error = f"Expected '{test_case.expected_result}' not found in output"
@@ -344,11 +463,12 @@ class RFEVerificationSystem:
                         # No expected result specified, just check return code
                         return TestResult(
                             test_name=test_case.name,
-                            status=TestResult.PASS,
+                            status=TestStatus.PASS,
                             execution_time=execution_time,
                             output=result.stdout,
                             timestamp=datetime.now().isoformat(),
-                            retry_attempts=attempt
+                            retry_attempts=attempt,
+                            latency=latency
                         )
                 else:
                     last_error = f"Command failed with return code {result.returncode}: {result.stderr}"
@@ -357,21 +477,23 @@ class RFEVerificationSystem:
                 last_error = f"Test timed out after {test_case.timeout_seconds} seconds"
             except Exception as e:
                 last_error = f"Test execution error: {str(e)}"
+            latency = time.time() - attempt_start
             
-            # Wait before retry (except on last attempt)
+            # Back off before retry (except on last attempt)
             if attempt < test_case.retry_count - 1:
-                time.sleep(self.retry_delay)
+                time.sleep(self._retry_backoff(attempt))
         
         # All attempts failed
         execution_time = time.time() - start_time
         return TestResult(
             test_name=test_case.name,
-            status=TestResult.FAIL,
+            status=TestStatus.FAIL,
             execution_time=execution_time,
             output="",
             error=last_error,
             timestamp=datetime.now().isoformat(),
-            retry_attempts=test_case.retry_count
+            retry_attempts=test_case.retry_count,
+            latency=latency
         )
     
     def run_test_suite(self, categories: List[str] = None, severity: TestSeverity = None) -> Dict[str, Any]:
@@ -390,37 +512,121 @@ class RFEVerificationSystem:
         if severity:
             filtered_tests = [t for t in filtered_tests if t.severity == severity]
         
-        # Run tests
-        for test_case in filtered_tests:
-            result = self.run_single_test(test_case)
-            self.test_results.append(result)
-            
-            # Log result
-            status_icon = "✅" if result.status == TestResult.PASS else "❌" if result.status == TestResult.FAIL else "⚠️"
-            self.logger.info(f"{status_icon} {test_case.name}: {result.status.value} ({result.execution_time:.2f}s)")
-            
-            if result.error:
-                self.logger.error(f"   Error: {result.error}")
+        # Run tests concurrently; results are kept in definition order
+        results = self._run_scheduled(filtered_tests)
+        self.test_results.extend(results[t.name] for t in filtered_tests)
         
         # Calculate summary
         execution_time = time.time() - start_time
         self._calculate_summary(execution_time)
         
-        # Generate report
+        # Generate report, then add this run's latencies to the history
         report = self._generate_report()
+        for result in self.test_results:
+            if result.status == TestStatus.PASS:
+                self.latency_history.record(result.test_name, result.latency)
+        self.latency_history.save()
         
         return report
     
+    def _run_scheduled(self, tests: List[TestCase]) -> Dict[str, TestResult]:
+        """
+        Run tests on a thread pool: at most SUITE_MAX_WORKERS at once and CATEGORY_MAX_WORKERS per
+        category (EXCLUSIVE_CATEGORIES alone), each one only after its dependencies passed. A test
+        whose dependency failed or was skipped is skipped. Dependencies outside the selected tests
+        are not run and do not block.
+        """
+        by_name = {t.name: t for t in tests}
+        waiting_on = {}
+        for test_case in tests:
+            unknown = [d for d in (test_case.dependencies or []) if d not in by_name]
+            if unknown:
+                self.logger.debug(f"{test_case.name}: dependencies not selected, not waiting on {', '.join(unknown)}")
+            waiting_on[test_case.name] = [d for d in (test_case.dependencies or []) if d in by_name]
+        
+        results: Dict[str, TestResult] = {}
+        running = {}  # future -> TestCase
+        category_running: Dict[str, int] = {}
+        
+        with ThreadPoolExecutor(max_workers=SUITE_MAX_WORKERS) as pool:
+            while waiting_on or running:
+                # Scan again after a skip: it may settle dependents listed before the skipped test
+                skipped = True
+                while skipped:
+                    skipped = False
+                    for test_case in tests:
+                        deps = waiting_on.get(test_case.name)
+                        if deps is None or any(d not in results for d in deps):
+                            continue
+                        blocked = [d for d in deps if results[d].status != TestStatus.PASS]
+                        if blocked:
+                            del waiting_on[test_case.name]
+                            results[test_case.name] = self._skipped_result(
+                                test_case, f"Skipped: dependency did not pass ({', '.join(blocked)})")
+                            self._log_result(results[test_case.name])
+                            skipped = True
+                            continue
+                        category = test_case.category
+                        limit = CATEGORY_MAX_WORKERS.get(category, DEFAULT_CATEGORY_WORKERS)
+                        if len(running) >= SUITE_MAX_WORKERS or category_running.get(category, 0) >= limit:
+                            continue
+                        if running and (category in EXCLUSIVE_CATEGORIES
+                                        or any(t.category in EXCLUSIVE_CATEGORIES for t in running.values())):
+                            continue
+                        del waiting_on[test_case.name]
+                        running[pool.submit(self.run_single_test, test_case)] = test_case
+                        category_running[category] = category_running.get(category, 0) + 1
+                
+                if not running:
+                    # Nothing runs and nothing can start: the rest wait on each other
+                    for name in list(waiting_on):
+                        results[name] = self._skipped_result(by_name[name], "Skipped: dependency cycle")
+                        self._log_result(results[name])
+                    waiting_on.clear()
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    test_case = running.pop(future)
+                    category_running[test_case.category] -= 1
+                    results[test_case.name] = future.result()
+                    self._log_result(results[test_case.name])
+        
+        return results
+    
+    def _skipped_result(self, test_case: TestCase, reason: str) -> TestResult:
+        return TestResult(
+            test_name=test_case.name,
+            status=TestStatus.SKIP,
+            execution_time=0.0,
+            output="",
+            error=reason,
+            timestamp=datetime.now().isoformat()
+        )
+    
+    def _log_result(self, result: TestResult):
+        """Log one finished test"""
+        status_icon = "✅" if result.status == TestStatus.PASS else "❌" if result.status == TestStatus.FAIL else "⚠️"
+        self.logger.info(f"{status_icon} {result.test_name}: {result.status.value} ({result.execution_time:.2f}s)")
+        
+        if result.error:
+            if result.status == TestStatus.SKIP:
+                self.logger.warning(f"   {result.error}")
+            else:
+                self.logger.error(f"   Error: {result.error}")
+    
     def _calculate_summary(self, execution_time: float):
         """Calculate test summary statistics"""
         
         self.test_summary = {
             'total_tests': len(self.test_results),
-            'passed': len([r for r in self.test_results if r.status == TestResult.PASS]),
-            'failed': len([r for r in self.test_results if r.status == TestResult.FAIL]),
-            'warnings': len([r for r in self.test_results if r.status == TestResult.WARN]),
-            'skipped': len([r for r in self.test_results if r.status == TestResult.SKIP]),
-            'execution_time': execution_time
+            'passed': len([r for r in self.test_results if r.status == TestStatus.PASS]),
+            'failed': len([r for r in self.test_results if r.status == TestStatus.FAIL]),
+            'warnings': len([r for r in self.test_results if r.status == TestStatus.WARN]),
+            'skipped': len([r for r in self.test_results if r.status == TestStatus.SKIP]),
+            'execution_time': execution_time,
+            # Sum of per-test times; compare with execution_time to see what concurrency saved
+            'cumulative_test_time': sum(r.execution_time for r in self.test_results)
         }
     
     def _generate_report(self) -> Dict[str, Any]:
@@ -439,14 +645,14 @@ class RFEVerificationSystem:
             category_results = [r for r in self.test_results if r.test_name in [t.name for t in tests]]
             category_stats[category] = {
                 'total': len(category_results),
-                'passed': len([r for r in category_results if r.status == TestResult.PASS]),
-                'failed': len([r for r in category_results if r.status == TestResult.FAIL]),
-                'success_rate': len([r for r in category_results if r.status == TestResult.PASS]) / len(category_results) * 100 if category_results else 0
+                'passed': len([r for r in category_results if r.status == TestStatus.PASS]),
+                'failed': len([r for r in category_results if r.status == TestStatus.FAIL]),
+                'success_rate': len([r for r in category_results if r.status == TestStatus.PASS]) / len(category_results) * 100 if category_results else 0
             }
         
         # Determine overall health
         critical_tests = [r for r in self.test_results if any(t.severity == TestSeverity.CRITICAL and t.name == r.test_name for t in self.test_cases)]
-        critical_failures = [r for r in critical_tests if r.status == TestResult.FAIL]
+        critical_failures = [r for r in critical_tests if r.status == TestStatus.FAIL]
         
         if critical_failures:
             overall_health = "CRITICAL_FAILURE"
@@ -455,12 +661,21 @@ class RFEVerificationSystem:
         else:
             overall_health = "HEALTHY"
         
+        # Latency of each passing test against its earlier runs
+        latency = {
+            r.test_name: self.latency_history.stats(r.test_name, r.latency)
+            for r in self.test_results if r.status == TestStatus.PASS
+        }
+        self.latency_regressions = [name for name, stats in latency.items() if stats['regression']]
+        
         report = {
             'timestamp': datetime.now().isoformat(),
             'overall_health': overall_health,
             'summary': self.test_summary,
             'category_stats': category_stats,
-            'test_results': [asdict(r) for r in self.test_results],
+            'test_results': [dict(asdict(r), status=r.status.value) for r in self.test_results],
+            'latency': latency,
+            'latency_regressions': self.latency_regressions,
             'recommendations': self._generate_recommendations()
         }
         
@@ -472,7 +687,7 @@ class RFEVerificationSystem:
         recommendations = []
         
         # Check for critical failures
-        critical_failures = [r for r in self.test_results if r.status == TestResult.FAIL and any(t.severity == TestSeverity.CRITICAL and t.name == r.test_name for t in self.test_cases)]
+        critical_failures = [r for r in self.test_results if r.status == TestStatus.FAIL and any(t.severity == TestSeverity.CRITICAL and t.name == r.test_name for t in self.test_cases)]
         
         if critical_failures:
             recommendations.append("🚨 CRITICAL: Fix critical test failures before using the tool")
@@ -480,17 +695,17 @@ class RFEVerificationSystem:
                 recommendations.append(f"   - {failure.test_name}: {failure.error}")
         
         # Check for connectivity issues
-        connectivity_failures = [r for r in self.test_results if r.status == TestResult.FAIL and "connectivity" in r.test_name]
+        connectivity_failures = [r for r in self.test_results if r.status == TestStatus.FAIL and "connectivity" in r.test_name]
         if connectivity_failures:
             recommendations.append("🌐 NETWORK: Check Red Hat VPN connection and network access")
         
         # Check for authentication issues
-        auth_failures = [r for r in self.test_results if r.status == TestResult.FAIL and "authentication" in r.test_name]
+        auth_failures = [r for r in self.test_results if r.status == TestStatus.FAIL and "authentication" in r.test_name]
         if auth_failures:
             recommendations.append("🔐 AUTH: Verify Red Hat SSO credentials and rhcase configuration")
         
         # Check for dependency issues
-        dep_failures = [r for r in self.test_results if r.status == TestResult.FAIL and "dependencies" in r.test_name]
+        dep_failures = [r for r in self.test_results if r.status == TestStatus.FAIL and "dependencies" in r.test_name]
         if dep_failures:
             recommendations.append("📦 DEPS: Install missing Python dependencies")
         
@@ -499,6 +714,10 @@ class RFEVerificationSystem:
         if slow_tests:
             recommendations.append("⚡ PERFORMANCE: Some tests are running slowly - check system resources")
         
+        # Latency regressions against earlier runs
+        if self.latency_regressions:
+            recommendations.append(f"🐢 LATENCY: Slower than usual (above {REGRESSION_FACTOR}x p95 of earlier runs): {', '.join(self.latency_regressions)}")
+        
         # Success recommendations
         if not critical_failures and not connectivity_failures and not auth_failures:
             recommendations.append("✅ SUCCESS: All critical tests passed - tool is ready for use")
@@ -85,6 +85,17 @@ For more help on a command:
         action='store_true',
         help='Skip confirmation prompts'
     )
+    update_parser.add_argument(
+        '--all',
+        action='store_true',
+        dest='all_customers',
+        help='Update the report of every account in Report Manager (parallel, no prompts)'
+    )
+    update_parser.add_argument(
+        '--customers',
+        metavar='A,B,C',
+        help='Comma-separated customers to update together (parallel, no prompts)'
+    )
     
     # ========================================
     # POST command
@@ -193,7 +204,9 @@ For more help on a command:
             update_main(
                 customer=args.customer,
                 test_data=args.test_data,
-                auto_confirm=args.auto_confirm
+                auto_confirm=args.auto_confirm,
+                all_customers=args.all_customers,
+                customers=[c.strip() for c in (args.customers or '').split(',') if c.strip()] or None
             )
         
         elif args.command == 'post':
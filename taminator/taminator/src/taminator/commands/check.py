@@ -10,15 +10,16 @@ Usage:
     tam-rfe check --test-data
 """
 
-import json
 import os
 import re
 import sys
-from typing import Dict, List, Tuple, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Tuple, Optional
 from pathlib import Path
 
 import requests
-from rich.console import Console
+from requests.adapters import HTTPAdapter
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -26,14 +27,28 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from ..core.hybrid_auth import hybrid_auth
 from ..core.auth_box import auth_required, AuthType
 from ..core.auth_types import AUTH_REQUIREMENTS
-from ..core.hydra_search import JIRA_ID_REGEX_GROUP
+from ..core.accounts_store import get_accounts_store
 from ..core import jira_config
-
-console = Console()
+from ..core.jira_cache import JiraIssueCache, cache_disabled as jira_cache_disabled
+from ..core.console import console, get_console
+from ..core.progress import report_progress
+from ..core.report_model import ReportRow, load_report, parse_report
 
 
 class JIRAClient:
-    """Simple JIRA API client for fetching issue statuses. Supports Red Hat JIRA (Bearer) and JIRA Cloud (Basic auth)."""
+    """Simple JIRA API client for fetching issue statuses. Supports Red Hat JIRA (Bearer) and JIRA Cloud (Basic auth).
+
+    All requests share one pooled requests.Session. get_multiple_statuses() fetches in bulk via
+    JQL search (key in (...)) and falls back to concurrent per-issue GETs for anything search
+    did not return (moved issues, permission edge cases, JIRA Cloud where v2 search is retired).
+    """
+
+    # Fields requested for every issue: issuelinks for clones/backports, issuetype for RFE vs Bug
+    ISSUE_FIELDS = "status,summary,assignee,updated,issuelinks,issuetype"
+    # Keys per JQL search request (keeps the query string well under URL length limits)
+    SEARCH_BATCH_SIZE = 50
+    # Concurrent per-issue GETs when falling back from search
+    MAX_WORKERS = 8
 
     def __init__(self, token: str = None, api_base_url: str = None, auth_header: str = None):
         if api_base_url is None:
@@ -46,6 +61,11 @@ class JIRAClient:
             self.headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
             self.base_url = api_base_url.rstrip("/")
         self.token = token
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     @staticmethod
     def _parse_clone_backport_links(issuelinks: List) -> List[str]:
@@ -82,12 +102,9 @@ class JIRAClient:
             Dictionary with issue details (status, summary, assignee, updated, clones).
         """
         try:
-            # Request issuelinks so we can show clones/backports; issuetype for RFE vs Bug classification
-            fields = "status,summary,assignee,updated,issuelinks,issuetype"
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/issue/{issue_key}',
-                params={"fields": fields},
-                headers=self.headers,
+                params={"fields": self.ISSUE_FIELDS},
                 timeout=10
             )
             # Debug: log what the JIRA API returned (set TAMINATOR_DEBUG_JIRA=1)
@@ -102,22 +119,7 @@ class JIRAClient:
                 print(msg, file=sys.stderr)
             if response.status_code == 200:
                 data = response.json()
-                fields_data = data.get("fields") or {}
-                assignee_obj = fields_data.get('assignee')
-                assignee_name = assignee_obj.get('displayName', 'Unassigned') if assignee_obj else 'Unassigned'
-                issuelinks = fields_data.get("issuelinks") or []
-                clones = self._parse_clone_backport_links(issuelinks)
-                
-                itype = fields_data.get("issuetype") or {}
-                return {
-                    'key': issue_key,
-                    'status': (fields_data.get('status') or {}).get('name', 'Unknown'),
-                    'summary': fields_data.get('summary', ''),
-                    'issue_type': (itype.get('name') or '').strip(),
-                    'assignee': assignee_name,
-                    'updated': fields_data.get('updated', ''),
-                    'clones': clones
-                }
+                return self._issue_info_from_fields(issue_key, data.get("fields") or {})
             elif response.status_code == 404:
                 return {
                     'key': issue_key,
@@ -137,30 +139,155 @@ class JIRAClient:
                 'error': str(e)
             }
     
-    def get_multiple_statuses(self, issue_keys: List[str]) -> Dict[str, Dict]:
+    def _issue_info_from_fields(self, issue_key: str, fields_data: Dict) -> Dict:
+        """Build the status dict returned by get_issue_status from a JIRA issue 'fields' payload."""
+        assignee_obj = fields_data.get('assignee')
+        assignee_name = assignee_obj.get('displayName', 'Unassigned') if assignee_obj else 'Unassigned'
+        issuelinks = fields_data.get("issuelinks") or []
+        clones = self._parse_clone_backport_links(issuelinks)
+        itype = fields_data.get("issuetype") or {}
+        return {
+            'key': issue_key,
+            'status': (fields_data.get('status') or {}).get('name', 'Unknown'),
+            'summary': fields_data.get('summary', ''),
+            'issue_type': (itype.get('name') or '').strip(),
+            'assignee': assignee_name,
+            'updated': fields_data.get('updated', ''),
+            'clones': clones
+        }
+
+    def search_issues(self, issue_keys: List[str], updated_within_minutes: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Fetch one batch of issues with a single JQL search (key in (...)).
+
+        Args:
+            issue_keys: JIRA issue keys (at most SEARCH_BATCH_SIZE)
+            updated_within_minutes: If set, only return issues updated in the last N minutes
+                (relative JQL, so the JIRA profile timezone does not matter)
+
+        Returns:
+            Dictionary mapping issue key to status info for every issue the search returned.
+            Keys missing from the result (not found, moved, no permission) are simply absent.
+
+        Raises:
+            requests.RequestException: On network errors or a non-200 response.
+        """
+        jql = "key in (" + ",".join(issue_keys) + ")"
+        if updated_within_minutes is not None:
+            jql += f" AND updated >= -{int(updated_within_minutes)}m"
+        response = self.session.get(
+            f'{self.base_url}/search',
+            params={
+                "jql": jql,
+                "fields": self.ISSUE_FIELDS,
+                "maxResults": len(issue_keys),
+                # Unknown keys become warnings instead of failing the whole batch
+                "validateQuery": "false",
+            },
+            timeout=30
+        )
+        if os.environ.get("TAMINATOR_DEBUG_JIRA"):
+            print(f"[jira] search {len(issue_keys)} key(s): HTTP {response.status_code}", file=sys.stderr)
+        response.raise_for_status()
+        wanted = set(issue_keys)
+        results = {}
+        for issue in response.json().get("issues") or []:
+            key = issue.get("key")
+            if key in wanted:
+                results[key] = self._issue_info_from_fields(key, issue.get("fields") or {})
+        return results
+
+    def get_multiple_statuses(self, issue_keys: List[str], show_progress: bool = True, use_cache: bool = True) -> Dict[str, Dict]:
         """
         Fetch statuses for multiple issues.
-        
+
+        Uses batched JQL search first, then concurrent per-issue GETs for keys the search did not
+        return. On JIRA Cloud (where v2 search is retired) every key goes through per-issue GETs.
+        Issues in the local cache (see core.jira_cache) are only re-downloaded if their 'updated'
+        moved since they were cached.
+
         Args:
             issue_keys: List of JIRA issue keys
-        
+            show_progress: Show a progress spinner on the console (disable for the web server)
+            use_cache: Revalidate against the local issue cache instead of re-downloading everything
+
         Returns:
-            Dictionary mapping issue key to status info
+            Dictionary mapping issue key to status info (same shape as get_issue_status), in input order
         """
-        results = {}
-        
+        keys = list(dict.fromkeys(k for k in issue_keys if k))
+        fetched: Dict[str, Dict] = {}
+        from_cache = set()  # keys served from the cache after JIRA confirmed them unchanged
+        can_search = not jira_config.is_jira_cloud(self.base_url)
+        cache = JiraIssueCache(self.base_url) if use_cache and can_search and not jira_cache_disabled() else None
+        sync_started = time.time()
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=get_console(),
+            disable=not show_progress,
         ) as progress:
-            task = progress.add_task(f"Fetching JIRA statuses for {len(issue_keys)} issues...", total=len(issue_keys))
-            
-            for issue_key in issue_keys:
-                results[issue_key] = self.get_issue_status(issue_key)
-                progress.advance(task)
-        
-        return results
+            task = progress.add_task(f"Fetching JIRA statuses for {len(keys)} issues...", total=len(keys))
+            done = 0
+
+            def advance(n: int = 1) -> None:
+                nonlocal done
+                done += n
+                progress.advance(task, n)
+                report_progress("jira", done, len(keys))
+
+            if cache:
+                # Ask JIRA only for cached issues whose 'updated' moved since we last confirmed them
+                cached_keys = [k for k in keys if cache.get(k)]
+                for i in range(0, len(cached_keys), self.SEARCH_BATCH_SIZE):
+                    batch = cached_keys[i:i + self.SEARCH_BATCH_SIZE]
+                    window = cache.revalidation_window_minutes(batch, sync_started)
+                    if window is None:
+                        continue
+                    try:
+                        changed = self.search_issues(batch, updated_within_minutes=window)
+                    except Exception as e:
+                        if os.environ.get("TAMINATOR_DEBUG_JIRA"):
+                            print(f"[jira] cache revalidation failed, re-fetching batch: {e}", file=sys.stderr)
+                        continue
+                    for key in batch:
+                        fetched[key] = changed[key] if key in changed else cache.get(key)
+                    from_cache.update(k for k in batch if k not in changed)
+                    cache.touch([k for k in batch if k not in changed], sync_started)
+                    advance(len(batch))
+
+            if can_search:
+                to_search = [k for k in keys if k not in fetched]
+                for i in range(0, len(to_search), self.SEARCH_BATCH_SIZE):
+                    batch = to_search[i:i + self.SEARCH_BATCH_SIZE]
+                    try:
+                        found = self.search_issues(batch)
+                    except Exception as e:
+                        if os.environ.get("TAMINATOR_DEBUG_JIRA"):
+                            print(f"[jira] search failed, falling back to per-issue fetch: {e}", file=sys.stderr)
+                        continue
+                    fetched.update(found)
+                    advance(len(found))
+
+            remaining = [k for k in keys if k not in fetched]
+            if remaining:
+                with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(remaining))) as pool:
+                    futures = {pool.submit(self.get_issue_status, k): k for k in remaining}
+                    for future in as_completed(futures):
+                        fetched[futures[future]] = future.result()
+                        advance()
+
+        if cache:
+            for key in keys:
+                info = fetched.get(key)
+                if info is not None and key not in from_cache:
+                    cache.put(key, info, sync_started)
+            try:
+                cache.save()
+            except OSError:
+                pass
+
+        return {k: fetched[k] for k in keys}
 
 
 def _normalize_slug(s: str) -> str:
@@ -209,6 +336,32 @@ class CustomerReportParser:
 
         return None
     
+    @staticmethod
+    def iter_jira_rows(content: str) -> Iterator[ReportRow]:
+        """
+        Lazily yield every JIRA row (duplicates included) of report content in document order.
+
+        Recognizes markdown table rows holding a known JIRA key, plain or as a [KEY](url) link,
+        with the key and status columns taken from the table header (Status/Notes, JIRA Status;
+        the last cell when the header names none), and tab/space separated lines (KEY, case
+        number, ..., status word). See ReportDocument.iter_jira_rows.
+
+        Args:
+            content: Report markdown
+
+        Yields:
+            ReportRow(jira_id, status, row_span, status_index) in document order
+        """
+        return parse_report(content).iter_jira_rows()
+
+    @staticmethod
+    def parse_jira_rows(report_path: Path) -> Tuple[ReportRow, ...]:
+        """
+        All JIRA rows of a report file (see iter_jira_rows). The parsed report is cached per path
+        until the file's mtime or size changes, so check/update/web calls on one report parse it once.
+        """
+        return tuple(load_report(report_path).iter_jira_rows())
+
     @staticmethod
     def extract_jira_issues(report_path: Path) -> List[Tuple[str, str]]:
         """
@@ -218,44 +371,9 @@ class CustomerReportParser:
             report_path: Path to markdown report
         
         Returns:
-            List of tuples: (jira_id, reported_status)
+            List of tuples: (jira_id, reported_status), first occurrence of each key, in document order
         """
-        issues = []
-        
-        with open(report_path, 'r') as f:
-            content = f.read()
-        
-        # Match JIRA IDs in markdown tables (plain or link). Prefixes from Centralized Jira Project Mapping.
-        jira_id_re = r"(" + JIRA_ID_REGEX_GROUP + ")"
-        patterns = [
-            # 4 columns: JIRA ID as link [ID](url)
-            r'\|\s*\[\s*' + jira_id_re + r'\s*\]\s*\([^\)]*\)\s*\|[^|]*\|[^|]*\|\s*([^\|]+?)\s*\|',
-            # 4 columns: JIRA ID plain
-            r'\|\s*' + jira_id_re + r'\s*\|[^|]*\|[^|]*\|\s*([^\|]+?)\s*\|',
-            # 5 columns (legacy): JIRA ID as link
-            r'\|\s*\[\s*' + jira_id_re + r'\s*\]\s*\([^\)]*\)\s*\|[^|]*\|[^|]*\|[^|]*\|\s*([^\|]+?)\s*\|',
-            # 5 columns (legacy): JIRA ID plain
-            r'\|\s*' + jira_id_re + r'\s*\|[^|]*\|[^|]*\|[^|]*\|\s*([^\|]+?)\s*\|',
-            # Tab-separated format
-            jira_id_re + r'\s+\d+\s+.*?\s+(\w+)\s*$',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.MULTILINE)
-            for match in matches:
-                jira_id = match.group(1).strip()
-                status = match.group(2).strip()
-                issues.append((jira_id, status))
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_issues = []
-        for issue in issues:
-            if issue[0] not in seen:
-                seen.add(issue[0])
-                unique_issues.append(issue)
-        
-        return unique_issues
+        return load_report(report_path).jira_issues()
 
 
 def _resolve_customer_arg(arg: str) -> str:
@@ -265,33 +383,25 @@ def _resolve_customer_arg(arg: str) -> str:
     arg = arg.strip()
     if not re.match(r"^\d+$", arg):
         return arg
-    config_dir = Path.home() / ".config" / "taminator"
-    accounts_file = config_dir / "accounts.json"
-    if not accounts_file.exists():
-        return arg
-    try:
-        with open(accounts_file) as f:
-            data = json.load(f)
-        for a in data.get("accounts", []):
-            nums = a.get("account_numbers") or []
-            if not nums and a.get("account_number"):
-                nums = [str(a.get("account_number"))]
-            if arg in [str(n).strip() for n in nums]:
-                slug = (a.get("id") or a.get("customer_name") or "").strip()
-                if slug:
-                    return slug
-    except Exception:
-        pass
+    for a in get_accounts_store().snapshot().with_account_number(arg):
+        slug = (a.get("id") or a.get("customer_name") or "").strip()
+        if slug:
+            return slug
     return arg
 
 
 @auth_required([AuthType.VPN, AuthType.JIRA_TOKEN])
-def check_customer_report(customer_name: str):
+def check_customer_report(customer_name: str) -> Dict:
     """
     Check if customer RFE report is up-to-date.
     
     Args:
         customer_name: Customer name (report slug) or account number if in Report Manager
+
+    Returns:
+        Structured result for callers that run the command in-process (web server):
+        customer, report_path, issues (compare_statuses rows), summary counts, and
+        error when the check could not run.
     """
     customer_name = (customer_name or "").strip()
     resolved = _resolve_customer_arg(customer_name)
@@ -315,7 +425,7 @@ def check_customer_report(customer_name: str):
         console.print(f"  • ~/taminator-test-data/{customer_name}.md")
         console.print(f"  • ~/Documents/rh/customers/{customer_name}.md")
         console.print(f"\nTip: Use the customer name (report filename) or an account number from Report Manager. Use --test-data to test with sample data.", style="cyan")
-        return
+        return {"customer": customer_name, "error": "Report not found"}
     
     console.print(f"✅ Found report: {report_path}", style="green")
     console.print()
@@ -327,7 +437,7 @@ def check_customer_report(customer_name: str):
     if not issues:
         console.print("\n⚠️  No case data in this report yet — nothing has been pulled.", style="yellow")
         console.print("   Run [bold]tam-rfe update[/bold] (or click [bold]Update report[/bold] in the UI) to pull case data from Hydra/rhcase and fill the report. Then run Check again to compare statuses.", style="dim")
-        return
+        return {"customer": customer_name, "report_path": str(report_path), "issues": [], "summary": summarize_comparison([])}
     
     console.print(f"✅ Found {len(issues)} JIRA issues in report", style="green")
     console.print()
@@ -339,7 +449,7 @@ def check_customer_report(customer_name: str):
             "\n❌ JIRA auth not configured. Set JIRA token (Red Hat) or, for JIRA Cloud, JIRA_EMAIL + JIRA_API_TOKEN (or configure in Settings).",
             style="red bold",
         )
-        return
+        return {"customer": customer_name, "report_path": str(report_path), "error": "JIRA auth not configured"}
     api_url = jira_config.get_jira_api_url()
     jira_client = JIRAClient(api_base_url=api_url, auth_header=auth_header)
     
@@ -349,14 +459,73 @@ def check_customer_report(customer_name: str):
     console.print()
     
     # Compare and display results
-    display_comparison_table(issues, current_statuses)
+    rows = compare_statuses(issues, current_statuses)
+    display_comparison_table(rows)
     
     # Summary
-    display_summary(issues, current_statuses)
+    summary_counts = summarize_comparison(rows)
+    display_summary(summary_counts)
+
+    return {"customer": customer_name, "report_path": str(report_path), "issues": rows, "summary": summary_counts}
+
 
+def compare_statuses(report_issues: List[Tuple[str, str]], current_statuses: Dict[str, Dict]) -> List[Dict]:
+    """
+    Compare report statuses with current JIRA statuses.
 
-def display_comparison_table(report_issues: List[Tuple[str, str]], current_statuses: Dict[str, Dict]):
-    """Display beautiful comparison table."""
+    Returns:
+        One dict per report issue: jira_id, report_status, current_status, state
+        ('up_to_date', 'changed', 'error' or 'not_found'), notes and clones.
+    """
+    rows = []
+    for jira_id, reported_status in report_issues:
+        current_info = current_statuses.get(jira_id, {})
+        current_status = current_info.get('status', 'UNKNOWN')
+
+        if current_status == 'ERROR':
+            state, notes = 'error', current_info.get('error', 'API error')
+        elif current_status == 'NOT_FOUND':
+            state, notes = 'not_found', "Issue not found"
+        elif reported_status.strip().lower() == current_status.strip().lower():
+            state, notes = 'up_to_date', "Up-to-date"
+        else:
+            state, notes = 'changed', "Status changed"
+        # Append clone/backport links if present
+        clones = current_info.get('clones') or []
+        if clones:
+            notes = (notes + " | Clones: " + ", ".join(clones)) if notes else ("Clones: " + ", ".join(clones))
+
+        rows.append({
+            'jira_id': jira_id,
+            'report_status': reported_status,
+            'current_status': current_status,
+            'state': state,
+            'notes': notes,
+            'clones': clones,
+        })
+    return rows
+
+
+def summarize_comparison(rows: List[Dict]) -> Dict[str, int]:
+    """Count compare_statuses() rows into total / up_to_date / changed / errors."""
+    return {
+        'total': len(rows),
+        'up_to_date': sum(1 for r in rows if r['state'] == 'up_to_date'),
+        'changed': sum(1 for r in rows if r['state'] == 'changed'),
+        'errors': sum(1 for r in rows if r['state'] in ('error', 'not_found')),
+    }
+
+
+_MATCH_ICONS = {
+    'error': ("⚠️", "yellow"),
+    'not_found': ("❌", "red"),
+    'up_to_date': ("✅", "green"),
+    'changed': ("🔄", "yellow"),
+}
+
+
+def display_comparison_table(rows: List[Dict]):
+    """Display beautiful comparison table for compare_statuses() rows."""
     
     table = Table(
         title="📊 RFE/Bug Status Comparison",
@@ -371,65 +540,27 @@ def display_comparison_table(report_issues: List[Tuple[str, str]], current_statu
     table.add_column("Match", style="white", width=10, justify="center")
     table.add_column("Notes", style="white", width=25)
     
-    for jira_id, reported_status in report_issues:
-        current_info = current_statuses.get(jira_id, {})
-        current_status = current_info.get('status', 'UNKNOWN')
-        
-        # Normalize statuses for comparison
-        reported_normalized = reported_status.strip().lower()
-        current_normalized = current_status.strip().lower()
-        
-        if current_status == 'ERROR':
-            match_icon = "⚠️"
-            match_style = "yellow"
-            notes = current_info.get('error', 'API error')
-        elif current_status == 'NOT_FOUND':
-            match_icon = "❌"
-            match_style = "red"
-            notes = "Issue not found"
-        elif reported_normalized == current_normalized:
-            match_icon = "✅"
-            match_style = "green"
-            notes = "Up-to-date"
-        else:
-            match_icon = "🔄"
-            match_style = "yellow"
-            notes = "Status changed"
-        # Append clone/backport links if present
-        clones = current_info.get('clones') or []
-        if clones:
-            notes = (notes + " | Clones: " + ", ".join(clones)) if notes else ("Clones: " + ", ".join(clones))
-        
+    for row in rows:
+        match_icon, match_style = _MATCH_ICONS[row['state']]
         table.add_row(
-            jira_id,
-            reported_status,
-            current_status,
+            row['jira_id'],
+            row['report_status'],
+            row['current_status'],
             f"[{match_style}]{match_icon}[/{match_style}]",
-            notes
+            row['notes']
         )
     
     console.print(table)
     console.print()
 
 
-def display_summary(report_issues: List[Tuple[str, str]], current_statuses: Dict[str, Dict]):
+def display_summary(summary_counts: Dict[str, int]):
     """Display summary of check results."""
     
-    total = len(report_issues)
-    up_to_date = 0
-    changed = 0
-    errors = 0
-    
-    for jira_id, reported_status in report_issues:
-        current_info = current_statuses.get(jira_id, {})
-        current_status = current_info.get('status', 'UNKNOWN')
-        
-        if current_status in ['ERROR', 'NOT_FOUND']:
-            errors += 1
-        elif reported_status.strip().lower() == current_status.strip().lower():
-            up_to_date += 1
-        else:
-            changed += 1
+    total = summary_counts['total']
+    up_to_date = summary_counts['up_to_date']
+    changed = summary_counts['changed']
+    errors = summary_counts['errors']
     
     # Build summary text
     summary = f"""
@@ -499,8 +630,8 @@ Summary: 5 total cases (3 RFE, 2 Bug)
 
 
 # CLI entry point
-def main(customer: str = None, test_data: bool = False):
-    """Main entry point for tam-rfe check command."""
+def main(customer: str = None, test_data: bool = False) -> Optional[Dict]:
+    """Main entry point for tam-rfe check command. Returns check_customer_report()'s result."""
     
     if test_data:
         console.print("\n🧪 Creating test data...\n", style="cyan bold")
@@ -516,9 +647,9 @@ def main(customer: str = None, test_data: bool = False):
         console.print("  tam-rfe check acmecorp")
         console.print("  tam-rfe check testcustomer")
         console.print("  tam-rfe check --test-data  # Use sample data")
-        return
+        return None
     
-    check_customer_report(customer)
+    return check_customer_report(customer)
 
 
 if __name__ == '__main__':
@@ -19,16 +19,19 @@ from typing import Dict, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..core.hybrid_auth import hybrid_auth
 from ..core.auth_box import auth_box, KEYRING_AVAILABLE
 from ..core.auth_types import AuthType, TOKEN_REGISTRY, get_token_metadata
 from ..core import jira_config
 
 console = Console()
 
+_STORAGE_LABELS = {
+    "vault": "🏦 Vault",
+    "keyring": "🔐 Keyring (secure)",
+    "env": "🌍 Environment var",
+}
+
 
 class ConfigManager:
     """Manage Taminator configuration."""
@@ -58,13 +61,15 @@ class ConfigManager:
             if token:
                 status = "✅ Configured"
                 
-                # Determine storage method
-                if auth_box._get_token_from_keyring(token_type):
-                    storage = "🔐 Keyring (secure)"
-                elif auth_box._get_token_from_env(token_type):
-                    storage = "🌍 Environment var"
-                else:
-                    storage = "📁 Config file"
+                # Storage method: the backend get_token() just resolved it from, so keyring and env
+                # are not queried a second time (falls back to probing when the token cache is off)
+                source = auth_box.get_token_source(token_type)
+                if source is None:
+                    if auth_box._get_token_from_keyring(token_type):
+                        source = "keyring"
+                    elif auth_box._get_token_from_env(token_type):
+                        source = "env"
+                storage = _STORAGE_LABELS.get(source, "📁 Config file")
             else:
                 status = "❌ Not configured"
                 storage = "—"
@@ -97,6 +102,8 @@ Security:
     @staticmethod
     def add_token_interactive():
         """Interactive token addition wizard."""
+        from rich.prompt import Prompt, Confirm
+
         console.print()
         console.print("╔════════════════════════════════════════════════════════════╗", style="cyan bold")
         console.print("║                 ADD/UPDATE API TOKEN                       ║", style="cyan bold")
@@ -13,6 +13,9 @@ from typing import Tuple
 
 from rich.console import Console
 
+from ..core.file_io import atomic_write_text
+from ..core.report_model import parse_report
+
 # Same search paths as CustomerReportParser and web server
 REPORT_SEARCH_PATHS = [
     Path.home() / "taminator-test-data",
@@ -46,20 +49,26 @@ def fix_tables_in_content(content: str) -> Tuple[str, int]:
     """
     Insert missing separator row after RFE/Bug table headers. Returns (new_content, number_of_insertions).
     """
-    insertions = 0
-    lines = content.splitlines()
-    result = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        result.append(line)
-        if _needs_separator_after(line) and i + 1 < len(lines):
-            next_line = lines[i + 1]
-            if not _is_separator_line(next_line):
-                result.append(TABLE_SEPARATOR)
-                insertions += 1
-        i += 1
-    return "\n".join(result) + ("\n" if content.endswith("\n") else ""), insertions
+    pieces = []
+    pos = 0
+    for table in parse_report(content).tables:
+        rows = table.rows
+        for i, row in enumerate(rows):
+            if not _needs_separator_after(row.raw):
+                continue
+            end = row.span[1]
+            if i + 1 < len(rows):
+                if _is_separator_line(rows[i + 1].raw):
+                    continue
+            elif not content[end:].lstrip("\r")[1:]:
+                continue  # header is the last line of the file
+            pieces.append(content[pos:end])
+            pieces.append("\n" + TABLE_SEPARATOR)
+            pos = end
+    if not pieces:
+        return content, 0
+    pieces.append(content[pos:])
+    return "".join(pieces), (len(pieces) - 1) // 2
 
 
 def fix_all_reports(dry_run: bool = False) -> None:
@@ -91,7 +100,7 @@ def fix_all_reports(dry_run: bool = False) -> None:
                 if dry_run:
                     console.print(f"  [dim]Would fix {path.name} ({insertions} separator(s) added)[/dim]")
                 else:
-                    path.write_text(new_content, encoding="utf-8")
+                    atomic_write_text(path, new_content)
                     console.print(f"  [green]Fixed {path.name} ({insertions} separator(s) added)[/green]")
     if total_files == 0:
         console.print("[yellow]No report files found in library paths.[/yellow]")
@@ -14,6 +14,8 @@ import os
 import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
@@ -21,14 +23,68 @@ from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
+from rich.table import Table
 
 from ..core.hybrid_auth import hybrid_auth
 from ..core.auth_box import auth_required, AuthType
-from ..core.hydra_search import discover_cases as hydra_discover_cases, get_bearer_token_from_env, get_basic_auth_from_env, JIRA_ID_REGEX_GROUP
+from ..core.accounts_store import get_accounts_store
+from ..core.hydra_search import sync_cases as hydra_sync_cases, get_bearer_token_from_env, get_basic_auth_from_env, jira_id_pattern, jira_id_fullmatch_pattern
 from .check import CustomerReportParser, JIRAClient, _resolve_customer_arg
 from ..core import jira_config
+from ..core.console import console
+from ..core.file_io import atomic_write_text
+from ..core.report_model import ReportDocument, load_report, parse_report
 
-console = Console()
+
+_CELL_PADDING_RE = re.compile(r'^(\s*)(.*?)(\s*)$', re.DOTALL)
+# 'Summary: N total cases (R RFE, B Bug)' within one line
+_SUMMARY_LINE_RE = re.compile(r"Summary:[ \t]*\d+[ \t]+total cases[ \t]*\(\d+[ \t]+RFE,[ \t]*\d+[ \t]+Bug\)")
+
+
+def _set_cell_text(cell: str, text: str) -> str:
+    """Replace a cell's text, keeping its surrounding padding."""
+    m = _CELL_PADDING_RE.match(cell)
+    return f"{m.group(1) or ' '}{text}{m.group(3) or ' '}"
+
+
+def _rewrite_status_cells(parts: List[str], status_index: int, status_info: Dict) -> Optional[List[str]]:
+    """
+    Apply a JIRA status to a table row split on '|'.
+
+    The status goes in cell status_index of parts[1:-1] (the row's Status/Notes cell, see
+    ReportRow.status_index). Clone/backport links go in the cell after it as
+    "Clones: ..." (added, or replaced if the row already has one). Returns the new parts, or None
+    if the row already shows this status and clones.
+    """
+    cells = parts[1:-1]
+    new_status = status_info.get('status', 'ERROR')
+    clones = status_info.get('clones') or []
+    changed = False
+    
+    if cells[status_index].strip().lower() != new_status.lower():
+        cells[status_index] = _set_cell_text(cells[status_index], new_status)
+        changed = True
+    
+    if clones:
+        clones_text = "Clones: " + ", ".join(clones)
+        clones_index = status_index + 1
+        if clones_index < len(cells) and cells[clones_index].strip().startswith("Clones:"):
+            if cells[clones_index].strip() != clones_text:
+                cells[clones_index] = _set_cell_text(cells[clones_index], clones_text)
+                changed = True
+        else:
+            cells.insert(clones_index, f" {clones_text} ")
+            changed = True
+    
+    if not changed:
+        return None
+    return [parts[0]] + cells + [parts[-1]]
+
+
+def _summary_line(doc: ReportDocument) -> str:
+    """'Summary: N total cases (R RFE, B Bug)' from the report's RFE and Bug table row counts."""
+    rfe_count, bug_count = doc.summary_counts()
+    return f"Summary: {rfe_count + bug_count} total cases ({rfe_count} RFE, {bug_count} Bug)"
 
 
 class ReportUpdater:
@@ -46,42 +102,33 @@ class ReportUpdater:
         Returns:
             Tuple of (updates_made, new_content)
         """
-        with open(report_path, 'r') as f:
-            content = f.read()
+        doc = load_report(report_path)
+        content = doc.text
         
-        original_content = content
+        # Rewrite the status cell (located from the table header) of each JIRA table row that has a
+        # usable status, splicing the new rows in by their offsets in the parsed report.
+        pieces = []
+        pos = 0
         updates_made = 0
-        
-        # Find and replace statuses in markdown tables
-        # Format: | AAPRFE-762 | ... | Status Name |
-        for jira_id, status_info in current_statuses.items():
-            new_status = status_info.get('status', 'ERROR')
-            clones = status_info.get('clones') or []
-            if clones:
-                new_status = new_status + " | Clones: " + ", ".join(clones)
-            
+        for row in doc.iter_jira_rows():
+            start, end = row.row_span
+            line = content[start:end]
+            if row.status_index < 0:
+                continue  # tab-separated export lines are read, not rewritten
+            status_info = current_statuses.get(row.jira_id)
             # Skip errors
-            if status_info.get('status') in ['ERROR', 'NOT_FOUND']:
+            if not status_info or status_info.get('status') in ['ERROR', 'NOT_FOUND']:
                 continue
-            
-            # Pattern: Match JIRA ID row; replace last column (Status/Notes). First column may be plain ID or [ID](url). Use [^|\n]* so we never match across newlines.
-            jira_col = rf'(?:\[\s*{re.escape(jira_id)}\s*\]\s*\([^\)]+\)|{re.escape(jira_id)})'
-            pattern_4 = rf'(\|\s*{jira_col}\s*\|[^|\n]*\|[^|\n]*\|\s*)([^\|\n]+?)(\s*\|)'
-            pattern_5 = rf'(\|\s*{jira_col}\s*\|[^|\n]*\|[^|\n]*\|[^|\n]*\|\s*)([^\|\n]+?)(\s*\|)'
-            
-            def replacer(match):
-                nonlocal updates_made
-                old_status = match.group(2).strip()
-                if old_status.lower() != new_status.lower():
-                    updates_made += 1
-                    return f"{match.group(1)}{new_status}{match.group(3)}"
-                return match.group(0)
-            
-            content = re.sub(pattern_4, replacer, content)
-            content = re.sub(pattern_5, replacer, content)
+            new_parts = _rewrite_status_cells(line.split("|"), row.status_index, status_info)
+            if new_parts is not None:
+                pieces.append(content[pos:start])
+                pieces.append("|".join(new_parts))
+                pos = end
+                updates_made += 1
+        pieces.append(content[pos:])
         
-        # Refresh summary line to match actual RFE/Bug row counts
-        content = _refresh_summary_line_from_content(content)
+        # Refresh summary line to match actual RFE/Bug row counts (status rewrites do not change them)
+        content = _SUMMARY_LINE_RE.sub(_summary_line(doc), "".join(pieces), count=1)
         
         # Add update timestamp at the top (replace any existing Last Updated lines so we don't stack them)
         if updates_made > 0:
@@ -158,26 +205,12 @@ def _get_account_and_sbr_groups(customer_name: str, report_content: str) -> Tupl
 
 
 def _get_account_and_sbr_groups_from_config(customer_name: str) -> Tuple[Optional[str], List[str]]:
-    """Load accounts.json and return (account_number, sbr_groups) for the matching customer."""
-    config_dir = Path.home() / ".config" / "taminator"
-    accounts_file = config_dir / "accounts.json"
-    if not accounts_file.exists():
+    """Look up the customer (by id or customer name) in accounts.json and return (account_number, sbr_groups)."""
+    a = get_accounts_store().snapshot().find_customer(customer_name)
+    if a is None:
         return (None, [])
-    try:
-        with open(accounts_file) as f:
-            data = json.load(f)
-        for a in data.get("accounts", []):
-            aid = (a.get("id") or "").strip().lower()
-            cname = (a.get("customer_name") or "").strip().lower()
-            if aid == customer_name.lower() or cname == customer_name.lower():
-                acc = a.get("account_number") or (a.get("account_numbers") or [None])[0]
-                sbr = _normalize_sbr_groups(a.get("sbr_groups"))
-                if acc:
-                    return (str(acc).strip(), sbr)
-                return (None, sbr)
-    except Exception:
-        pass
-    return (None, [])
+    sbr = _normalize_sbr_groups(a.get("sbr_groups"))
+    return (a.get("account_number") or None, sbr)
 
 
 def _parse_rhcase_list_output(stdout: str) -> List[Tuple[str, str, str, str]]:
@@ -187,7 +220,7 @@ def _parse_rhcase_list_output(stdout: str) -> List[Tuple[str, str, str, str]]:
     JIRA ID extracted from summary or a column (see Centralized Jira Project Mapping / JIRA_PROJECT_PREFIXES).
     """
     rows = []
-    jira_pat = re.compile(r"(" + JIRA_ID_REGEX_GROUP + ")")
+    jira_pat = jira_id_pattern()
     for line in stdout.splitlines():
         line = line.strip()
         if not line or line.startswith("Case") or line.startswith("---"):
@@ -240,7 +273,7 @@ def _format_jira_cell(jira_id: str) -> str:
     if not jira_id or not str(jira_id).strip():
         return "TBD"
     raw = str(jira_id).strip()
-    if re.match(r"^(" + JIRA_ID_REGEX_GROUP + r")$", raw, re.IGNORECASE):
+    if jira_id_fullmatch_pattern().match(raw):
         url = jira_config.get_jira_browse_url(raw)
         return f"[{_escape_table_cell(raw)}]({url})"
     return _escape_table_cell(raw)
@@ -321,48 +354,7 @@ def _inject_rhcase_rows_into_report(content: str, cases: List[Tuple[str, ...]])
 
 def _refresh_summary_line_from_content(content: str) -> str:
     """Count RFE and Bug table data rows in report content and replace the Summary line with accurate counts."""
-    # Table data row: starts with |, has multiple |, not a separator line (|---|---|)
-    def count_data_rows_until_next_section(rest: str) -> int:
-        count = 0
-        for line in rest.splitlines():
-            line = line.strip()
-            if not line or line.startswith("##") or line.startswith("---"):
-                break  # end of this table
-            if not line.startswith("|") or "|" not in line[1:]:
-                break
-            if re.match(r"^\|[\s\-:]+\|", line):  # separator row (|---|---|)
-                continue
-            if re.match(r"^\|\s*(\|\s*)+\|$", line):  # placeholder row (| | | | |)
-                continue
-            count += 1
-        return count
-
-    rfe_count = 0
-    bug_count = 0
-    lines = content.splitlines()
-    i = 0
-    table_index = 0  # 0 = RFE, 1 = Bug (both use "Description" header)
-    while i < len(lines):
-        line = lines[i]
-        # Tables: header is RED HAT JIRA ID | Support Case | Description | Status/Notes. First = RFE, second = Bug.
-        if "RED HAT JIRA ID" in line and "Description" in line and "|" in line:
-            rest = "\n".join(lines[i + 1 :])
-            n = count_data_rows_until_next_section(rest)
-            if table_index == 0:
-                rfe_count = n
-                table_index = 1
-            else:
-                bug_count = n
-                break
-        i += 1
-    total = rfe_count + bug_count
-    summary_line = f"Summary: {total} total cases ({rfe_count} RFE, {bug_count} Bug)"
-    return re.sub(
-        r"Summary:\s*\d+\s+total cases\s*\(\d+\s+RFE,\s*\d+\s+Bug\)",
-        summary_line,
-        content,
-        count=1,
-    )
+    return _SUMMARY_LINE_RE.sub(_summary_line(parse_report(content)), content, count=1)
 
 
 def _try_populate_from_rhcase(customer_name: str, report_path: Path, console, months_back: int = 1) -> bool:
@@ -370,6 +362,8 @@ def _try_populate_from_rhcase(customer_name: str, report_path: Path, console, mo
     Try to discover cases via Hydra SOLR API (or rhcase CLI fallback) and populate the report.
     Returns True if report was populated, False otherwise.
     months_back: How many months of modified cases to include (use 12 for full refresh).
+    Hydra results come from the local case store (core.case_store): after the first sync only cases
+    modified since the last one are fetched; the report is rewritten only when its rows change.
     """
     content = report_path.read_text(encoding="utf-8", errors="replace")
     account, sbr_groups = _get_account_and_sbr_groups(customer_name, content)
@@ -386,7 +380,7 @@ def _try_populate_from_rhcase(customer_name: str, report_path: Path, console, mo
             parts.append(f"SBR/product: {', '.join(sbr_groups)}")
         console.print(f"   [dim]Discovering cases via Hydra for {'; '.join(parts)} (last {months_back} month(s))...[/dim]")
         try:
-            cases = hydra_discover_cases(
+            cases, sync = hydra_sync_cases(
                 token=hydra_token,
                 account_numbers=[account],
                 months_back=months_back,
@@ -395,10 +389,15 @@ def _try_populate_from_rhcase(customer_name: str, report_path: Path, console, mo
                 max_rows=500,
                 basic_auth=basic_auth,
             )
+            if sync["mode"] == "delta":
+                console.print(f"   [dim]Incremental sync: {sync['fetched']} case(s) modified since last sync, {sync['changed']} changed.[/dim]")
             if cases:
-                console.print(f"   [green]Found {len(cases)} case(s); populating report.[/green]")
                 new_content = _inject_rhcase_rows_into_report(content, cases)
-                report_path.write_text(new_content, encoding="utf-8")
+                if new_content == content:
+                    console.print(f"   [green]Found {len(cases)} case(s); report already matches the portal.[/green]")
+                    return True
+                console.print(f"   [green]Found {len(cases)} case(s); populating report.[/green]")
+                atomic_write_text(report_path, new_content)
                 return True
         except Exception as e:
             err_str = str(e).strip()
@@ -443,12 +442,28 @@ def _try_populate_from_rhcase(customer_name: str, report_path: Path, console, mo
         return False
     console.print(f"   [green]Found {len(cases)} case(s); populating report.[/green]")
     new_content = _inject_rhcase_rows_into_report(content, cases)
-    report_path.write_text(new_content, encoding="utf-8")
+    atomic_write_text(report_path, new_content)
     return True
 
 
+def _pending_changes(issues: List[Tuple[str, str]], current_statuses: Dict[str, Dict]) -> List[Dict]:
+    """Return [{jira_id, old, new}] for report issues whose JIRA status differs from the report."""
+    changes = []
+    for jira_id, reported_status in issues:
+        current_info = current_statuses.get(jira_id, {})
+        current_status = current_info.get('status', 'UNKNOWN')
+        if current_status not in ['ERROR', 'NOT_FOUND']:
+            if reported_status.strip().lower() != current_status.strip().lower():
+                changes.append({
+                    'jira_id': jira_id,
+                    'old': reported_status,
+                    'new': current_status
+                })
+    return changes
+
+
 @auth_required([AuthType.VPN, AuthType.JIRA_TOKEN])
-def update_customer_report(customer_name: str, auto_confirm: bool = False, full_refresh: bool = False):
+def update_customer_report(customer_name: str, auto_confirm: bool = False, full_refresh: bool = False) -> Dict:
     """
     Update customer RFE report with current JIRA statuses.
     
@@ -456,6 +471,11 @@ def update_customer_report(customer_name: str, auto_confirm: bool = False, full_
         customer_name: Customer name (report slug) or account number (e.g. 838043). If account number, Report Manager must have that account with an id/customer_name so the report file can be found.
         auto_confirm: Skip confirmation prompts (for automation)
         full_refresh: If True, re-discover all cases from portal (Hydra/rhcase) and repopulate the report before updating JIRA statuses.
+
+    Returns:
+        Structured result for callers that run the command in-process (web server):
+        customer, report_path, changes ([{jira_id, old, new}]), updates_made, backup_path,
+        and error when the update could not run.
     """
     customer_name = (customer_name or "").strip()
     resolved = _resolve_customer_arg(customer_name)
@@ -479,7 +499,7 @@ def update_customer_report(customer_name: str, auto_confirm: bool = False, full_
         console.print(f"  • ~/taminator-test-data/{customer_name}.md")
         console.print(f"  • ~/Documents/rh/customers/{customer_name}.md")
         console.print(f"\nTip: Use the customer name (report filename), e.g. tam-rfe update wellsfargo. If you used an account number, add that account in Report Manager with a customer id and create a report for it.", style="dim")
-        return
+        return {"customer": customer_name, "error": "Report not found"}
     
     console.print(f"✅ Found report: {report_path}", style="green")
     console.print()
@@ -506,7 +526,7 @@ def update_customer_report(customer_name: str, auto_confirm: bool = False, full_
         if not issues:
             console.print("\n⚠️  No case data could be pulled into the report.", style="yellow")
             console.print("   Case discovery was tried (Hydra with Portal token or username/password, then rhcase CLI). Configure a Portal token in Settings or set REDHAT_USERNAME and REDHAT_PASSWORD. Otherwise install rhcase CLI and run Update again.", style="dim")
-            return
+            return {"customer": customer_name, "report_path": str(report_path), "error": "No case data could be pulled into the report"}
     
     console.print(f"✅ Found {len(issues)} JIRA issues in report", style="green")
     console.print()
@@ -518,32 +538,22 @@ def update_customer_report(customer_name: str, auto_confirm: bool = False, full_
             "\n❌ JIRA auth not configured. Set JIRA token (Red Hat) or, for JIRA Cloud, JIRA_EMAIL + JIRA_API_TOKEN (or configure in Settings).",
             style="red bold",
         )
-        return
+        return {"customer": customer_name, "report_path": str(report_path), "error": "JIRA auth not configured"}
     api_url = jira_config.get_jira_api_url()
     jira_client = JIRAClient(api_base_url=api_url, auth_header=auth_header)
     
     issue_keys = [issue[0] for issue in issues]
-    current_statuses = jira_client.get_multiple_statuses(issue_keys)
+    # Full refresh also bypasses the local JIRA cache so every issue is re-downloaded
+    current_statuses = jira_client.get_multiple_statuses(issue_keys, use_cache=not full_refresh)
     
     console.print()
     
     # Check what will change
-    changes = []
-    for jira_id, reported_status in issues:
-        current_info = current_statuses.get(jira_id, {})
-        current_status = current_info.get('status', 'UNKNOWN')
-        
-        if current_status not in ['ERROR', 'NOT_FOUND']:
-            if reported_status.strip().lower() != current_status.strip().lower():
-                changes.append({
-                    'jira_id': jira_id,
-                    'old': reported_status,
-                    'new': current_status
-                })
+    changes = _pending_changes(issues, current_statuses)
     
     if not changes:
         console.print("✅ Report is already up-to-date! No changes needed.\n", style="green bold")
-        return
+        return {"customer": customer_name, "report_path": str(report_path), "changes": [], "updates_made": 0}
     
     # Display proposed changes
     console.print(f"📝 Found {len(changes)} status change(s) to apply:\n", style="cyan bold")
@@ -558,7 +568,7 @@ def update_customer_report(customer_name: str, auto_confirm: bool = False, full_
     if not auto_confirm:
         if not Confirm.ask("Apply these updates to the report?", default=True):
             console.print("\n❌ Update cancelled.\n", style="yellow")
-            return
+            return {"customer": customer_name, "report_path": str(report_path), "changes": changes, "updates_made": 0, "cancelled": True}
     
     console.print()
     
@@ -573,8 +583,7 @@ def update_customer_report(customer_name: str, auto_confirm: bool = False, full_
     updates_made, new_content = ReportUpdater.update_report_file(report_path, current_statuses)
     
     # Write updated content
-    with open(report_path, 'w') as f:
-        f.write(new_content)
+    atomic_write_text(report_path, new_content)
     
     console.print(f"✅ Report updated successfully!", style="green bold")
     console.print()
@@ -603,10 +612,173 @@ def update_customer_report(customer_name: str, auto_confirm: bool = False, full_
             console.print(new_content)
             console.print("\n" + "="*70 + "\n")
 
+    return {
+        "customer": customer_name,
+        "report_path": str(report_path),
+        "changes": changes,
+        "updates_made": updates_made,
+        "backup_path": str(backup_path),
+    }
+
+
+# Reports rewritten concurrently in update --all / --customers mode
+MAX_PARALLEL_REPORTS = 4
+
+
+def _configured_customer_ids() -> List[str]:
+    """Customer ids (report slugs) of every account in ~/.config/taminator/accounts.json, in file order."""
+    accounts_file = Path.home() / ".config" / "taminator" / "accounts.json"
+    if not accounts_file.exists():
+        return []
+    try:
+        with open(accounts_file) as f:
+            data = json.load(f)
+    except Exception:
+        return []
+    ids = []
+    for a in data.get("accounts", []):
+        aid = (a.get("id") or a.get("customer_name") or "").strip()
+        if aid:
+            ids.append(aid)
+    return list(dict.fromkeys(ids))
+
+
+def _prepare_bulk_report(customer_name: str, full_refresh: bool) -> Dict:
+    """Locate and parse one customer's report for bulk update (runs on a worker thread)."""
+    started = time.monotonic()
+    result = {"customer": customer_name, "report_path": None, "issues": [], "error": None}
+    report_path = CustomerReportParser.find_report(customer_name)
+    if not report_path:
+        result["error"] = "report not found"
+    else:
+        result["report_path"] = report_path
+        quiet = Console(quiet=True)
+        issues = []
+        if not full_refresh:
+            issues = CustomerReportParser.extract_jira_issues(report_path)
+        if full_refresh or not issues:
+            if _try_populate_from_rhcase(customer_name, report_path, quiet, months_back=12):
+                issues = CustomerReportParser.extract_jira_issues(report_path)
+        result["issues"] = issues
+        if not issues:
+            result["error"] = "no JIRA issues in report"
+    result["seconds"] = time.monotonic() - started
+    return result
+
+
+def _apply_bulk_report(prepared: Dict, current_statuses: Dict[str, Dict]) -> Dict:
+    """Back up and rewrite one report from the shared status map (runs on a worker thread)."""
+    started = time.monotonic()
+    report_path = prepared["report_path"]
+    changes = _pending_changes(prepared["issues"], current_statuses)
+    updates_made = 0
+    if changes:
+        ReportUpdater.create_backup(report_path)
+        updates_made, new_content = ReportUpdater.update_report_file(report_path, current_statuses)
+        atomic_write_text(report_path, new_content)
+    return {"updates": updates_made, "seconds": time.monotonic() - started}
+
+
+@auth_required([AuthType.VPN, AuthType.JIRA_TOKEN])
+def update_multiple_reports(customers: Optional[List[str]] = None, full_refresh: bool = False):
+    """
+    Update many customer reports in one run.
+
+    Parses every report in parallel, fetches the union of their JIRA keys once, then rewrites the
+    reports in parallel. Never prompts (intended for nightly/batch refreshes); a backup is created
+    for every report that changes.
+
+    Args:
+        customers: Customer names (report slugs) or account numbers. None = every account in Report Manager.
+        full_refresh: Re-discover cases from portal (Hydra/rhcase) for each report before updating.
+    """
+    run_started = time.monotonic()
+    names = customers if customers else _configured_customer_ids()
+    names = list(dict.fromkeys(_resolve_customer_arg(c) for c in names if (c or "").strip()))
+    if not names:
+        console.print("\n❌ No customers to update. Add accounts in Report Manager or pass --customers a,b,c.", style="red bold")
+        return
+
+    console.print()
+    console.print(f"🔄 Updating {len(names)} customer report(s)...", style="cyan bold")
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REPORTS) as pool:
+        prepared = list(pool.map(lambda c: _prepare_bulk_report(c, full_refresh), names))
+
+    # Several accounts can share one report file; update each file once
+    ready = []
+    seen_paths = set()
+    for p in prepared:
+        if p["error"]:
+            continue
+        path_key = str(p["report_path"].resolve())
+        if path_key in seen_paths:
+            p["error"] = "same report as another customer"
+            continue
+        seen_paths.add(path_key)
+        ready.append(p)
+
+    all_keys = list(dict.fromkeys(jira_id for p in ready for jira_id, _ in p["issues"]))
+    current_statuses: Dict[str, Dict] = {}
+    fetch_seconds = 0.0
+    if all_keys:
+        base_url, auth_header, _ = jira_config.get_jira_auth()
+        if not auth_header:
+            console.print(
+                "\n❌ JIRA auth not configured. Set JIRA token (Red Hat) or, for JIRA Cloud, JIRA_EMAIL + JIRA_API_TOKEN (or configure in Settings).",
+                style="red bold",
+            )
+            return
+        jira_client = JIRAClient(api_base_url=jira_config.get_jira_api_url(), auth_header=auth_header)
+        console.print(f"📋 {len(all_keys)} unique JIRA issue(s) across {len(ready)} report(s)", style="cyan")
+        fetch_started = time.monotonic()
+        current_statuses = jira_client.get_multiple_statuses(all_keys, use_cache=not full_refresh)
+        fetch_seconds = time.monotonic() - fetch_started
+
+    applied: Dict[str, Dict] = {}
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REPORTS) as pool:
+        futures = {pool.submit(_apply_bulk_report, p, current_statuses): p["customer"] for p in ready}
+        for future in as_completed(futures):
+            try:
+                applied[futures[future]] = future.result()
+            except Exception as e:
+                applied[futures[future]] = {"error": str(e), "updates": 0, "seconds": 0.0}
+
+    table = Table(title="📊 Bulk Update Summary", show_header=True, header_style="bold cyan", title_style="bold cyan")
+    table.add_column("Customer", style="cyan")
+    table.add_column("Issues", justify="right")
+    table.add_column("Updates", justify="right")
+    table.add_column("Parse (s)", justify="right")
+    table.add_column("Write (s)", justify="right")
+    table.add_column("Result")
+    failed = 0
+    for p in prepared:
+        done = applied.get(p["customer"]) or {}
+        error = p["error"] or done.get("error")
+        if error:
+            failed += 1
+        table.add_row(
+            p["customer"],
+            str(len(p["issues"])),
+            str(done.get("updates", 0)),
+            f"{p['seconds']:.1f}",
+            f"{done['seconds']:.1f}" if "seconds" in done else "-",
+            f"[yellow]{error}[/yellow]" if error else "[green]ok[/green]",
+        )
+    console.print()
+    console.print(table)
+    console.print(f"  JIRA fetch (shared): {fetch_seconds:.1f}s    Total: {time.monotonic() - run_started:.1f}s    Failed/skipped: {failed}")
+    console.print()
+
 
 # CLI entry point
-def main(customer: str = None, test_data: bool = False, auto_confirm: bool = False, full_refresh: bool = False):
-    """Main entry point for tam-rfe update command."""
+def main(customer: str = None, test_data: bool = False, auto_confirm: bool = False, full_refresh: bool = False,
+         all_customers: bool = False, customers: Optional[List[str]] = None) -> Optional[Dict]:
+    """Main entry point for tam-rfe update command. Returns update_customer_report()'s result for a single customer."""
+    
+    if all_customers or customers:
+        update_multiple_reports(customers=None if all_customers else customers, full_refresh=full_refresh)
+        return None
     
     if test_data:
         # Use test customer
@@ -618,13 +790,15 @@ def main(customer: str = None, test_data: bool = False, auto_confirm: bool = Fal
         console.print("\nUsage:", style="cyan")
         console.print("  tam-rfe update <customer>")
         console.print("  tam-rfe update --test-data")
+        console.print("  tam-rfe update --all")
+        console.print("  tam-rfe update --customers a,b,c")
         console.print("\nExamples:", style="cyan")
         console.print("  tam-rfe update acmecorp")
         console.print("  tam-rfe update testcustomer")
         console.print("  tam-rfe update --test-data")
-        return
+        return None
     
-    update_customer_report(customer, auto_confirm=auto_confirm, full_refresh=full_refresh)
+    return update_customer_report(customer, auto_confirm=auto_confirm, full_refresh=full_refresh)
 
 
 if __name__ == '__main__':
@@ -635,7 +809,12 @@ if __name__ == '__main__':
     auto_confirm = '--yes' in sys.argv or '-y' in sys.argv
     full_refresh = '--full-refresh' in sys.argv
     
-    if test_data:
+    if '--all' in sys.argv:
+        main(all_customers=True, full_refresh=full_refresh)
+    elif '--customers' in sys.argv and sys.argv.index('--customers') + 1 < len(sys.argv):
+        names = sys.argv[sys.argv.index('--customers') + 1].split(',')
+        main(customers=[n.strip() for n in names if n.strip()], full_refresh=full_refresh)
+    elif test_data:
         main(test_data=True, auto_confirm=auto_confirm, full_refresh=full_refresh)
     elif len(sys.argv) > 1 and not sys.argv[1].startswith('--'):
         main(customer=sys.argv[1], auto_confirm=auto_confirm, full_refresh=full_refresh)
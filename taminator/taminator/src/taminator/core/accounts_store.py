@@ -0,0 +1,315 @@
+"""
+In-memory view of ~/.config/taminator/accounts.json (Report Manager accounts).
+
+AccountsStore re-reads the file only when its mtime/size changes. Each load normalizes the
+entries (account_numbers list + account_number), merges duplicates (accounts that share an
+account number and have the same SBR group set) and builds hash indexes by id, customer name,
+account number and SBR group set, so per-request lookups do not rescan or re-parse the file.
+
+Reading never writes the file; duplicates are merged in memory and the merged list is what the
+next save writes. Saves are atomic (temp file + os.replace) and batch() groups several edits into
+one load and one write.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from .file_io import atomic_write_json, path_lock
+
+
+def default_accounts_path() -> Path:
+    return Path.home() / ".config" / "taminator" / "accounts.json"
+
+
+def normalize_account_numbers(val) -> List[str]:
+    """Return a list of non-empty trimmed strings from account_numbers (list or comma-separated string)."""
+    if val is None:
+        return []
+    if isinstance(val, list):
+        return [str(x).strip() for x in val if str(x).strip()]
+    return [x.strip() for x in str(val).split(",") if x.strip()]
+
+
+def normalize_sbr_groups(val) -> List[str]:
+    """Return a list of non-empty trimmed strings from sbr_groups (list or comma-separated string)."""
+    return normalize_account_numbers(val)
+
+
+def sbr_groups_set(account_or_groups) -> FrozenSet[str]:
+    """Normalized SBR group set for comparison. Pass an account dict or a list of group names."""
+    if hasattr(account_or_groups, "get"):
+        groups = account_or_groups.get("sbr_groups") or []
+    else:
+        groups = account_or_groups if account_or_groups is not None else []
+    return frozenset(normalize_sbr_groups(groups))
+
+
+def normalize_account(a: dict) -> dict:
+    """Copy of an account entry with account_numbers (list) and account_number (first, for backward compat) set."""
+    a = dict(a)
+    nums = normalize_account_numbers(a.get("account_numbers") or a.get("account_number"))
+    if not nums and a.get("account_number"):
+        nums = [str(a.get("account_number")).strip()]
+    a["account_numbers"] = nums
+    a["account_number"] = nums[0] if nums else ""
+    return a
+
+
+def merge_duplicate_accounts(accounts: List[dict]) -> List[dict]:
+    """
+    Merge accounts that share an account number and have the same SBR group set (transitively).
+
+    Union-find over (SBR set, account number): each group keeps the position and fields of its
+    first entry, gains the other entries' account numbers in order, and takes customer_name /
+    sbr_groups from a later entry only where the first has none.
+    """
+    parent = list(range(len(accounts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: Dict[Tuple[FrozenSet[str], str], int] = {}
+    for i, a in enumerate(accounts):
+        sbr = sbr_groups_set(a)
+        for n in a.get("account_numbers") or []:
+            j = owner.setdefault((sbr, n), i)
+            if j != i:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    # Keep the earlier entry as the root so merged accounts stay in file order
+                    parent[max(ri, rj)] = min(ri, rj)
+
+    result: List[dict] = []
+    position: Dict[int, int] = {}
+    for i, a in enumerate(accounts):
+        root = find(i)
+        if root == i:
+            position[i] = len(result)
+            result.append(dict(a))
+            continue
+        merged = result[position[root]]
+        nums = list(dict.fromkeys((merged.get("account_numbers") or []) + (a.get("account_numbers") or [])))
+        merged["account_numbers"] = nums
+        merged["account_number"] = nums[0] if nums else merged.get("account_number")
+        if (a.get("customer_name") or "").strip() and not (merged.get("customer_name") or "").strip():
+            merged["customer_name"] = a["customer_name"]
+        if a.get("sbr_groups") and not merged.get("sbr_groups"):
+            merged["sbr_groups"] = a["sbr_groups"]
+    return result
+
+
+def _copy_account(a: dict) -> dict:
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in a.items()}
+
+
+class AccountList(list):
+    """List of account dicts from AccountsSnapshot.copy_accounts(). Remembers the snapshot it was
+    copied from so lookups can use its indexes; adding, removing or replacing entries drops that
+    link (lookups then scan the list)."""
+
+    snapshot: Optional["AccountsSnapshot"] = None
+
+    def append(self, item):
+        self.snapshot = None
+        super().append(item)
+
+    def extend(self, items):
+        self.snapshot = None
+        super().extend(items)
+
+    def insert(self, index, item):
+        self.snapshot = None
+        super().insert(index, item)
+
+    def pop(self, *args):
+        self.snapshot = None
+        return super().pop(*args)
+
+    def remove(self, item):
+        self.snapshot = None
+        super().remove(item)
+
+    def clear(self):
+        self.snapshot = None
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self.snapshot = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self.snapshot = None
+        super().reverse()
+
+    def __setitem__(self, index, value):
+        self.snapshot = None
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.snapshot = None
+        super().__delitem__(index)
+
+    def __iadd__(self, items):
+        self.snapshot = None
+        return super().__iadd__(items)
+
+
+class AccountsSnapshot:
+    """One load of accounts.json: merged account dicts (treat as read-only) plus lookup indexes."""
+
+    def __init__(self, accounts: List[dict]):
+        self.accounts: Tuple[dict, ...] = tuple(accounts)
+        self.by_id: Dict[str, List[int]] = {}  # exact (stripped) id
+        self._by_id_lower: Dict[str, int] = {}
+        self._by_name_lower: Dict[str, int] = {}
+        self.by_number: Dict[str, List[int]] = {}
+        self.by_sbr: Dict[FrozenSet[str], List[int]] = {}
+        self._by_sbr_number: Dict[Tuple[FrozenSet[str], str], int] = {}
+        for i, a in enumerate(self.accounts):
+            aid = (a.get("id") or "").strip()
+            if aid:
+                self.by_id.setdefault(aid, []).append(i)
+                self._by_id_lower.setdefault(aid.lower(), i)
+            name = (a.get("customer_name") or "").strip()
+            if name:
+                self._by_name_lower.setdefault(name.lower(), i)
+            sbr = sbr_groups_set(a)
+            self.by_sbr.setdefault(sbr, []).append(i)
+            for n in a.get("account_numbers") or []:
+                self.by_number.setdefault(n, []).append(i)
+                self._by_sbr_number.setdefault((sbr, n), i)
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def copy_accounts(self) -> AccountList:
+        """Fresh, editable copies of the accounts (the list keeps a link to this snapshot for lookups)."""
+        out = AccountList(_copy_account(a) for a in self.accounts)
+        out.snapshot = self
+        return out
+
+    def get(self, account_id: str) -> Optional[dict]:
+        """Account with this id (case-insensitive), or None."""
+        i = self._by_id_lower.get((account_id or "").strip().lower())
+        return None if i is None else self.accounts[i]
+
+    def find_customer(self, customer: str) -> Optional[dict]:
+        """First account whose id or customer_name equals customer (case-insensitive), in file order."""
+        key = (customer or "").strip().lower()
+        hits = [i for i in (self._by_id_lower.get(key), self._by_name_lower.get(key)) if i is not None]
+        return self.accounts[min(hits)] if hits else None
+
+    def with_account_number(self, number: str) -> List[dict]:
+        """Accounts listing this account number, in file order."""
+        return [self.accounts[i] for i in self.by_number.get(str(number).strip(), [])]
+
+    def find_index_by_numbers(self, account_numbers: Iterable[str], sbr_groups=None) -> Optional[int]:
+        """Index of the first account sharing any of account_numbers and having exactly this SBR group set."""
+        sbr = sbr_groups_set(sbr_groups if sbr_groups is not None else [])
+        hits = [self._by_sbr_number[(sbr, n)] for n in account_numbers if (sbr, n) in self._by_sbr_number]
+        return min(hits) if hits else None
+
+    def account_numbers_for_ids(self, account_ids: Iterable[str]) -> List[str]:
+        """Union of account numbers (first-seen order) of the given ids; all accounts when account_ids is empty."""
+        want = [x.strip() for x in (account_ids or []) if (x or "").strip()]
+        if want:
+            indexes = sorted({i for x in want for i in self.by_id.get(x, ())})
+        else:
+            indexes = range(len(self.accounts))
+        out = {}
+        for i in indexes:
+            for n in self.accounts[i].get("account_numbers") or []:
+                out.setdefault(n, None)
+        return list(out)
+
+
+class AccountsStore:
+    """accounts.json loaded into an AccountsSnapshot, reloaded when the file's mtime or size changes.
+
+    Writes go through save() (atomic replace, owner-only permissions) or batch(), both under one
+    process-wide lock per file, so concurrent web requests cannot interleave read-modify-write
+    cycles or leave a half-written file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.lock = path_lock(self.path)
+        self._version: Optional[Tuple[int, int, int]] = None
+        self._snapshot = AccountsSnapshot([])
+
+    def _stat_version(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def snapshot(self) -> AccountsSnapshot:
+        """Current accounts (empty when the file is missing or unreadable)."""
+        version = self._stat_version()
+        with self.lock:
+            if version == self._version:
+                return self._snapshot
+            snap = AccountsSnapshot([])
+            if version is not None:
+                try:
+                    with open(self.path) as f:
+                        data = json.load(f)
+                    snap = AccountsSnapshot(merge_duplicate_accounts(
+                        [normalize_account(a) for a in data.get("accounts", []) if isinstance(a, dict)]
+                    ))
+                except Exception:
+                    pass
+            self._version = version
+            self._snapshot = snap
+            return snap
+
+    def save(self, accounts: List[dict]) -> None:
+        """Write accounts (normalized; account_number kept for backward compat) and make them the current snapshot."""
+        out = [normalize_account(a) for a in accounts]
+        with self.lock:
+            atomic_write_json(self.path, {"accounts": out}, mode=0o600)
+            self._snapshot = AccountsSnapshot(merge_duplicate_accounts(out))
+            self._version = self._stat_version()
+
+    @contextmanager
+    def batch(self) -> Iterator[AccountList]:
+        """
+        Read-modify-write accounts under the file lock.
+
+        Yields an editable AccountList; on normal exit it is saved once if it changed (nothing is
+        written if the block raises). Use it to apply many edits with one load and one write.
+        """
+        with self.lock:
+            snap = self.snapshot()
+            accounts = snap.copy_accounts()
+            yield accounts
+            if list(accounts) != list(snap.accounts):
+                self.save(accounts)
+
+    def invalidate(self) -> None:
+        """Force a reload on next access (call after writing the file by other means)."""
+        with self.lock:
+            self._version = None
+
+
+_stores: Dict[str, AccountsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_accounts_store(path: Optional[Path] = None) -> AccountsStore:
+    """Shared AccountsStore for path (default ~/.config/taminator/accounts.json)."""
+    path = Path(path) if path else default_accounts_path()
+    key = os.path.abspath(str(path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = AccountsStore(path)
+        return store
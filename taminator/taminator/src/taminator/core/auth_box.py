@@ -22,20 +22,25 @@ Usage:
         pass
 """
 
+import contextvars
+import hashlib
+import json
 import os
+import socket
 import subprocess
+import threading
 import time
-from typing import List, Optional, Dict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import List, Optional, Dict, Tuple
 from functools import wraps
 from datetime import datetime, timedelta
 
-try:
-    import keyring
-    KEYRING_AVAILABLE = True
-except ImportError:
-    KEYRING_AVAILABLE = False
+import importlib.util
+
+# keyring is imported on first use (backend discovery costs tens of ms), so only check it is installed
+KEYRING_AVAILABLE = importlib.util.find_spec("keyring") is not None
 
-import requests
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -47,8 +52,8 @@ from .auth_types import (
     TOKEN_REGISTRY,
     TokenMetadata
 )
-
-console = Console()
+from .console import console
+from .file_io import atomic_write_json
 
 
 class AuthenticationError(Exception):
@@ -56,6 +61,74 @@ class AuthenticationError(Exception):
     pass
 
 
+def _token_cache_ttl() -> float:
+    """Seconds a resolved token is reused (TAMINATOR_TOKEN_CACHE_TTL, default 300; 0 disables the cache)."""
+    try:
+        return float(os.environ.get("TAMINATOR_TOKEN_CACHE_TTL") or 300)
+    except ValueError:
+        return 300.0
+
+
+# Token types get_token() resolves, and the env vars that can supply them (see _get_token_from_env)
+_CACHED_TOKEN_TYPES = (AuthType.JIRA_TOKEN, AuthType.PORTAL_TOKEN, AuthType.HYDRA_TOKEN,
+                       AuthType.GITHUB_TOKEN, AuthType.SUPPORTSHELL_TOKEN)
+
+
+def _token_env_names(token_type: AuthType) -> List[str]:
+    names = [
+        f"{token_type.value.upper()}_API_TOKEN",
+        f"{token_type.value.upper()}_TOKEN",
+        f"TAMINATOR_{token_type.value.upper()}_TOKEN"
+    ]
+    # Red Hat convention: Portal token is often set as PORTAL_TOKEN (no _API_)
+    if token_type == AuthType.PORTAL_TOKEN and "PORTAL_TOKEN" not in names:
+        names.insert(0, "PORTAL_TOKEN")
+    return names
+
+
+_TOKEN_ENV_VARS = tuple(dict.fromkeys(
+    [n for t in _CACHED_TOKEN_TYPES for n in _token_env_names(t)] + ["JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN"]
+))
+
+# Preflight VPN / Kerberos checks that passed are remembered on disk for this many seconds
+# (TAMINATOR_PREFLIGHT_CACHE_TTL, 0 disables), as long as the network interfaces look the same,
+# so back-to-back check/update runs skip nmcli, the issues.redhat.com probe and klist.
+_CACHEABLE_PREFLIGHT = (AuthType.VPN, AuthType.KERBEROS)
+
+
+def _preflight_cache_ttl() -> float:
+    try:
+        return float(os.environ.get("TAMINATOR_PREFLIGHT_CACHE_TTL") or 60)
+    except ValueError:
+        return 60.0
+
+
+def _preflight_cache_path() -> Path:
+    return Path.home() / ".config" / "taminator" / "preflight_cache.json"
+
+
+def _network_state_key() -> str:
+    """Fingerprint of the network interfaces (names and link state); changes when a VPN tunnel comes or goes."""
+    try:
+        names = sorted(name for _, name in socket.if_nameindex())
+    except (AttributeError, OSError):
+        names = []
+    state = []
+    for name in names:
+        try:
+            with open(f"/sys/class/net/{name}/operstate") as f:
+                state.append(f"{name}={f.read().strip()}")
+        except OSError:
+            state.append(name)
+    return hashlib.sha256("\n".join(state).encode()).hexdigest()[:16]
+
+
+def _run_in_context(fn, *args):
+    """Callable for a worker thread that runs fn in a copy of the caller's context (captured console)."""
+    ctx = contextvars.copy_context()
+    return lambda: ctx.run(fn, *args)
+
+
 class AuthBox:
     """
     Centralized authentication management for Taminator.
@@ -74,12 +147,21 @@ class AuthBox:
     def __init__(self):
         """Initialize Auth-Box."""
         self.console = Console()
+        # token_type -> (token or None, backend that served it or None, resolved at monotonic time)
+        self._token_cache: Dict[AuthType, Tuple[Optional[str], Optional[str], float]] = {}
+        self._token_cache_signature = None
+        self._token_cache_lock = threading.Lock()
     
     # ===== Token Management =====
     
     def get_token(self, token_type: AuthType, required: bool = True) -> Optional[str]:
         """
         Get authentication token with intelligent fallback.
+
+        Order: Vault, keyring, environment, ~/.config/taminator/ui_tokens.json (and the Portal token
+        for Hydra). The result, found or not, is cached per process so repeated checks do not hit
+        keyring (D-Bus) and Vault again; the cache is dropped when set_token() is called, when
+        ui_tokens.json or a token env var changes, and after TAMINATOR_TOKEN_CACHE_TTL seconds.
         
         Args:
             token_type: Type of token to retrieve
@@ -91,30 +173,95 @@ class AuthBox:
         Raises:
             AuthenticationError: If token required but not found
         """
+        cached = self._cached_token(token_type)
+        if cached is not None:
+            token = cached[0]
+        else:
+            token, source = self._resolve_token(token_type)
+            if os.environ.get('TAMINATOR_DEBUG'):
+                console.print(f"[dim]🔑 {token_type.value}: {('from ' + source) if source else 'not configured'}[/dim]")
+            self._store_token(token_type, token, source)
+        if not token and required:
+            self._raise_token_missing_error(token_type)
+        return token
+
+    def get_token_source(self, token_type: AuthType) -> Optional[str]:
+        """Backend that served the cached token: vault, keyring, env, config or portal (Hydra using the
+        Portal token); None when it was not found or has not been resolved yet."""
+        cached = self._cached_token(token_type)
+        return cached[1] if cached else None
+
+    def invalidate_token_cache(self, token_type: Optional[AuthType] = None) -> None:
+        """Forget cached tokens (all of them by default) so the next get_token() asks the backends again."""
+        with self._token_cache_lock:
+            if token_type is None or token_type == AuthType.PORTAL_TOKEN:
+                self._token_cache.clear()  # Hydra may be serving the Portal token
+            else:
+                self._token_cache.pop(token_type, None)
+
+    def _resolve_token(self, token_type: AuthType) -> Tuple[Optional[str], Optional[str]]:
+        """Ask each backend in order; returns (token, backend) or (None, None)."""
         # Try Vault first when VAULT_ADDR/VAULT_TOKEN are set (lazy import to avoid circular import)
         try:
-            from taminator.core.hybrid_auth import get_token_for_auth_type
-            token = get_token_for_auth_type(token_type, required=False)
+            from taminator.core.hybrid_auth import get_vault_token_for_auth_type
+            token = get_vault_token_for_auth_type(token_type)
             if token:
-                return token
+                return token, "vault"
         except Exception:
             pass
         # Try keyring (most secure local)
         token = self._get_token_from_keyring(token_type)
-        
+        if token:
+            return token, "keyring"
         # Fallback to environment variable
-        if not token:
-            token = self._get_token_from_env(token_type)
-        
+        token = self._get_token_from_env(token_type)
+        if token:
+            return token, "env"
         # Fallback to config file
-        if not token:
-            token = self._get_token_from_config(token_type)
+        token = self._get_token_from_config(token_type)
+        if token:
+            return token, "config"
         # Hydra = same credential as Portal; use Portal token if no separate Hydra token stored
-        if not token and token_type == AuthType.HYDRA_TOKEN:
+        if token_type == AuthType.HYDRA_TOKEN:
             token = self.get_token(AuthType.PORTAL_TOKEN, required=False)
-        if not token and required:
-            self._raise_token_missing_error(token_type)
-        return token
+            if token:
+                return token, "portal"
+        return None, None
+
+    def _token_signature(self) -> tuple:
+        """Cheap fingerprint of the inputs that can change without set_token(): ui_tokens.json and token env vars."""
+        config_path = Path.home() / ".config" / "taminator" / "ui_tokens.json"
+        try:
+            st = config_path.stat()
+            config_version = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            config_version = None
+        return (str(config_path), config_version, tuple(os.environ.get(n) for n in _TOKEN_ENV_VARS))
+
+    def _cached_token(self, token_type: AuthType) -> Optional[Tuple[Optional[str], Optional[str], float]]:
+        ttl = _token_cache_ttl()
+        if ttl <= 0:
+            return None
+        signature = self._token_signature()
+        with self._token_cache_lock:
+            if signature != self._token_cache_signature:
+                self._token_cache.clear()
+                self._token_cache_signature = signature
+                return None
+            entry = self._token_cache.get(token_type)
+            if entry is None or time.monotonic() - entry[2] > ttl:
+                return None
+            return entry
+
+    def _store_token(self, token_type: AuthType, token: Optional[str], source: Optional[str]) -> None:
+        if _token_cache_ttl() <= 0:
+            return
+        signature = self._token_signature()
+        with self._token_cache_lock:
+            if signature != self._token_cache_signature:
+                self._token_cache.clear()
+                self._token_cache_signature = signature
+            self._token_cache[token_type] = (token, source, time.monotonic())
     
     def set_token(self, token_type: AuthType, token: str) -> bool:
         """
@@ -129,8 +276,10 @@ class AuthBox:
         """
         if not KEYRING_AVAILABLE:
             console.print("⚠️  Keyring not available, token not saved", style="yellow")
+            self.invalidate_token_cache(token_type)  # callers may have stored it elsewhere (Vault)
             return False
         try:
+            import keyring
             keyring.set_password(
                 self.KEYRING_SERVICE,
                 token_type.value,
@@ -141,12 +290,15 @@ class AuthBox:
         except Exception as e:
             console.print(f"❌ Failed to save token: {e}", style="red")
             return False
+        finally:
+            self.invalidate_token_cache(token_type)
     
     def _get_token_from_keyring(self, token_type: AuthType) -> Optional[str]:
         """Get token from system keyring."""
         if not KEYRING_AVAILABLE:
             return None
         try:
+            import keyring
             return keyring.get_password(
                 self.KEYRING_SERVICE,
                 token_type.value
@@ -156,15 +308,7 @@ class AuthBox:
     
     def _get_token_from_env(self, token_type: AuthType) -> Optional[str]:
         """Get token from environment variables."""
-        env_names = [
-            f"{token_type.value.upper()}_API_TOKEN",
-            f"{token_type.value.upper()}_TOKEN",
-            f"TAMINATOR_{token_type.value.upper()}_TOKEN"
-        ]
-        # Red Hat convention: Portal token is often set as PORTAL_TOKEN (no _API_)
-        if token_type == AuthType.PORTAL_TOKEN and "PORTAL_TOKEN" not in env_names:
-            env_names.insert(0, "PORTAL_TOKEN")
-        for env_name in env_names:
+        for env_name in _token_env_names(token_type):
             token = os.getenv(env_name)
             if token:
                 return token
@@ -180,7 +324,6 @@ class AuthBox:
         Supports encoded storage and legacy plain JSON. For JIRA_TOKEN, also accepts JIRA Cloud
         config (jira_base_url + jira_email + jira_api_token when base is *.atlassian.net)."""
         try:
-            from pathlib import Path
             from taminator.core.token_store import load_ui_tokens
             config_path = Path.home() / ".config" / "taminator" / "ui_tokens.json"
             data = load_ui_tokens(config_path)
@@ -242,11 +385,32 @@ Need Help?
         """
         Detect if Red Hat VPN is connected.
         
-        Methods:
+        Methods (run concurrently; the first one that finds the VPN wins):
         1. Check active NetworkManager connections
         2. Test connectivity to internal service
         """
-        # Method 1: Check NetworkManager
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vpn-check")
+        pending = {pool.submit(self._vpn_via_nmcli), pool.submit(self._vpn_via_https)}
+        pool.shutdown(wait=False)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception:
+                    result = None
+                if result is not None:
+                    return result
+        
+        # VPN not connected
+        return AuthResult(
+            auth_type=AuthType.VPN,
+            status=AuthStatus.MISSING,
+            passed=False,
+            error="VPN not connected"
+        )
+
+    def _vpn_via_nmcli(self) -> Optional[AuthResult]:
         try:
             result = subprocess.run(
                 ['nmcli', 'connection', 'show', '--active'],
@@ -264,8 +428,10 @@ Need Help?
                 )
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
-        
-        # Method 2: Test connectivity to internal service
+        return None
+
+    def _vpn_via_https(self) -> Optional[AuthResult]:
+        import requests  # deferred: only the VPN probe needs it, keep CLI startup light
         try:
             response = requests.get(
                 'https://issues.redhat.com',
@@ -278,16 +444,9 @@ Need Help?
                     passed=True,
                     details="VPN connectivity verified"
                 )
-        except requests.exceptions.ConnectionError:
+        except requests.exceptions.RequestException:
             pass
-        
-        # VPN not connected
-        return AuthResult(
-            auth_type=AuthType.VPN,
-            status=AuthStatus.MISSING,
-            passed=False,
-            error="VPN not connected"
-        )
+        return None
     
     # ===== Kerberos Ticket Check =====
     
@@ -347,38 +506,20 @@ Need Help?
         
         console.print("\n🔐 Auth-Box: Pre-flight authentication check...\n")
         
+        # Independent checks run at the same time; VPN/Kerberos passes may come from the disk cache
+        cached = self._load_preflight_cache()
+        to_run = [t for t in dict.fromkeys(required_auth) if t not in cached]
+        fresh: Dict[AuthType, AuthResult] = {}
+        if len(to_run) == 1:
+            fresh[to_run[0]] = self._check_one(to_run[0])
+        elif to_run:
+            with ThreadPoolExecutor(max_workers=len(to_run), thread_name_prefix="preflight") as pool:
+                futures = {t: pool.submit(_run_in_context(self._check_one, t)) for t in to_run}
+                fresh = {t: f.result() for t, f in futures.items()}
+        self._save_preflight_cache({t: r for t, r in fresh.items() if t in _CACHEABLE_PREFLIGHT and r.passed})
+        
         for auth_type in required_auth:
-            if auth_type == AuthType.VPN:
-                result = self.check_vpn_connection()
-            elif auth_type == AuthType.KERBEROS:
-                result = self.check_kerberos_ticket()
-            elif auth_type in [AuthType.JIRA_TOKEN, AuthType.PORTAL_TOKEN, 
-                              AuthType.HYDRA_TOKEN, AuthType.SUPPORTSHELL_TOKEN]:
-                # Token check
-                token = self.get_token(auth_type, required=False)
-                if token:
-                    result = AuthResult(
-                        auth_type=auth_type,
-                        status=AuthStatus.VALID,
-                        passed=True,
-                        details="Token configured"
-                    )
-                else:
-                    result = AuthResult(
-                        auth_type=auth_type,
-                        status=AuthStatus.MISSING,
-                        passed=False,
-                        error="Token not configured"
-                    )
-            else:
-                # Unknown auth type
-                result = AuthResult(
-                    auth_type=auth_type,
-                    status=AuthStatus.MISSING,
-                    passed=False,
-                    error="Not implemented"
-                )
-            
+            result = cached.get(auth_type) or fresh[auth_type]
             results[auth_type] = result
             
             # Display result
@@ -409,6 +550,84 @@ Need Help?
         
         return results
     
+    def _check_one(self, auth_type: AuthType) -> AuthResult:
+        """Run a single preflight check."""
+        if auth_type == AuthType.VPN:
+            return self.check_vpn_connection()
+        if auth_type == AuthType.KERBEROS:
+            return self.check_kerberos_ticket()
+        if auth_type in [AuthType.JIRA_TOKEN, AuthType.PORTAL_TOKEN,
+                         AuthType.HYDRA_TOKEN, AuthType.SUPPORTSHELL_TOKEN]:
+            # Token check
+            token = self.get_token(auth_type, required=False)
+            if token:
+                return AuthResult(
+                    auth_type=auth_type,
+                    status=AuthStatus.VALID,
+                    passed=True,
+                    details="Token configured"
+                )
+            return AuthResult(
+                auth_type=auth_type,
+                status=AuthStatus.MISSING,
+                passed=False,
+                error="Token not configured"
+            )
+        # Unknown auth type
+        return AuthResult(
+            auth_type=auth_type,
+            status=AuthStatus.MISSING,
+            passed=False,
+            error="Not implemented"
+        )
+
+    def _load_preflight_cache(self) -> Dict[AuthType, AuthResult]:
+        """Passed VPN/Kerberos results from preflight_cache.json that are still fresh for this network state."""
+        ttl = _preflight_cache_ttl()
+        if ttl <= 0:
+            return {}
+        try:
+            with open(_preflight_cache_path()) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("network") != _network_state_key():
+            return {}
+        now = time.time()
+        out = {}
+        for auth_type in _CACHEABLE_PREFLIGHT:
+            entry = (data.get("results") or {}).get(auth_type.value) or {}
+            checked_at = entry.get("checked_at") or 0
+            if 0 <= now - checked_at <= ttl:
+                out[auth_type] = AuthResult(
+                    auth_type=auth_type,
+                    status=AuthStatus.VALID,
+                    passed=True,
+                    details=f"{entry.get('details') or 'OK'} (checked {int(now - checked_at)}s ago)"
+                )
+        return out
+
+    def _save_preflight_cache(self, passed: Dict[AuthType, AuthResult]) -> None:
+        if not passed or _preflight_cache_ttl() <= 0:
+            return
+        path = _preflight_cache_path()
+        network = _network_state_key()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get("network") != network:
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+        results = data.get("results") if isinstance(data.get("results"), dict) else {}
+        now = time.time()
+        for auth_type, result in passed.items():
+            results[auth_type.value] = {"checked_at": now, "details": result.details}
+        try:
+            atomic_write_json(path, {"v": 1, "network": network, "results": results})
+        except OSError:
+            pass
+
     def _show_vpn_guidance(self):
         """Show guidance for connecting to VPN."""
         guidance = """
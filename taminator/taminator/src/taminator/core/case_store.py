@@ -0,0 +1,186 @@
+"""
+Local Hydra case store for report population. Stored in ~/.config/taminator/case_store.json, one
+section per sync scope (account numbers + product filter + whether closed cases are kept). Each
+section holds the report row of every case seen, keyed by case number, together with the case's
+case_lastModifiedDate, plus a watermark: when the last successful sync started.
+
+hydra_search.sync_cases() uses this to ask Hydra only for cases modified since the watermark
+(case_lastModifiedDate >= watermark - SYNC_MARGIN_MINUTES) and merge that delta here, instead of
+re-downloading up to 12 months of cases on every update. A full query still runs when a scope has
+no watermark, the requested window reaches further back than the section covers, the last full
+sync is older than FULL_SYNC_MAX_AGE_DAYS (TAMINATOR_CASE_SYNC_MAX_AGE_DAYS), or
+TAMINATOR_CASE_SYNC_FULL=1 is set. Set TAMINATOR_NO_CASE_STORE=1 to bypass the store entirely.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .file_io import atomic_write_json, path_lock
+
+# Minutes subtracted from the watermark on each delta query to absorb clock skew and Hydra index lag
+SYNC_MARGIN_MINUTES = 10
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _full_sync_max_age_days() -> float:
+    try:
+        return float(os.environ.get("TAMINATOR_CASE_SYNC_MAX_AGE_DAYS") or 7)
+    except ValueError:
+        return 7.0
+
+
+def store_disabled() -> bool:
+    """True when the user opted out via TAMINATOR_NO_CASE_STORE."""
+    return _env_flag("TAMINATOR_NO_CASE_STORE")
+
+
+def full_sync_forced() -> bool:
+    """True when TAMINATOR_CASE_SYNC_FULL asks for a full Hydra query instead of a delta."""
+    return _env_flag("TAMINATOR_CASE_SYNC_FULL")
+
+
+def _default_store_path() -> Path:
+    return Path.home() / ".config" / "taminator" / "case_store.json"
+
+
+def scope_key(account_numbers: Iterable[str], products: Optional[Iterable[str]], include_closed: bool) -> str:
+    """Section key for one sync scope; order and case of accounts/products do not matter."""
+    accounts = ",".join(sorted({str(a).strip() for a in account_numbers or [] if str(a).strip()}))
+    prods = ",".join(sorted({str(p).strip().lower() for p in products or [] if str(p).strip()}))
+    return f"{accounts}|{prods}|{'all' if include_closed else 'open'}"
+
+
+def is_closed_status(status: str) -> bool:
+    return (status or "").strip().lower() == "closed"
+
+
+def utc_timestamp(dt: datetime) -> str:
+    """SOLR date format (UTC, second precision)."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class CaseStore:
+    """On-disk report rows and sync watermark for one Hydra sync scope."""
+
+    def __init__(self, account_numbers: Sequence[str], products: Optional[Sequence[str]] = None,
+                 include_closed: bool = False, store_file: Optional[Path] = None):
+        self.key = scope_key(account_numbers, products, include_closed)
+        self.include_closed = include_closed
+        self.path = Path(store_file) if store_file else _default_store_path()
+        self._lock = path_lock(self.path)
+        self._cases: Dict[str, Dict] = {}  # case_number -> {"row": [...], "modified": str}
+        self.watermark: Optional[str] = None  # UTC timestamp the last successful sync started
+        self.window_start: Optional[str] = None  # oldest case_lastModifiedDate the section covers
+        self.full_synced_at: float = 0.0
+        self._load()
+
+    def _read_file(self) -> Dict:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self) -> None:
+        section = (self._read_file().get("scopes") or {}).get(self.key)
+        if not isinstance(section, dict):
+            return
+        cases = section.get("cases")
+        self._cases = cases if isinstance(cases, dict) else {}
+        self.watermark = section.get("watermark") or None
+        self.window_start = section.get("window_start") or None
+        self.full_synced_at = float(section.get("full_synced_at") or 0)
+
+    def __len__(self) -> int:
+        return len(self._cases)
+
+    def needs_full_sync(self, window_start: str, now: Optional[float] = None) -> bool:
+        """True unless a delta query since the watermark is enough to cover window_start (YYYY-MM-DD)."""
+        if full_sync_forced() or not self.watermark or not self.window_start:
+            return True
+        if window_start < self.window_start[:10]:
+            return True  # caller wants older cases than the last full sync fetched
+        now = time.time() if now is None else now
+        return now - self.full_synced_at > _full_sync_max_age_days() * 86400
+
+    def delta_since(self) -> Optional[str]:
+        """Lower bound for the next delta query's case_lastModifiedDate (watermark minus the margin)."""
+        if not self.watermark:
+            return None
+        try:
+            mark = datetime.strptime(self.watermark, "%Y-%m-%dT%H:%M:%SZ")
+        except ValueError:
+            return None
+        return utc_timestamp(mark - timedelta(minutes=SYNC_MARGIN_MINUTES))
+
+    def replace(self, rows: List[Tuple[Tuple, str]], window_start: str, started: datetime) -> None:
+        """Record a full sync: rows = [(report_row, case_lastModifiedDate)] is the scope's complete case set."""
+        self._cases = {}
+        self.merge(rows)
+        self.window_start = window_start
+        self.full_synced_at = time.time()
+        self.watermark = utc_timestamp(started)
+
+    def merge(self, rows: List[Tuple[Tuple, str]], started: Optional[datetime] = None) -> int:
+        """Upsert changed cases (closed ones are dropped unless the scope keeps them). Advances the
+        watermark to started when given. Returns the number of cases added, changed or removed."""
+        changed = 0
+        for row, modified in rows:
+            case_number = (row[0] or "").strip()
+            if not case_number:
+                continue
+            if not self.include_closed and is_closed_status(row[2]):
+                changed += self._cases.pop(case_number, None) is not None
+                continue
+            entry = {"row": list(row), "modified": modified or ""}
+            if self._cases.get(case_number) != entry:
+                self._cases[case_number] = entry
+                changed += 1
+        if started is not None:
+            self.watermark = utc_timestamp(started)
+        return changed
+
+    def invalidate(self) -> None:
+        """Drop the watermark so the next sync of this scope is a full query."""
+        self.watermark = None
+
+    def rows(self, window_start: str, max_rows: int) -> List[Tuple]:
+        """Report rows for cases modified on or after window_start (YYYY-MM-DD), in case-number order.
+        When more than max_rows cases match, the max_rows most recently modified ones are returned."""
+        keep = [
+            (number, entry) for number, entry in self._cases.items()
+            # Cases without a lastModified date are kept (Hydra returned them for this window)
+            if not entry.get("modified") or entry["modified"] >= window_start
+        ]
+        if len(keep) > max_rows:
+            keep.sort(key=lambda item: item[1].get("modified") or "", reverse=True)
+            keep = keep[:max_rows]
+        keep.sort(key=lambda item: item[0])
+        return [tuple(entry["row"]) for _, entry in keep[:max_rows]]
+
+    def save(self) -> None:
+        """Write this scope's section back to the store file (other scopes are left as they are)."""
+        if self.window_start:
+            # Cases that fell out of the covered window will never be shown again
+            self._cases = {
+                k: v for k, v in self._cases.items()
+                if not v.get("modified") or v["modified"] >= self.window_start[:10]
+            }
+        with self._lock:
+            data = self._read_file()
+            scopes = data.get("scopes") if isinstance(data.get("scopes"), dict) else {}
+            scopes[self.key] = {
+                "cases": self._cases,
+                "watermark": self.watermark,
+                "window_start": self.window_start,
+                "full_synced_at": self.full_synced_at,
+            }
+            atomic_write_json(self.path, {"v": 1, "scopes": scopes}, mode=0o600, indent=None)
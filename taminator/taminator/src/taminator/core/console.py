@@ -0,0 +1,68 @@
+"""
+Shared rich console for command output.
+
+Command modules print through `console` from here instead of their own Console(). By default it
+is an ordinary terminal console; capture_output() swaps in a buffer-backed console for the
+current thread only, so the web server can run several check/update commands in-process at once
+and hand each caller its own text (same as the stdout the tam-rfe subprocess used to produce).
+"""
+
+import contextvars
+import io
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from rich.console import Console
+
+# Wide enough that comparison tables are not wrapped in the web UI result pane
+CAPTURE_WIDTH = 120
+
+_default_console = Console()
+_current: contextvars.ContextVar = contextvars.ContextVar("taminator_console", default=None)
+
+
+def get_console() -> Console:
+    """Return the console output should go to in this thread (captured buffer or the terminal)."""
+    return _current.get() or _default_console
+
+
+class _ConsoleProxy:
+    """Forwards every attribute to get_console() so modules can keep a module-level `console`."""
+
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+console = _ConsoleProxy()
+
+
+class _StreamingBuffer(io.StringIO):
+    """StringIO that also hands every write to a callback (used to stream output of web jobs)."""
+
+    def __init__(self, on_write: Callable[[str], None]):
+        super().__init__()
+        self._on_write = on_write
+
+    def write(self, s: str) -> int:
+        n = super().write(s)
+        if s:
+            self._on_write(s)
+        return n
+
+
+@contextmanager
+def capture_output(width: int = CAPTURE_WIDTH, on_write: Optional[Callable[[str], None]] = None) -> Iterator[io.StringIO]:
+    """Redirect console output in the current thread to a StringIO (plain text, no colour codes).
+
+    Args:
+        width: Console width used for tables and panels
+        on_write: Optional callback receiving each chunk of text as it is printed
+
+    Threads started inside the block do not inherit the redirect; they print to the terminal.
+    """
+    buf = _StreamingBuffer(on_write) if on_write else io.StringIO()
+    token = _current.set(Console(file=buf, width=width, force_terminal=False, color_system=None, soft_wrap=False))
+    try:
+        yield buf
+    finally:
+        _current.reset(token)
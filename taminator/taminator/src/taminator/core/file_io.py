@@ -0,0 +1,130 @@
+"""
+Atomic file writes for reports and config files.
+
+atomic_write_text() writes to a temp file in the target's directory, fsyncs it and renames it over
+the target with os.replace, so readers (the web UI, a concurrent check) see either the old or the
+new file, never a truncated one. path_lock() hands out one lock per file for the whole process so
+read-modify-write sequences on the same file from different threads do not interleave.
+JsonFileCache builds a small keyed JSON cache file on both.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+_path_locks: Dict[str, threading.RLock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def path_lock(path: Path) -> threading.RLock:
+    """Process-wide (re-entrant) lock for one file path."""
+    key = os.path.abspath(str(path))
+    with _path_locks_guard:
+        lock = _path_locks.get(key)
+        if lock is None:
+            lock = _path_locks[key] = threading.RLock()
+        return lock
+
+
+def atomic_write_text(path: Path, text: str, mode: Optional[int] = None, encoding: str = "utf-8") -> None:
+    """
+    Replace path's contents with text atomically (temp file + fsync + os.replace).
+
+    Args:
+        path: Target file (its directory is created if missing)
+        text: New contents
+        mode: Permission bits for the new file; default keeps the existing file's mode (0o644 if new)
+        encoding: Text encoding
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if mode is None:
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            mode = 0o644
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, mode: Optional[int] = 0o600, indent: Optional[int] = 2) -> None:
+    """atomic_write_text() of data as JSON (config files default to owner-only 0o600)."""
+    atomic_write_text(path, json.dumps(data, indent=indent), mode=mode)
+
+
+class JsonFileCache:
+    """
+    A small on-disk cache: a dict of JSON entries stored as {section: {key: entry}} in one file.
+
+    save() re-reads the file under path_lock() and writes back only the keys this instance changed
+    on top of what is there, so entries another process saved in the meantime are kept (a key both
+    changed goes to merge(), else the last writer wins). Writes use atomic_write_json(), owner-only.
+    """
+
+    def __init__(self, path: Path, section: str):
+        self.path = Path(path)
+        self.section = section
+        self._lock = path_lock(self.path)
+        self._entries: Dict[str, Any] = self._read()
+        self._changed: set = set()
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                entries = json.load(f).get(self.section)
+        except (OSError, ValueError, AttributeError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._entries.get(key, default)
+
+    def put(self, key: str, entry: Any) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._changed.add(key)
+
+    def items(self):
+        with self._lock:
+            return list(self._entries.items())
+
+    def save(self, keep: Optional[Callable[[str, Any], bool]] = None,
+             merge: Optional[Callable[[str, Any, Any], Any]] = None) -> None:
+        """
+        Write changed entries back (no-op when nothing changed).
+
+        Args:
+            keep: keep(key, entry) -> False drops an entry from the file (e.g. expired)
+            merge: merge(key, on_disk, ours) -> entry for a changed key that is also on disk
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with self._lock:
+            if not self._changed:
+                return
+            entries = self._read()
+            for key in self._changed:
+                ours = self._entries[key]
+                entries[key] = merge(key, entries[key], ours) if merge and key in entries else ours
+            if keep:
+                entries = {k: v for k, v in entries.items() if keep(k, v)}
+            atomic_write_json(self.path, {self.section: entries}, indent=None)
+            self._entries = entries
+            self._changed = set()
@@ -35,7 +35,10 @@ SERVICE_TO_AUTHTYPE = {
     'supportshell': AuthType.SUPPORTSHELL_TOKEN,
     'hydra': AuthType.PORTAL_TOKEN,  # Hydra = same credential as Portal (access.redhat.com)
 }
-AUTHTYPE_TO_SERVICE = {v: k for k, v in SERVICE_TO_AUTHTYPE.items()}
+# First service wins, so PORTAL_TOKEN maps to 'portal' (the Vault key the web UI writes), not 'hydra'
+AUTHTYPE_TO_SERVICE = {}
+for _service, _auth_type in SERVICE_TO_AUTHTYPE.items():
+    AUTHTYPE_TO_SERVICE.setdefault(_auth_type, _service)
 
 
 class HybridAuth:
@@ -53,15 +56,9 @@ class HybridAuth:
     - Vault as single source of truth (eventually)
     """
     
-    def __init__(self):
-        """Initialize hybrid auth."""
-        self._vault_available = None
-    
     def is_vault_available(self) -> bool:
-        """Check if Vault is available (cached)."""
-        if self._vault_available is None:
-            self._vault_available = vault_client.is_available()
-        return self._vault_available
+        """Check if Vault is available (vault_client caches the health probe for a short time)."""
+        return vault_client.is_available()
     
     def get_token(self, service: str, required: bool = True) -> Optional[str]:
         """
@@ -155,3 +152,15 @@ def get_token_for_auth_type(auth_type: AuthType, required: bool = False) -> Opti
         return None
     return hybrid_auth.get_token(service, required=required)
 
+
+def get_vault_token_for_auth_type(auth_type: AuthType) -> Optional[str]:
+    """Vault-only lookup for an AuthType (None if Vault is unavailable or has no token).
+
+    auth_box.get_token uses this instead of get_token_for_auth_type: the latter falls back to
+    auth_box.get_token, which called back into it until the stack overflowed.
+    """
+    service = AUTHTYPE_TO_SERVICE.get(auth_type)
+    if not service or not hybrid_auth.is_vault_available():
+        return None
+    return vault_client.get_token(service)
+
@@ -8,15 +8,22 @@ Repurposed from https://gitlab.cee.redhat.com/gvaughn/rhcase for report populati
 
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+from .progress import report_progress
+
 SSO_TOKEN_URL = "https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token"
 HYDRA_SEARCH_URL = "https://access.redhat.com/hydra/rest/search/cases"
 
@@ -58,10 +65,47 @@ def _load_user_jira_prefixes() -> Tuple[str, ...]:
     return tuple(out)
 
 
-_USER_JIRA_PREFIXES = _load_user_jira_prefixes()
-JIRA_PROJECT_PREFIXES = _BUILTIN_JIRA_PREFIXES + _USER_JIRA_PREFIXES
-JIRA_ID_REGEX_GROUP = "|".join(re.escape(p) + r"-\d+" for p in JIRA_PROJECT_PREFIXES)
-JIRA_ID_PATTERN = re.compile(r"(" + JIRA_ID_REGEX_GROUP + ")")
+# The prefix list, regex group and compiled pattern are built on first use rather than at import
+# (reading jira_prefixes.txt and compiling a ~90-way alternation is wasted work for CLI commands
+# that never look at a JIRA key). JIRA_PROJECT_PREFIXES, JIRA_ID_REGEX_GROUP and JIRA_ID_PATTERN
+# remain importable as module attributes via __getattr__ below.
+@lru_cache(maxsize=1)
+def jira_project_prefixes() -> Tuple[str, ...]:
+    """Known JIRA project keys: the built-in mapping plus ~/.config/taminator/jira_prefixes.txt."""
+    return _BUILTIN_JIRA_PREFIXES + _load_user_jira_prefixes()
+
+
+@lru_cache(maxsize=1)
+def jira_id_regex_group() -> str:
+    """Regex alternation matching PROJECT-NNNN for every known project key (no enclosing group)."""
+    return "|".join(re.escape(p) + r"-\d+" for p in jira_project_prefixes())
+
+
+@lru_cache(maxsize=1)
+def jira_id_pattern() -> "re.Pattern[str]":
+    """Compiled pattern finding known JIRA issue keys in text (group 1 is the key)."""
+    return re.compile(r"(" + jira_id_regex_group() + ")")
+
+
+@lru_cache(maxsize=1)
+def jira_id_fullmatch_pattern() -> "re.Pattern[str]":
+    """Compiled case-insensitive pattern matching a string that is exactly one known JIRA key."""
+    return re.compile(r"^(" + jira_id_regex_group() + r")$", re.IGNORECASE)
+
+
+_LAZY_ATTRS = {
+    "JIRA_PROJECT_PREFIXES": jira_project_prefixes,
+    "JIRA_ID_REGEX_GROUP": jira_id_regex_group,
+    "JIRA_ID_PATTERN": jira_id_pattern,
+}
+
+
+def __getattr__(name: str):
+    factory = _LAZY_ATTRS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
+
 
 # Keys that typically hold external trackers / attached resources / linked JIRA in case docs.
 # We search these explicitly first so JIRA from "External trackers" is never missed.
@@ -83,6 +127,113 @@ EXTERNAL_TRACKER_KEYS = (
 )
 
 
+# Named SOLR field projections (fl=) so each search transfers only the fields its consumer reads.
+#   report-row:      format_doc_for_report(): case number, summary, status and the tracker fields
+#                    JIRA links are stored under (EXTERNAL_TRACKER_KEYS is that explicit list)
+#   portal-row:      doc_to_portal_search_row() for the web UI Portal search
+#   account-detect:  _extract_account_from_doc() for auto-configuring accounts from pasted cases
+#   group-discovery: discover_case_groups_for_account()
+#   case-sync:       sync_cases() (report-row plus the lastModified date the local case store keys on)
+#   case-detail:     search_cases_by_case_numbers() callers enriching known cases (dates + JIRA links)
+# Combine profiles with "+", e.g. "report-row+account-detect".
+# A projected doc only shows JIRA keys under the listed tracker fields or in the summary; keys
+# stored under other field names are only found by format_doc_for_report()'s full-doc scan. So
+# searches that build report rows pass their docs through refetch_docs_without_jira(), which
+# re-queries the rows that came back without a key as full documents.
+FIELD_PROFILES: Dict[str, Tuple[str, ...]] = {
+    "report-row": ("case_number", "case_summary", "case_status") + EXTERNAL_TRACKER_KEYS,
+    "portal-row": (
+        "case_number", "case_summary", "case_status", "case_product", "case_sbr",
+        "case_accountNumber", "case_accountName", "case_lastModifiedDate",
+    ) + EXTERNAL_TRACKER_KEYS,
+    "account-detect": (
+        "case_number",
+        "case_accountNumber", "case_account_number", "account_number",
+        "case_accountName", "case_account_name", "account_name", "customer_name",
+    ),
+    "group-discovery": ("case_sbr", "case_product"),
+}
+FIELD_PROFILES["case-sync"] = FIELD_PROFILES["report-row"] + ("case_lastModifiedDate",)
+FIELD_PROFILES["case-detail"] = FIELD_PROFILES["case-sync"] + ("case_createdDate",)
+# Case numbers per OR query in search_cases_by_case_numbers() (keeps the GET URL and SOLR clause count small)
+CASE_NUMBER_CHUNK = 100
+
+HYDRA_PAGE_SIZE = 100
+# Pages fetched concurrently after the first one (which tells us numFound)
+HYDRA_MAX_WORKERS = 4
+# Case store syncs page the whole window, newest first; this only bounds a runaway scope
+CASE_SYNC_MAX_DOCS = 20000
+CASE_SYNC_SORT = "case_lastModifiedDate desc"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """Shared keep-alive session for Hydra, retrying 429/5xx with exponential backoff (honours Retry-After)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=HYDRA_MAX_WORKERS, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def profile_fields(profile: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Field list for a FIELD_PROFILES name (or names joined with "+"), or None for full documents.
+    Full docs are returned when debugging missing JIRA links (TAMINATOR_DEBUG_HYDRA_JIRA) or when
+    TAMINATOR_HYDRA_FULL_DOCS=1, so the debug output sees every field.
+
+    Raises:
+        ValueError: If a profile name is unknown.
+    """
+    if not profile:
+        return None
+    fields: List[str] = []
+    names = profile.split("+")
+    for name in names:
+        if name not in FIELD_PROFILES:
+            raise ValueError(f"Unknown Hydra field profile: {name}")
+        fields.extend(FIELD_PROFILES[name])
+    if os.environ.get("TAMINATOR_DEBUG_HYDRA_JIRA") or os.environ.get("TAMINATOR_HYDRA_FULL_DOCS"):
+        return None
+    return tuple(dict.fromkeys(fields))
+
+
+# Bytes of response body received per profile (debug counter; see get_transfer_stats)
+_transfer_stats: Dict[str, Dict[str, int]] = {}
+_transfer_lock = threading.Lock()
+
+
+def _record_transfer(profile: Optional[str], nbytes: int, start: int, rows: int) -> None:
+    key = profile or "full"
+    with _transfer_lock:
+        entry = _transfer_stats.setdefault(key, {"calls": 0, "bytes": 0})
+        entry["calls"] += 1
+        entry["bytes"] += nbytes
+    # Debug: log response size per call (set TAMINATOR_DEBUG_HYDRA_BYTES=1)
+    if os.environ.get("TAMINATOR_DEBUG_HYDRA_BYTES"):
+        import sys
+        print(f"[hydra] profile={key} start={start} rows={rows} bytes={nbytes}", file=sys.stderr)
+
+
+def get_transfer_stats() -> Dict[str, Dict[str, int]]:
+    """Return {profile: {calls, bytes}} of Hydra response bodies received by this process."""
+    with _transfer_lock:
+        return {k: dict(v) for k, v in _transfer_stats.items()}
+
+
 def get_bearer_token(username: str, password: str, timeout: int = 30) -> str:
     """Get Bearer token from Red Hat SSO using username/password (same as rhcase).
 
@@ -147,7 +298,8 @@ def build_solr_query(
     Args:
         account_numbers: List of account numbers (required).
         include_closed: If False, add NOT case_status:Closed.
-        modified_after: YYYY-MM-DD — cases modified on or after this date.
+        modified_after: YYYY-MM-DD — cases modified on or after this date (or a full
+            YYYY-MM-DDTHH:MM:SSZ timestamp, as used by incremental sync).
         created_after: YYYY-MM-DD — cases created on or after this date.
         products: Filter by product (substring match, OR'd).
         statuses: Filter by exact status (OR'd).
@@ -172,7 +324,8 @@ def build_solr_query(
         clauses.append(f"({prods})")
 
     if modified_after:
-        clauses.append(f"case_lastModifiedDate:[{modified_after}T00:00:00Z TO *]")
+        since = modified_after if "T" in modified_after else f"{modified_after}T00:00:00Z"
+        clauses.append(f"case_lastModifiedDate:[{since} TO *]")
     if created_after:
         clauses.append(f"case_createdDate:[{created_after}T00:00:00Z TO *]")
 
@@ -197,6 +350,62 @@ def build_solr_query_by_case_numbers(case_numbers: List[str]) -> str:
     return f"({clauses})"
 
 
+_SOLR_SPECIAL_CHARS = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def build_solr_query_portal_search(
+    keywords: str,
+    account_numbers: List[str],
+    include_closed: bool = False,
+    modified_after: Optional[str] = None,
+    products: Optional[List[str]] = None,
+) -> str:
+    """Build SOLR query for the web UI Portal search.
+
+    Scopes by account numbers / products / date like build_solr_query(), then ANDs keyword terms:
+    a bare case number matches case_number; other terms must each match the case summary or account name.
+    With no account numbers (discovery mode) only the keyword and date clauses apply.
+    """
+    base = build_solr_query(
+        account_numbers=account_numbers,
+        include_closed=include_closed,
+        modified_after=modified_after,
+        products=products,
+    )
+    clauses = [] if base == "*:*" else [base]
+    for term in (keywords or "").split():
+        if re.match(r"^\d{6,}$", term):
+            clauses.append(f"case_number:{term}")
+            continue
+        escaped = _SOLR_SPECIAL_CHARS.sub(r"\\\1", term)
+        clauses.append(f"(case_summary:*{escaped}* OR case_accountName:*{escaped}*)")
+    return " AND ".join(clauses) if clauses else "*:*"
+
+
+def doc_to_portal_search_row(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a SOLR case doc (portal-row profile) to a JSON row for the web UI Portal search."""
+    case_number, summary, status, jira_id, kind = format_doc_for_report(doc)
+    acc = _extract_account_from_doc(doc) or {}
+    product = doc.get("case_product") or ""
+    if isinstance(product, list):
+        product = ", ".join(str(p) for p in product if p)
+    sbr = doc.get("case_sbr") or ""
+    if isinstance(sbr, list):
+        sbr = ", ".join(str(g) for g in sbr if g)
+    return {
+        "case_number": case_number,
+        "summary": summary,
+        "status": status,
+        "jira_id": jira_id,
+        "kind": kind,
+        "product": product,
+        "sbr": sbr,
+        "account_numbers": acc.get("account_numbers") or [],
+        "account_name": acc.get("customer_name") or "",
+        "last_modified": doc.get("case_lastModifiedDate") or "",
+    }
+
+
 def _extract_account_from_doc(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Extract account number and optional customer name from a case doc.
     Returns None if no account; else dict with account_numbers (list) and customer_name (str, may be empty).
@@ -227,6 +436,11 @@ def search_cases(
     rows: int = 500,
     timeout: int = 60,
     basic_auth: Optional[Tuple[str, str]] = None,
+    fields: Optional[Sequence[str]] = None,
+    basic_auth_fallback: Optional[Tuple[str, str]] = None,
+    bearer_fallback: Optional[str] = None,
+    profile: Optional[str] = None,
+    sort: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Execute Hydra SOLR case search.
 
@@ -237,6 +451,11 @@ def search_cases(
         rows: Max rows to return.
         timeout: Request timeout in seconds.
         basic_auth: Optional (username, password) for HTTP Basic auth. When set, used instead of token.
+        fields: Optional SOLR field list (fl=) so only these fields are returned.
+        basic_auth_fallback: (username, password) to retry with if the Bearer token gets 401.
+        bearer_fallback: Bearer token to retry with if Basic auth gets 401.
+        profile: FIELD_PROFILES name (or names joined with "+") used for fl= when fields is not given.
+        sort: Optional SOLR sort, e.g. "case_lastModifiedDate desc".
 
     Returns:
         SOLR response dict with response.docs[].
@@ -246,25 +465,95 @@ def search_cases(
     """
     if not requests:
         raise RuntimeError("requests library required for Hydra search (pip install requests)")
+    session = _get_session()
     headers = {"Content-Type": "application/json"}
     params = {"q": query, "start": start, "rows": rows}
+    if sort:
+        params["sort"] = sort
+    if fields is None:
+        fields = profile_fields(profile)
+    if fields:
+        params["fl"] = ",".join(fields)
     if basic_auth:
-        resp = requests.get(HYDRA_SEARCH_URL, headers=headers, params=params, auth=basic_auth, timeout=timeout)
+        resp = session.get(HYDRA_SEARCH_URL, headers=headers, params=params, auth=basic_auth, timeout=timeout)
+        if resp.status_code == 401 and bearer_fallback:
+            resp = session.get(
+                HYDRA_SEARCH_URL,
+                headers={**headers, "Authorization": f"Bearer {bearer_fallback}"},
+                params=params,
+                timeout=timeout,
+            )
     else:
         if not token:
             raise RuntimeError("Hydra search requires token or basic_auth")
-        headers["Authorization"] = f"Bearer {token}"
-        resp = requests.get(HYDRA_SEARCH_URL, headers=headers, params=params, timeout=timeout)
+        resp = session.get(
+            HYDRA_SEARCH_URL,
+            headers={**headers, "Authorization": f"Bearer {token}"},
+            params=params,
+            timeout=timeout,
+        )
+        if resp.status_code == 401 and basic_auth_fallback:
+            resp = session.get(HYDRA_SEARCH_URL, headers=headers, params=params, auth=basic_auth_fallback, timeout=timeout)
     resp.raise_for_status()
+    _record_transfer(profile, len(resp.content or b""), start, rows)
     return resp.json()
 
 
+def _search_all_pages(
+    query: str,
+    max_rows: int,
+    token: Optional[str] = None,
+    basic_auth: Optional[Tuple[str, str]] = None,
+    profile: Optional[str] = None,
+    basic_auth_fallback: Optional[Tuple[str, str]] = None,
+    bearer_fallback: Optional[str] = None,
+    sort: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Fetch up to max_rows docs for query. The first page gives numFound; remaining pages are fetched
+    concurrently (HYDRA_MAX_WORKERS) over the shared session. Returns (docs in page order, first page result)."""
+
+    def fetch(start: int) -> Dict[str, Any]:
+        return search_cases(
+            token=token,
+            query=query,
+            start=start,
+            rows=min(HYDRA_PAGE_SIZE, max_rows - start),
+            basic_auth=basic_auth,
+            profile=profile,
+            basic_auth_fallback=basic_auth_fallback,
+            bearer_fallback=bearer_fallback,
+            sort=sort,
+        )
+
+    if max_rows <= 0:
+        return [], {}
+    first = fetch(0)
+    response = first.get("response", {})
+    docs = list(response.get("docs", []))
+    try:
+        num_found = int(response.get("numFound", len(docs)))
+    except (TypeError, ValueError):
+        num_found = len(docs)
+    # A short first page means there is nothing more to fetch
+    starts = []
+    if len(docs) >= min(HYDRA_PAGE_SIZE, max_rows):
+        starts = list(range(HYDRA_PAGE_SIZE, min(num_found, max_rows), HYDRA_PAGE_SIZE))
+    total_pages = len(starts) + 1
+    report_progress("hydra", 1, total_pages)
+    if starts:
+        with ThreadPoolExecutor(max_workers=min(HYDRA_MAX_WORKERS, len(starts))) as pool:
+            for i, page in enumerate(pool.map(fetch, starts), start=2):
+                docs.extend(page.get("response", {}).get("docs", []))
+                report_progress("hydra", i, total_pages)
+    return docs[:max_rows], first
+
+
 def _find_jira_in_value(val: Any, summary: str) -> Optional[str]:
     """Search a value (string, list, or dict) for first JIRA issue key (see JIRA_PROJECT_PREFIXES). Recurses into dicts/lists."""
     if isinstance(val, str):
         if val == summary:
             return None
-        jira_match = JIRA_ID_PATTERN.search(val)
+        jira_match = jira_id_pattern().search(val)
         return jira_match.group(1) if jira_match else None
     if isinstance(val, list):
         for item in val:
@@ -276,7 +565,7 @@ def _find_jira_in_value(val: Any, summary: str) -> Optional[str]:
         for k, v in val.items():
             if k in ("key", "id", "jira_key", "issue_key", "case_jiraKey", "case_jira_key"):
                 if isinstance(v, str):
-                    jira_match = JIRA_ID_PATTERN.search(v)
+                    jira_match = jira_id_pattern().search(v)
                     if jira_match:
                         return jira_match.group(1)
             found = _find_jira_in_value(v, summary)
@@ -305,7 +594,7 @@ def _extract_jira_id_from_doc(doc: Dict[str, Any], summary: str) -> str:
         if found:
             return found
     # 2. From summary
-    jira_match = JIRA_ID_PATTERN.search(summary)
+    jira_match = jira_id_pattern().search(summary)
     if jira_match:
         return jira_match.group(1)
     # 3. Recursive scan of entire doc (catches nested or unknown field names)
@@ -369,6 +658,35 @@ def _extract_kind_from_tracker_values(tracker_vals: Dict[str, Any]) -> str:
     return "unknown"
 
 
+def _find_all_jira_in_value(val: Any, summary: str, found: List[str]) -> None:
+    """Append every JIRA key in a value (string, list, or dict, recursively) to found; like
+    _find_jira_in_value(), strings equal to the summary are skipped."""
+    if isinstance(val, str):
+        if val != summary:
+            found.extend(jira_id_pattern().findall(val))
+    elif isinstance(val, list):
+        for item in val:
+            _find_all_jira_in_value(item, summary, found)
+    elif isinstance(val, dict):
+        for v in val.values():
+            _find_all_jira_in_value(v, summary, found)
+
+
+def jira_ids_from_doc(doc: Dict[str, Any]) -> List[str]:
+    """Every known JIRA key linked from a case doc, in _extract_jira_id_from_doc()'s order: external
+    trackers, then the summary, then a recursive scan of the rest of the doc (no duplicates)."""
+    summary = doc.get("case_summary") or ""
+    tracker_vals = _get_external_tracker_values(doc)
+    found: List[str] = []
+    for val in tracker_vals.values():
+        _find_all_jira_in_value(val, summary, found)
+    found.extend(jira_id_pattern().findall(summary))
+    for key, val in doc.items():
+        if key != "case_summary" and key not in tracker_vals:
+            _find_all_jira_in_value(val, summary, found)
+    return list(dict.fromkeys(found))
+
+
 def format_doc_for_report(doc: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
     """Convert a SOLR case doc to (case_number, summary, status, jira_id, kind) for report rows.
 
@@ -422,35 +740,184 @@ def discover_cases(
         modified_after=modified_after,
         products=products,
     )
-    page_size = 100
-    all_docs = []
-    start = 0
-    first_page = True
-    while start < max_rows:
-        result = search_cases(token=token, query=query, start=start, rows=page_size, basic_auth=basic_auth)
-        docs = result.get("response", {}).get("docs", [])
-        all_docs.extend(docs)
-        # Debug: log what the Hydra API returned (set TAMINATOR_DEBUG_HYDRA_RESPONSE=1)
-        if first_page and os.environ.get("TAMINATOR_DEBUG_HYDRA_RESPONSE"):
-            import sys
-            resp = result.get("response", {})
-            num_found = resp.get("numFound", "?")
-            print(f"[hydra] API response: response keys={list(result.keys())}; response.numFound={num_found}; this page docs={len(docs)}", file=sys.stderr)
-            print(f"[hydra] SOLR query: q={query[:200]}{'...' if len(query) > 200 else ''}", file=sys.stderr)
-            if docs:
-                print(f"[hydra] first doc keys: {list(docs[0].keys())}", file=sys.stderr)
-            first_page = False
-        if len(docs) < page_size:
-            break
-        start += page_size
+    all_docs, result = _search_all_pages(
+        query, max_rows, token=token, basic_auth=basic_auth, profile="report-row"
+    )
+    all_docs = refetch_docs_without_jira(all_docs, "report-row", token=token, basic_auth=basic_auth)
+    # Debug: log what the Hydra API returned (set TAMINATOR_DEBUG_HYDRA_RESPONSE=1)
+    if os.environ.get("TAMINATOR_DEBUG_HYDRA_RESPONSE"):
+        import sys
+        resp = result.get("response", {})
+        num_found = resp.get("numFound", "?")
+        print(f"[hydra] API response: response keys={list(result.keys())}; response.numFound={num_found}; docs fetched={len(all_docs)}", file=sys.stderr)
+        print(f"[hydra] SOLR query: q={query[:200]}{'...' if len(query) > 200 else ''}", file=sys.stderr)
+        if all_docs:
+            print(f"[hydra] first doc keys: {list(all_docs[0].keys())}", file=sys.stderr)
     return [format_doc_for_report(d) for d in all_docs[:max_rows]]
 
 
+def sync_cases(
+    token: Optional[str] = None,
+    account_numbers: Optional[List[str]] = None,
+    months_back: int = 1,
+    include_closed: bool = False,
+    products: Optional[List[str]] = None,
+    max_rows: int = 500,
+    basic_auth: Optional[Tuple[str, str]] = None,
+) -> Tuple[List[Tuple[str, str, str, str, str]], Dict[str, Any]]:
+    """The cases discover_cases() finds, served from the local case store (see core.case_store).
+
+    The first sync of an account (or one after the store's full-sync interval) runs the full
+    months_back query; later syncs ask Hydra only for cases modified since the last successful
+    sync, including ones that were closed in the meantime so they drop out, and merge them into
+    the store. Syncs are not capped at max_rows: they page the whole window newest first (up to
+    CASE_SYNC_MAX_DOCS), so the store holds every recent case and large accounts get deltas too.
+    A delta that hits CASE_SYNC_MAX_DOCS is merged but forces a full query next time. Falls back
+    to discover_cases() when TAMINATOR_NO_CASE_STORE is set.
+
+    max_rows only limits the returned rows: unlike discover_cases() (SOLR's order, first max_rows
+    found), rows come back in case-number order and are the max_rows most recently modified cases
+    of the window.
+
+    Returns:
+        (cases, info)
+        cases: list of (case_number, summary, status, jira_id, kind), as from discover_cases().
+        info: {"mode": "full" | "delta" | "off", "fetched": docs downloaded, "changed": cases
+        added/updated/removed in the store}.
+    """
+    from .case_store import CaseStore, store_disabled
+
+    if not account_numbers:
+        return [], {"mode": "off", "fetched": 0, "changed": 0}
+    if store_disabled():
+        cases = discover_cases(token=token, account_numbers=account_numbers, months_back=months_back,
+                               include_closed=include_closed, products=products, max_rows=max_rows,
+                               basic_auth=basic_auth)
+        return cases, {"mode": "off", "fetched": len(cases), "changed": len(cases)}
+
+    started = datetime.utcnow()
+    window_start = (started - timedelta(days=months_back * 31)).strftime("%Y-%m-%d")
+    store = CaseStore(account_numbers, products, include_closed)
+    full = store.needs_full_sync(window_start)
+    query = build_solr_query(
+        account_numbers=account_numbers,
+        # Deltas include closed cases so cases closed since the last sync are removed from the store
+        include_closed=include_closed or not full,
+        modified_after=window_start if full else store.delta_since(),
+        products=products,
+    )
+    docs, first = _search_all_pages(query, max(max_rows, CASE_SYNC_MAX_DOCS), token=token,
+                                    basic_auth=basic_auth, profile="case-sync", sort=CASE_SYNC_SORT)
+    docs = refetch_docs_without_jira(docs, "case-sync", token=token, basic_auth=basic_auth)
+    rows = [(format_doc_for_report(d), d.get("case_lastModifiedDate") or "") for d in docs]
+    try:
+        truncated = int(first.get("response", {}).get("numFound", len(docs))) > len(docs)
+    except (TypeError, ValueError):
+        truncated = False
+    if full:
+        # Newest first, so even a capped full sync holds the newest cases rows() can return
+        store.replace(rows, window_start, started)
+        changed = len(store)
+    else:
+        # A truncated delta would leave changes behind the watermark: merge it, but resync fully next time
+        changed = store.merge(rows, started=None if truncated else started)
+        if truncated:
+            store.invalidate()
+    store.save()
+    return store.rows(window_start, max_rows), {"mode": "full" if full else "delta", "fetched": len(docs), "changed": changed}
+
+
+def search_cases_by_case_numbers(
+    token: Optional[str] = None,
+    case_numbers: Optional[List[str]] = None,
+    basic_auth: Optional[Tuple[str, str]] = None,
+    max_rows: int = 500,
+    profile: Optional[str] = "report-row",
+    basic_auth_fallback: Optional[Tuple[str, str]] = None,
+    bearer_fallback: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Raw SOLR docs for a list of case numbers (no date filter), in CASE_NUMBER_CHUNK-sized OR queries.
+
+    Large lists are split so each request stays well within URL and SOLR boolean-clause limits;
+    chunks run concurrently (HYDRA_MAX_WORKERS) over the shared session. Returns at most max_rows docs.
+    """
+    numbers = list(dict.fromkeys((c or "").strip() for c in case_numbers or [] if (c or "").strip()))
+    if not numbers or max_rows <= 0:
+        return []
+
+    def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+        query = build_solr_query_by_case_numbers(chunk)
+        if query == "*:*":
+            return []  # nothing that looks like a case number; never search everything
+        docs, _ = _search_all_pages(
+            query,
+            min(max_rows, len(chunk)),
+            token=token,
+            basic_auth=basic_auth,
+            profile=profile,
+            basic_auth_fallback=basic_auth_fallback,
+            bearer_fallback=bearer_fallback,
+        )
+        return docs
+
+    chunks = [numbers[i:i + CASE_NUMBER_CHUNK] for i in range(0, len(numbers), CASE_NUMBER_CHUNK)]
+    if len(chunks) == 1:
+        return fetch(chunks[0])[:max_rows]
+    docs: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=min(HYDRA_MAX_WORKERS, len(chunks))) as pool:
+        for chunk_docs in pool.map(fetch, chunks):
+            docs.extend(chunk_docs)
+    return docs[:max_rows]
+
+
+def refetch_docs_without_jira(
+    docs: List[Dict[str, Any]],
+    profile: Optional[str],
+    token: Optional[str] = None,
+    basic_auth: Optional[Tuple[str, str]] = None,
+    basic_auth_fallback: Optional[Tuple[str, str]] = None,
+    bearer_fallback: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """docs with every projected doc that yields no JIRA key replaced by the case's full document.
+
+    Docs fetched with a FIELD_PROFILES projection only carry the listed tracker fields, so a JIRA
+    link stored under another field name would be lost. Those cases (and only those) are queried
+    again by case number without fl=. If that query fails the projected docs are kept.
+    """
+    if not docs or profile_fields(profile) is None:
+        return docs  # already full documents
+    missing = [
+        d.get("case_number") for d in docs
+        if d.get("case_number") and not _extract_jira_id_from_doc(d, d.get("case_summary") or "")
+    ]
+    if not missing:
+        return docs
+    try:
+        full_docs = search_cases_by_case_numbers(
+            token=token,
+            case_numbers=missing,
+            basic_auth=basic_auth,
+            max_rows=len(missing),
+            profile=None,
+            basic_auth_fallback=basic_auth_fallback,
+            bearer_fallback=bearer_fallback,
+        )
+    except Exception as e:
+        if os.environ.get("TAMINATOR_DEBUG_HYDRA_JIRA"):
+            import sys
+            print(f"[hydra] full-doc refetch for {len(missing)} case(s) failed: {e}", file=sys.stderr)
+        return docs
+    by_number = {d.get("case_number"): d for d in full_docs if d.get("case_number")}
+    return [by_number.get(d.get("case_number"), d) for d in docs]
+
+
 def discover_cases_by_case_numbers(
     token: Optional[str] = None,
     case_numbers: Optional[List[str]] = None,
     basic_auth: Optional[Tuple[str, str]] = None,
     max_rows: int = 500,
+    basic_auth_fallback: Optional[Tuple[str, str]] = None,
+    bearer_fallback: Optional[str] = None,
 ) -> Tuple[List[Tuple[str, str, str, str, str]], List[Dict[str, Any]]]:
     """Discover cases by a list of case numbers (e.g. from pasted Salesforce dump).
     Does not filter by date; returns case data and JIRA IDs. Also extracts account
@@ -463,17 +930,23 @@ def discover_cases_by_case_numbers(
     """
     if not case_numbers:
         return [], []
-    query = build_solr_query_by_case_numbers(case_numbers)
-    page_size = 100
-    all_docs = []
-    start = 0
-    while start < max_rows:
-        result = search_cases(token=token, query=query, start=start, rows=page_size, basic_auth=basic_auth)
-        docs = result.get("response", {}).get("docs", [])
-        all_docs.extend(docs)
-        if len(docs) < page_size:
-            break
-        start += page_size
+    all_docs = search_cases_by_case_numbers(
+        token=token,
+        case_numbers=case_numbers,
+        basic_auth=basic_auth,
+        max_rows=max_rows,
+        profile="report-row+account-detect",
+        basic_auth_fallback=basic_auth_fallback,
+        bearer_fallback=bearer_fallback,
+    )
+    all_docs = refetch_docs_without_jira(
+        all_docs,
+        "report-row+account-detect",
+        token=token,
+        basic_auth=basic_auth,
+        basic_auth_fallback=basic_auth_fallback,
+        bearer_fallback=bearer_fallback,
+    )
     cases = [format_doc_for_report(d) for d in all_docs[:max_rows]]
     # Collect unique account info from docs (for auto-configuring accounts)
     seen_keys: set = set()
@@ -526,7 +999,9 @@ def discover_case_groups_for_account(
         modified_after=modified_after,
     )
     try:
-        result = search_cases(token=token, query=query, start=0, rows=max_rows, basic_auth=basic_auth)
+        result = search_cases(
+            token=token, query=query, start=0, rows=max_rows, basic_auth=basic_auth, profile="group-discovery"
+        )
     except Exception:
         return {"sbr": [], "product": []}
     docs = result.get("response", {}).get("docs", [])
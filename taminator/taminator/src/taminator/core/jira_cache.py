@@ -0,0 +1,131 @@
+"""
+Local JIRA issue cache. Stored in ~/.config/taminator/jira_cache.json, one section per JIRA
+instance, keyed by issue key. Each entry holds the last status dict built by JIRAClient (which
+includes JIRA's own 'updated' timestamp) plus when we last confirmed it against JIRA.
+
+JIRAClient.get_multiple_statuses() uses this to ask JIRA only for issues whose 'updated' moved
+since they were cached (JQL: key in (...) AND updated >= -Nm) instead of re-downloading every key.
+That query never returns issues that were deleted, moved or made inaccessible, so an entry is only
+served for TAMINATOR_JIRA_CACHE_MAX_AGE_HOURS (default a week, well above a nightly refresh)
+after the issue was last downloaded; then the issue is fetched in full again and dropped if JIRA
+no longer returns it.
+Set TAMINATOR_NO_JIRA_CACHE=1 to bypass it.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .file_io import atomic_write_json, path_lock
+
+# Extra minutes added to each revalidation window to absorb clock skew and JIRA index lag
+SYNC_MARGIN_MINUTES = 5
+# Hours an entry is served after its last full download (TAMINATOR_JIRA_CACHE_MAX_AGE_HOURS)
+DEFAULT_MAX_ENTRY_AGE_HOURS = 7 * 24
+
+
+def _max_entry_age_hours() -> float:
+    try:
+        return float(os.environ.get("TAMINATOR_JIRA_CACHE_MAX_AGE_HOURS") or DEFAULT_MAX_ENTRY_AGE_HOURS)
+    except ValueError:
+        return float(DEFAULT_MAX_ENTRY_AGE_HOURS)
+
+
+def _default_cache_path() -> Path:
+    return Path.home() / ".config" / "taminator" / "jira_cache.json"
+
+
+def cache_disabled() -> bool:
+    """True when the user opted out via TAMINATOR_NO_JIRA_CACHE."""
+    return os.environ.get("TAMINATOR_NO_JIRA_CACHE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class JiraIssueCache:
+    """On-disk cache of JIRA issue status dicts for one JIRA instance (base_url)."""
+
+    def __init__(self, base_url: str, cache_file: Optional[Path] = None):
+        self.base_url = (base_url or "").rstrip("/")
+        self.path = cache_file or _default_cache_path()
+        self._lock = path_lock(self.path)
+        self._issues: Dict[str, Dict] = {}
+        self._max_age = _max_entry_age_hours() * 3600
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            issues = (data.get("instances") or {}).get(self.base_url, {}).get("issues") or {}
+            if isinstance(issues, dict):
+                self._issues = issues
+        except Exception:
+            self._issues = {}
+
+    def _fresh(self, entry: Optional[Dict], now: Optional[float] = None) -> bool:
+        """True while the entry's last full download is younger than the max entry age."""
+        now = time.time() if now is None else now
+        return bool(entry) and now - (entry.get("fetched_at") or 0) <= self._max_age
+
+    def get(self, issue_key: str) -> Optional[Dict]:
+        """Return the cached status dict for issue_key, or None (also once the entry is too old)."""
+        entry = self._issues.get(issue_key)
+        return dict(entry["info"]) if self._fresh(entry) and entry.get("info") else None
+
+    def put(self, issue_key: str, info: Dict, synced_at: float) -> None:
+        """Cache a status dict downloaded at synced_at. ERROR / NOT_FOUND results are never cached."""
+        if not info or info.get("status") in ("ERROR", "NOT_FOUND"):
+            return
+        self._issues[issue_key] = {
+            "info": info, "updated": info.get("updated", ""), "synced_at": synced_at, "fetched_at": synced_at,
+        }
+
+    def touch(self, issue_keys: List[str], synced_at: float) -> None:
+        """Record that these cached issues were confirmed unchanged as of synced_at."""
+        for key in issue_keys:
+            if key in self._issues:
+                self._issues[key]["synced_at"] = synced_at
+
+    def revalidation_window_minutes(self, issue_keys: List[str], now: float) -> Optional[int]:
+        """Minutes back a JQL 'updated >= -Nm' query must look to cover every key since its last sync.
+        Returns None if any key has no sync time."""
+        oldest = None
+        for key in issue_keys:
+            synced_at = (self._issues.get(key) or {}).get("synced_at")
+            if not synced_at:
+                return None
+            oldest = synced_at if oldest is None else min(oldest, synced_at)
+        if oldest is None:
+            return None
+        return int(max(0, now - oldest) // 60) + SYNC_MARGIN_MINUTES
+
+    def save(self) -> None:
+        """Merge this instance's entries into the cache file (atomic replace, owner-only permissions).
+        Entries past the max entry age are dropped."""
+        now = time.time()
+        with self._lock:
+            data: Dict = {}
+            if self.path.exists():
+                try:
+                    with open(self.path) as f:
+                        data = json.load(f)
+                except Exception:
+                    data = {}
+            instances = data.get("instances") if isinstance(data.get("instances"), dict) else {}
+            on_disk = (instances.get(self.base_url) or {}).get("issues") or {}
+            # Keep whichever copy of each entry was downloaded, then confirmed, most recently (other
+            # processes may have written)
+            def age_key(entry: Optional[Dict]):
+                entry = entry or {}
+                return (entry.get("fetched_at") or 0, entry.get("synced_at") or 0)
+
+            merged = dict(on_disk)
+            for key, entry in self._issues.items():
+                if age_key(entry) >= age_key(merged.get(key)):
+                    merged[key] = entry
+            merged = {k: v for k, v in merged.items() if self._fresh(v, now)}
+            instances[self.base_url] = {"issues": merged}
+            atomic_write_json(self.path, {"v": 1, "instances": instances}, mode=0o600, indent=None)
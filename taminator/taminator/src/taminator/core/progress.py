@@ -0,0 +1,39 @@
+"""
+Progress reporting for long-running operations.
+
+Library code calls report_progress() at natural checkpoints (each JIRA batch, each Hydra page,
+each uploaded file). It is a no-op unless the caller installed a listener with
+progress_listener(); the web server's background jobs do this to stream progress to the UI.
+The listener lives in a context variable, so it applies to the current thread (and to work
+submitted with contextvars.copy_context().run), not to unrelated concurrent requests.
+"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+ProgressCallback = Callable[[str, int, Optional[int], Optional[str]], None]
+
+_listener: contextvars.ContextVar = contextvars.ContextVar("taminator_progress", default=None)
+
+
+def report_progress(stage: str, done: int, total: Optional[int] = None, detail: Optional[str] = None) -> None:
+    """Report that `done` of `total` units of `stage` (e.g. 'jira', 'hydra') are finished."""
+    callback = _listener.get()
+    if callback is None:
+        return
+    try:
+        callback(stage, done, total, detail)
+    except Exception:
+        # Progress is best-effort; never fail the operation because a listener broke
+        pass
+
+
+@contextmanager
+def progress_listener(callback: ProgressCallback) -> Iterator[None]:
+    """Send report_progress() calls made in this context to callback(stage, done, total, detail)."""
+    token = _listener.set(callback)
+    try:
+        yield
+    finally:
+        _listener.reset(token)
@@ -0,0 +1,552 @@
+"""
+Structured model of a customer report (markdown): parse once, render many.
+
+parse_report(text) splits a report in one pass into blocks (headings, paragraphs, list items,
+rules, code fences and tables split into rows and cells), each with its source offsets, and
+groups them into sections at '## ' headings. Renderers (HTML, plain text, CSV), the JIRA row
+scan used by check/update, the Summary row counts and fix-tables all work from that structure,
+so a UI view or Drive export no longer re-parses the text once per format.
+
+load_report(path) caches the parsed document per file until its mtime or size changes;
+parse_report(text) keeps a small cache of recent texts. Documents are treated as immutable and
+memoize their renderings.
+"""
+
+import csv
+import html as html_module
+import io
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Block kinds
+HEADING = "heading"
+PARAGRAPH = "paragraph"
+LIST_ITEM = "list_item"
+RULE = "rule"
+BLANK = "blank"
+CODE = "code"
+TABLE = "table"
+
+# Report table layout: | RED HAT JIRA ID | Support Case | Description | Status/Notes |
+REPORT_TABLE_COLUMNS = ("RED HAT JIRA ID", "Support Case", "Description", "Status/Notes")
+# Fewest cells a table row needs to be read as a JIRA row (key, case, description, status)
+MIN_JIRA_ROW_CELLS = 4
+
+_FENCE_RE = re.compile(r"^```")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_RULE_RE = re.compile(r"^(?:---+|\*+|_+)$")
+_LIST_ITEM_RE = re.compile(r"^(?:([-*])|(\d+)\.)\s+")
+_SEPARATOR_CELL_RE = re.compile(r"^[\s\-:]+$")
+# Row-level checks used for the Summary counts (same as the original line scan in update)
+_SEPARATOR_ROW_RE = re.compile(r"^\|[\s\-:]+\|")
+_PLACEHOLDER_ROW_RE = re.compile(r"^\|\s*(\|\s*)+\|$")
+
+# Generic JIRA key token; the project prefix is then checked against JIRA_PROJECT_PREFIXES
+_KEY_TOKEN = r"[A-Z][A-Z0-9_]*-\d+"
+# First table cell: KEY or [KEY](url)
+_KEY_CELL_RE = re.compile(r"^\s*(?:\[\s*(" + _KEY_TOKEN + r")\s*\]\s*\([^\)]*\)|(" + _KEY_TOKEN + r"))\s*$")
+# Tab/space separated export: KEY  <case number>  <description ...>  <status word>
+_TAB_ROW_RE = re.compile(r"(?<![A-Z0-9_-])(" + _KEY_TOKEN + r")\s+\d+\s+.*?\s+(\w+)\s*$")
+
+# Inline markdown
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+_ITALIC_RE = re.compile(r"\*([^*]+)\*")
+_CODE_SPAN_RE = re.compile(r"`([^`]+)`")
+# Bare URLs outside anchors that already exist (linear time; no lookbehind)
+_ANCHOR_OR_URL_RE = re.compile(r"(<a\b[^>]*>.*?</a>)|(https?://[^\s<>\"')\]]{1,4000})")
+
+_TABLE_OPEN_TAG = '<table border="1" cellpadding="4" cellspacing="0" style="border-collapse:collapse; width:100%">'
+
+
+class ReportRow(NamedTuple):
+    """
+    A JIRA row found in a report: key, reported status, (start, end) offsets of its line, and for
+    table rows the index of the status cell in line.split("|")[1:-1] (-1 for tab-separated lines).
+    """
+    jira_id: str
+    status: str
+    row_span: Tuple[int, int]
+    status_index: int = -1
+
+
+@dataclass
+class TableRow:
+    """One table line. cells are stripped, with the empty cells outside the outer pipes dropped."""
+    raw: str
+    cells: List[str]
+    span: Tuple[int, int]
+    is_separator: bool
+
+
+@dataclass
+class Block:
+    """A top-level element of the report. span covers its source lines (without the final newline)."""
+    kind: str
+    span: Tuple[int, int]
+    text: str = ""  # heading/list item text, stripped paragraph line
+    level: int = 0  # heading level; 1 for ordered list items
+    lines: List[str] = field(default_factory=list)  # code fence body
+    rows: List[TableRow] = field(default_factory=list)  # table rows
+
+    @property
+    def data_rows(self) -> List[TableRow]:
+        return [r for r in self.rows if not r.is_separator]
+
+
+@dataclass
+class Section:
+    """Blocks under one '## ' heading (title '' for the text before the first one)."""
+    title: str
+    kind: Optional[str]  # 'RFE', 'Bug' or None
+    blocks: List[Block]
+    span: Tuple[int, int]
+
+    @property
+    def tables(self) -> List[Block]:
+        return [b for b in self.blocks if b.kind == TABLE]
+
+
+def section_kind(title: str) -> Optional[str]:
+    """Classify a section title as 'RFE', 'Bug' or None."""
+    lower = (title or "").lower()
+    if "rfe" in lower or "enhancement" in lower:
+        return "RFE"
+    if "bug" in lower:
+        return "Bug"
+    return None
+
+
+def _split_cells(line: str) -> List[str]:
+    cells = [c.strip() for c in line.strip().split("|")]
+    if cells and cells[0] == "":
+        cells = cells[1:]
+    if cells and cells[-1] == "":
+        cells = cells[:-1]
+    return cells
+
+
+def _is_table_line(line: str) -> bool:
+    stripped = line.strip()
+    return bool(stripped) and stripped.count("|") >= 2
+
+
+def _known_jira_key(key: str) -> bool:
+    """True if key's project prefix is a known JIRA project (see hydra_search.JIRA_PROJECT_PREFIXES)."""
+    return key.rsplit("-", 1)[0] in _jira_prefix_set()
+
+
+@lru_cache(maxsize=1)
+def _jira_prefix_set() -> frozenset:
+    from .hydra_search import jira_project_prefixes
+    return frozenset(jira_project_prefixes())
+
+
+def _row_cells(raw: str) -> List[str]:
+    """Cells of a table line between its first and last pipe, unstripped (same indexes as update's split)."""
+    return raw.split("|")[1:-1]
+
+
+def _cell_jira_key(cell: str) -> Optional[str]:
+    """The known JIRA key a cell holds (KEY or [KEY](url)), or None."""
+    m = _KEY_CELL_RE.match(cell)
+    if m:
+        key = m.group(1) or m.group(2)
+        if _known_jira_key(key):
+            return key
+    return None
+
+
+def _column_roles(header_cells: List[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    (key column, status column) named by a table header, None where the header has none.
+    Key: a cell mentioning JIRA ("RED HAT JIRA ID", "JIRA ID"). Status: "JIRA Status" or
+    "Status/Notes" over a plain "Status", over any other status column ("Case Status"); the first
+    such cell wins within each rank.
+    """
+    key_col = status_col = None
+    status_rank = None
+    for i, cell in enumerate(header_cells):
+        name = inline_to_plain(cell).lower().strip()
+        if "status" in name:
+            if "jira" in name or name.replace(" ", "") == "status/notes":
+                rank = 0
+            elif name == "status":
+                rank = 1
+            else:
+                rank = 2
+            if status_rank is None or rank < status_rank:
+                status_col, status_rank = i, rank
+        elif "jira" in name and key_col is None:
+            key_col = i
+    return key_col, status_col
+
+
+def _last_status_cell(cells: List[str]) -> int:
+    """Index of the last cell, skipping a trailing 'Clones: ...' cell added by update."""
+    i = len(cells) - 1
+    while i > 0 and cells[i].strip().startswith("Clones:"):
+        i -= 1
+    return i
+
+
+class ReportDocument:
+    """A parsed report. Build with parse_report() / load_report()."""
+
+    def __init__(self, text: str, blocks: List[Block]):
+        self.text = text
+        self.blocks = blocks
+        self._rendered: Dict[str, str] = {}
+        self._sections: Optional[List[Section]] = None
+
+    # ----- structure -----
+
+    @property
+    def sections(self) -> List[Section]:
+        if self._sections is None:
+            sections: List[Section] = []
+            current = Section(title="", kind=None, blocks=[], span=(0, 0))
+            for block in self.blocks:
+                if block.kind == HEADING and block.level == 2:
+                    if current.blocks or current.title:
+                        sections.append(current)
+                    current = Section(title=block.text, kind=section_kind(block.text), blocks=[], span=block.span)
+                current.blocks.append(block)
+                current.span = (current.blocks[0].span[0], block.span[1])
+            if current.blocks or current.title:
+                sections.append(current)
+            self._sections = sections
+        return self._sections
+
+    @property
+    def tables(self) -> List[Block]:
+        return [b for b in self.blocks if b.kind == TABLE]
+
+    def iter_jira_rows(self) -> Iterator[ReportRow]:
+        """
+        Lazily yield every JIRA row (duplicates included) in document order.
+
+        Table rows count when a cell holds a known JIRA key, plain or as a [KEY](url) link. The
+        key and status columns come from the table's header row when it names them ("RED HAT
+        JIRA ID" / "JIRA ID", "Status/Notes" / "JIRA Status"), so the 4-column layout, legacy
+        5-column tables and layouts like | Case Number | JIRA ID | Summary | JIRA Status | Created |
+        all read the right cells. Without such a header any cell may hold the key and the status
+        is the last cell (ignoring a trailing Clones: cell). Lines without pipes are also matched
+        as tab/space separated exports (KEY, case number, ..., status word).
+        """
+        for block in self.blocks:
+            if block.kind == TABLE:
+                yield from self._table_jira_rows(block)
+            elif block.kind in (PARAGRAPH, LIST_ITEM):
+                line = self.text[block.span[0]:block.span[1]]
+                if "|" in line:
+                    continue
+                m = _TAB_ROW_RE.search(line)
+                if m and _known_jira_key(m.group(1)):
+                    yield ReportRow(m.group(1), m.group(2), block.span)
+
+    @staticmethod
+    def _table_jira_rows(block: Block) -> Iterator[ReportRow]:
+        rows = [r for r in block.rows if not r.is_separator]
+        key_col = status_col = None
+        if rows and not any(_cell_jira_key(c) for c in _row_cells(rows[0].raw)):
+            key_col, status_col = _column_roles(_row_cells(rows[0].raw))
+            rows = rows[1:]
+        for row in rows:
+            cells = _row_cells(row.raw)
+            if len(cells) < MIN_JIRA_ROW_CELLS:
+                continue
+            # The header's key column first, then any cell (as the old per-line regexes allowed)
+            order = list(range(len(cells)))
+            if key_col is not None and key_col < len(cells):
+                order.insert(0, key_col)
+            key_index = next((i for i in order if _cell_jira_key(cells[i])), None)
+            if key_index is None:
+                continue
+            if status_col is not None and status_col < len(cells) and status_col != key_index:
+                status_index = status_col
+            else:
+                status_index = _last_status_cell(cells)
+            if status_index == key_index:
+                continue
+            yield ReportRow(_cell_jira_key(cells[key_index]), cells[status_index].strip(), row.span, status_index)
+
+    def jira_issues(self) -> List[Tuple[str, str]]:
+        """(jira_id, reported_status) for the first occurrence of each key, in document order."""
+        seen = set()
+        issues = []
+        for row in self.iter_jira_rows():
+            if row.jira_id not in seen:
+                seen.add(row.jira_id)
+                issues.append((row.jira_id, row.status))
+        return issues
+
+    def summary_counts(self) -> Tuple[int, int]:
+        """(rfe_rows, bug_rows): data rows of the first and second 'RED HAT JIRA ID ... Description'
+        tables, skipping separator and placeholder (| | | |) rows."""
+        counts = [0, 0]
+        seen = 0
+        for table in self.tables:
+            rows = table.rows
+            for i, row in enumerate(rows):
+                if seen >= 2:
+                    break
+                if "RED HAT JIRA ID" in row.raw and "Description" in row.raw:
+                    index = seen
+                    seen += 1
+                    for data in rows[i + 1:]:
+                        stripped = data.raw.strip()
+                        if not stripped.startswith("|") or "|" not in stripped[1:]:
+                            break
+                        if _SEPARATOR_ROW_RE.match(stripped) or _PLACEHOLDER_ROW_RE.match(stripped):
+                            continue
+                        counts[index] += 1
+        return counts[0], counts[1]
+
+    # ----- renderers -----
+
+    def to_markdown(self) -> str:
+        return self.text
+
+    def to_html(self) -> str:
+        """HTML fragment (headings, lists, tables, code, inline bold/italic/code/links)."""
+        if "html" not in self._rendered:
+            self._rendered["html"] = self._render_html()
+        return self._rendered["html"]
+
+    def to_plain_text(self) -> str:
+        """Plain text with formatting stripped; tables become tab-separated rows."""
+        if "text" not in self._rendered:
+            self._rendered["text"] = self._render_plain_text()
+        return self._rendered["text"]
+
+    def to_csv(self) -> str:
+        """RFE and Bug table rows as CSV with a leading Section column (for Google Sheets etc.)."""
+        if "csv" not in self._rendered:
+            self._rendered["csv"] = self._render_csv()
+        return self._rendered["csv"]
+
+    def _blocks_skipping_blank_after_tables(self) -> Iterator[Block]:
+        previous = None
+        for block in self.blocks:
+            # The blank line that ends a table belongs to the table
+            if not (block.kind == BLANK and previous is not None and previous.kind == TABLE):
+                yield block
+            previous = block
+
+    def _render_html(self) -> str:
+        if not self.text.strip():
+            return ""
+        out: List[str] = []
+        in_list = False
+        for block in self._blocks_skipping_blank_after_tables():
+            if block.kind == LIST_ITEM:
+                if not in_list:
+                    out.append("<ul>")
+                    in_list = True
+                out.append("<li>" + inline_to_html(block.text) + "</li>")
+                continue
+            if in_list:
+                out.append("</ul>")
+                in_list = False
+            if block.kind == CODE:
+                out.append("<pre><code>")
+                out.extend(html_module.escape(line) + "\n" for line in block.lines)
+                out.append("</code></pre>")
+            elif block.kind == HEADING and block.level <= 3:
+                out.append(f"<h{block.level}>" + inline_to_html(block.text) + f"</h{block.level}>")
+            elif block.kind == HEADING:
+                out.append("<p>" + inline_to_html(self.text[block.span[0]:block.span[1]].strip()) + "</p>")
+            elif block.kind == RULE:
+                out.append("<hr/>")
+            elif block.kind == BLANK:
+                out.append("<p></p>")
+            elif block.kind == TABLE:
+                rows = block.data_rows
+                if not rows:
+                    continue
+                out.append(_TABLE_OPEN_TAG)
+                for row_idx, row in enumerate(rows):
+                    tag = "th" if row_idx == 0 else "td"
+                    out.append("<tr>")
+                    for c in row.cells:
+                        out.append("<" + tag + ">" + inline_to_html(c) + "</" + tag + ">")
+                    out.append("</tr>")
+                out.append("</table>")
+            else:
+                out.append("<p>" + inline_to_html(block.text) + "</p>")
+        if in_list:
+            out.append("</ul>")
+        return "\n".join(out)
+
+    def _render_plain_text(self) -> str:
+        if not self.text.strip():
+            return ""
+        out: List[str] = []
+        for block in self._blocks_skipping_blank_after_tables():
+            if block.kind == CODE:
+                out.extend(block.lines)
+            elif block.kind == TABLE:
+                for row in block.data_rows:
+                    out.append("\t".join(inline_to_plain(c) for c in row.cells))
+            elif block.kind == HEADING:
+                out.append(inline_to_plain(block.text))
+            elif block.kind in (RULE, BLANK):
+                out.append("")
+            elif block.kind == LIST_ITEM:
+                out.append("- " + inline_to_plain(block.text))
+            else:
+                out.append(inline_to_plain(block.text))
+        return "\n".join(out).strip() + "\n"
+
+    def _render_csv(self) -> str:
+        header_row = ("Section",) + REPORT_TABLE_COLUMNS
+        rows_out = []
+        current_section = None
+        table_header = None
+        for block in self.blocks:
+            if block.kind == HEADING and block.level == 2:
+                current_section = section_kind(block.text)
+                continue
+            if block.kind != TABLE:
+                continue
+            for row in block.data_rows:
+                cells = row.cells
+                if table_header is None and current_section == "RFE":
+                    table_header = cells
+                    continue
+                if table_header is not None and cells == table_header:
+                    continue
+                if current_section and table_header is not None:
+                    rows_out.append([current_section] + cells)
+        buf = io.StringIO()
+        w = csv.writer(buf)
+        w.writerow(header_row)
+        for row in rows_out:
+            w.writerow(row)
+        return buf.getvalue()
+
+
+def inline_to_html(s: str) -> str:
+    """Escape text and convert inline markdown: [text](url), **bold**, *italic*, `code`, bare URLs."""
+    s = html_module.escape(s or "")
+    s = _LINK_RE.sub(r'<a href="\2" target="_blank" rel="noopener">\1</a>', s)
+    s = _BOLD_RE.sub(r"<strong>\1</strong>", s)
+    s = _ITALIC_RE.sub(r"<em>\1</em>", s)
+    s = _CODE_SPAN_RE.sub(r"<code>\1</code>", s)
+
+    def linkify(m):
+        if m.group(1):
+            return m.group(1)
+        u = m.group(2)
+        return f'<a href="{u}" target="_blank" rel="noopener">{u}</a>'
+
+    return _ANCHOR_OR_URL_RE.sub(linkify, s)
+
+
+def inline_to_plain(s: str) -> str:
+    """Strip inline markdown (bold, italic, code, links keep their text)."""
+    s = _BOLD_RE.sub(r"\1", s or "")
+    s = _ITALIC_RE.sub(r"\1", s)
+    s = _CODE_SPAN_RE.sub(r"\1", s)
+    s = _LINK_RE.sub(r"\1", s)
+    return s.strip()
+
+
+def _parse_blocks(text: str) -> List[Block]:
+    # split("\n") rather than splitlines(): a trailing newline yields a final empty line, as in the
+    # renderers this replaced
+    lines = []
+    spans = []
+    offset = 0
+    for line in text.split("\n"):
+        body = line.rstrip("\r")
+        lines.append(body)
+        spans.append((offset, offset + len(body)))
+        offset += len(line) + 1
+
+    blocks: List[Block] = []
+    i = 0
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        start = spans[i][0]
+        if _FENCE_RE.match(line):
+            j = i + 1
+            while j < n and not _FENCE_RE.match(lines[j]):
+                j += 1
+            end = spans[min(j, n - 1)][1]
+            blocks.append(Block(CODE, (start, end), lines=lines[i + 1:j]))
+            i = j + 1
+            continue
+        m = _HEADING_RE.match(line)
+        if m:
+            blocks.append(Block(HEADING, spans[i], text=m.group(2).strip(), level=len(m.group(1))))
+            i += 1
+            continue
+        if _RULE_RE.match(line):
+            blocks.append(Block(RULE, spans[i]))
+            i += 1
+            continue
+        m = _LIST_ITEM_RE.match(line)
+        if m:
+            blocks.append(Block(LIST_ITEM, spans[i], text=line[m.end():].strip(), level=1 if m.group(2) else 0))
+            i += 1
+            continue
+        if not line.strip():
+            blocks.append(Block(BLANK, spans[i]))
+            i += 1
+            continue
+        if _is_table_line(line):
+            rows = []
+            j = i
+            while j < n and _is_table_line(lines[j]):
+                cells = _split_cells(lines[j])
+                is_sep = bool(cells) and all(_SEPARATOR_CELL_RE.match(c) for c in cells)
+                rows.append(TableRow(lines[j], cells, spans[j], is_sep))
+                j += 1
+            blocks.append(Block(TABLE, (start, spans[j - 1][1]), rows=rows))
+            i = j
+            continue
+        blocks.append(Block(PARAGRAPH, spans[i], text=line.strip()))
+        i += 1
+    return blocks
+
+
+@lru_cache(maxsize=32)
+def parse_report(text: str) -> ReportDocument:
+    """Parse report markdown into a ReportDocument (recent texts are cached)."""
+    text = text or ""
+    return ReportDocument(text, _parse_blocks(text))
+
+
+# Parsed documents per report file, invalidated by mtime/size
+_FILE_CACHE_SIZE = 32
+_file_cache: "OrderedDict[str, Tuple[Tuple[int, int], ReportDocument]]" = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+
+def load_report(path: Path) -> ReportDocument:
+    """Parse a report file, reusing the cached document while the file's mtime and size are unchanged."""
+    path = Path(path)
+    st = path.stat()
+    cache_key = str(path.resolve())
+    version = (st.st_mtime_ns, st.st_size)
+    with _file_cache_lock:
+        hit = _file_cache.get(cache_key)
+        if hit and hit[0] == version:
+            _file_cache.move_to_end(cache_key)
+            return hit[1]
+    # Through parse_report so a caller that later renders the same text reuses this document
+    doc = parse_report(path.read_text(encoding="utf-8", errors="replace"))
+    with _file_cache_lock:
+        _file_cache[cache_key] = (version, doc)
+        _file_cache.move_to_end(cache_key)
+        while len(_file_cache) > _FILE_CACHE_SIZE:
+            _file_cache.popitem(last=False)
+    return doc
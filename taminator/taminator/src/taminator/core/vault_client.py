@@ -22,11 +22,21 @@ Usage:
     # Check Vault status
     if vault_client.is_available():
         print("Vault is ready!")
+
+    # Read several tokens in one pass (parallel reads, cached)
+    tokens = vault_client.get_tokens(['jira', 'portal'])
+
+Health checks and secret reads are cached in memory: health for TAMINATOR_VAULT_HEALTH_TTL
+seconds (default 30), secrets for their lease_duration when Vault returns one, else
+TAMINATOR_VAULT_CACHE_TTL seconds (default 300). Writes and deletes through this client update
+the cache; clear_cache() drops it.
 """
 
 import os
-import requests
-from typing import Optional, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -37,6 +47,24 @@ except ImportError:
     console = None
 
 
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name) or default)
+    except ValueError:
+        return default
+
+
+# Seconds a health probe result is reused (a failed probe is retried sooner)
+HEALTH_CACHE_TTL = _env_seconds('TAMINATOR_VAULT_HEALTH_TTL', 30)
+HEALTH_FAILURE_TTL = min(HEALTH_CACHE_TTL, 10)
+# Seconds a secret is reused when Vault does not return a lease_duration (0 disables the cache)
+SECRET_CACHE_TTL = _env_seconds('TAMINATOR_VAULT_CACHE_TTL', 300)
+# Seconds a "no such secret" answer is reused
+SECRET_MISS_TTL = min(SECRET_CACHE_TTL, 60)
+# Parallel reads in get_tokens()
+MAX_PARALLEL_READS = 8
+
+
 @dataclass
 class VaultConfig:
     """Vault connection configuration. VAULT_ADDR is required for Vault use."""
@@ -69,33 +97,68 @@ class VaultClient:
     def __init__(self, config: Optional[VaultConfig] = None):
         """Initialize Vault client."""
         self.config = config or VaultConfig.from_env()
-        self._session = requests.Session()
-        # SSL: use VAULT_CACERT if set; else VAULT_SKIP_VERIFY=1 for dev (self-signed); else verify=True
-        cacert = os.environ.get('VAULT_CACERT')
-        skip = os.environ.get('VAULT_SKIP_VERIFY', '').lower() in ('1', 'true', 'yes')
-        if cacert:
-            self._session.verify = cacert
-        elif skip:
-            self._session.verify = False
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        else:
-            self._session.verify = True
+        self._session = None  # requests.Session, created on first request (see _http)
+        self._lock = threading.Lock()
+        self._health: Optional[Tuple[float, Dict[str, Any]]] = None  # (expires at, status dict)
+        self._secrets: Dict[str, Tuple[float, Optional[str]]] = {}  # service -> (expires at, token)
+
+    def _http(self):
+        """Keep-alive session for Vault requests. requests is imported here, not at module load,
+        so commands that never reach Vault (VAULT_ADDR unset) do not pay for it at startup."""
+        if self._session is not None:
+            return self._session
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PARALLEL_READS)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                # SSL: use VAULT_CACERT if set; else VAULT_SKIP_VERIFY=1 for dev (self-signed); else verify=True
+                cacert = os.environ.get('VAULT_CACERT')
+                skip = os.environ.get('VAULT_SKIP_VERIFY', '').lower() in ('1', 'true', 'yes')
+                if cacert:
+                    session.verify = cacert
+                elif skip:
+                    session.verify = False
+                    import urllib3
+                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                else:
+                    session.verify = True
+                self._session = session
+        return self._session
 
-    def is_available(self) -> bool:
-        """Check if Vault is accessible and unsealed."""
+    def is_available(self, refresh: bool = False) -> bool:
+        """Check if Vault is accessible and unsealed (cached for HEALTH_CACHE_TTL seconds)."""
         if not self.config.addr:
             return False
-        try:
-            response = self._session.get(
-                f"{self.config.addr}/v1/sys/health",
-                timeout=2
-            )
-            health = response.json()
-            return health.get('initialized') and not health.get('sealed')
-        except Exception:
-            return False
-    
+        status = self.get_status(refresh=refresh)
+        return bool(status.get('available') and status.get('initialized') and not status.get('sealed'))
+
+    def clear_cache(self) -> None:
+        """Forget cached health and secrets."""
+        with self._lock:
+            self._health = None
+            self._secrets.clear()
+
+    def _cached_secret(self, service: str) -> Optional[Tuple[float, Optional[str]]]:
+        with self._lock:
+            entry = self._secrets.get(service)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry
+            return None
+
+    def _cache_secret(self, service: str, token: Optional[str], ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._secrets[service] = (time.monotonic() + ttl, token)
+
+    def _forget_secret(self, service: str) -> None:
+        with self._lock:
+            self._secrets.pop(service, None)
+
     def get_token(self, service: str) -> Optional[str]:
         """
         Retrieve authentication token from Vault.
@@ -108,10 +171,13 @@ class VaultClient:
         """
         if not self.config.token:
             return None
+        cached = self._cached_secret(service)
+        if cached is not None:
+            return cached[1]
         
         try:
             secret_path = f"{self.config.namespace}/{service}"
-            response = self._session.get(
+            response = self._http().get(
                 f"{self.config.addr}/v1/{secret_path}",
                 headers={'X-Vault-Token': self.config.token},
                 timeout=5
@@ -119,8 +185,14 @@ class VaultClient:
             
             if response.status_code == 200:
                 data = response.json()
-                return data['data']['data'].get('token')
+                token = data['data']['data'].get('token')
+                # Honour the lease when the secrets engine sets one (KV returns 0 = no lease)
+                lease = data.get('lease_duration') or 0
+                self._cache_secret(service, token, min(lease, SECRET_CACHE_TTL) if lease > 0 else SECRET_CACHE_TTL)
+                return token
             
+            if response.status_code == 404:
+                self._cache_secret(service, None, SECRET_MISS_TTL)
             return None
             
         except Exception as e:
@@ -128,6 +200,37 @@ class VaultClient:
                 console.print(f"[yellow]⚠️  Vault read failed: {e}[/yellow]")
             return None
     
+    def get_tokens(self, services: Optional[Iterable[str]] = None) -> Dict[str, Optional[str]]:
+        """
+        Retrieve several tokens in one pass: cached ones from memory, the rest read in parallel.
+
+        Args:
+            services: Service names; default is every secret list_tokens() reports
+
+        Returns:
+            Dict of service -> token (None when Vault has no token for it)
+        """
+        if not self.config.token:
+            return {}
+        if services is None:
+            services = [k.rstrip('/') for k in self.list_tokens() if not k.endswith('/')]
+        services = list(dict.fromkeys(services))
+        out: Dict[str, Optional[str]] = {}
+        missing: List[str] = []
+        for service in services:
+            cached = self._cached_secret(service)
+            if cached is not None:
+                out[service] = cached[1]
+            else:
+                missing.append(service)
+        if len(missing) == 1:
+            out[missing[0]] = self.get_token(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_READS, len(missing))) as pool:
+                for service, token in zip(missing, pool.map(self.get_token, missing)):
+                    out[service] = token
+        return {service: out.get(service) for service in services}
+
     def set_token(self, service: str, token: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         Store authentication token in Vault.
@@ -157,16 +260,22 @@ class VaultClient:
             if metadata:
                 payload.update(metadata)
             
-            response = self._session.post(
+            response = self._http().post(
                 f"{self.config.addr}/v1/{secret_path}",
                 headers={'X-Vault-Token': self.config.token},
                 json={'data': payload},
                 timeout=5
             )
             
-            return response.status_code in [200, 204]
+            ok = response.status_code in [200, 204]
+            if ok:
+                self._cache_secret(service, token, SECRET_CACHE_TTL)
+            else:
+                self._forget_secret(service)
+            return ok
             
         except Exception as e:
+            self._forget_secret(service)
             if console:
                 console.print(f"[red]❌ Vault write failed: {e}[/red]")
             return False
@@ -178,7 +287,7 @@ class VaultClient:
         
         try:
             secret_path = f"{self.config.namespace}/{service}"
-            response = self._session.delete(
+            response = self._http().delete(
                 f"{self.config.addr}/v1/{secret_path}",
                 headers={'X-Vault-Token': self.config.token},
                 timeout=5
@@ -186,6 +295,8 @@ class VaultClient:
             return response.status_code in [200, 204]
         except Exception:
             return False
+        finally:
+            self._forget_secret(service)
     
     def list_tokens(self) -> list:
         """List all tokens stored in Vault."""
@@ -193,7 +304,7 @@ class VaultClient:
             return []
         
         try:
-            response = self._session.get(
+            response = self._http().get(
                 f"{self.config.addr}/v1/{self.config.namespace}?list=true",
                 headers={'X-Vault-Token': self.config.token},
                 timeout=5
@@ -208,28 +319,37 @@ class VaultClient:
         except Exception:
             return []
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get Vault connection status."""
+    def get_status(self, refresh: bool = False) -> Dict[str, Any]:
+        """Get Vault connection status (cached for HEALTH_CACHE_TTL seconds unless refresh)."""
+        if not refresh:
+            with self._lock:
+                if self._health is not None and self._health[0] > time.monotonic():
+                    return dict(self._health[1])
         try:
-            response = self._session.get(
+            response = self._http().get(
                 f"{self.config.addr}/v1/sys/health",
                 timeout=2
             )
             health = response.json()
             
-            return {
+            status = {
                 'available': True,
                 'initialized': health.get('initialized', False),
                 'sealed': health.get('sealed', True),
                 'version': health.get('version', 'unknown'),
                 'addr': self.config.addr
             }
+            ttl = HEALTH_CACHE_TTL if status['initialized'] and not status['sealed'] else HEALTH_FAILURE_TTL
         except Exception as e:
-            return {
+            status = {
                 'available': False,
                 'error': str(e),
                 'addr': self.config.addr
             }
+            ttl = HEALTH_FAILURE_TTL
+        with self._lock:
+            self._health = (time.monotonic() + ttl, status)
+        return dict(status)
 
 
 # Global Vault client instance
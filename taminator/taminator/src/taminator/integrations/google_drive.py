@@ -36,6 +36,9 @@ try:
 except ImportError:
     _HAS_MARKDOWN = False
 
+from ..core.progress import report_progress
+from ..core.report_model import parse_report
+
 SCOPES = [
     "https://www.googleapis.com/auth/drive.file",
     "https://www.googleapis.com/auth/gmail.compose",
@@ -136,76 +139,10 @@ def _markdown_to_html(text: str) -> str:
 
 
 def _markdown_to_html_fallback(text: str) -> str:
-    """Simple markdown-to-HTML so Gmail drafts are never sent as raw markdown.
-    Handles headers, bold, lists, and line breaks. Used when the markdown lib
-    is unavailable or returns empty."""
-    if not (text or "").strip():
-        return ""
-    html: List[str] = []
-    in_list = False
-    for line in text.split("\n"):
-        stripped = line.strip()
-        # Headers (atx-style)
-        if stripped.startswith("### "):
-            if in_list:
-                html.append("</ul>")
-                in_list = False
-            html.append(f"<h3>{_escape_html(stripped[4:])}</h3>")
-        elif stripped.startswith("## "):
-            if in_list:
-                html.append("</ul>")
-                in_list = False
-            html.append(f"<h2>{_escape_html(stripped[3:])}</h2>")
-        elif stripped.startswith("# "):
-            if in_list:
-                html.append("</ul>")
-                in_list = False
-            html.append(f"<h1>{_escape_html(stripped[2:])}</h1>")
-        elif stripped.startswith("- ") or stripped.startswith("* "):
-            if not in_list:
-                html.append("<ul>")
-                in_list = True
-            html.append(f"<li>{_inline_md_to_html(stripped[2:])}</li>")
-        elif re.match(r"^\d+\.\s", stripped):
-            if in_list:
-                html.append("</ul>")
-                in_list = False
-            rest = re.sub(r"^\d+\.\s*", "", stripped)
-            html.append(f"<p>{_inline_md_to_html(rest)}</p>")
-        elif stripped == "":
-            if in_list:
-                html.append("</ul>")
-                in_list = False
-            html.append("<br>")
-        else:
-            if in_list:
-                html.append("</ul>")
-                in_list = False
-            html.append(f"<p>{_inline_md_to_html(stripped)}</p>")
-    if in_list:
-        html.append("</ul>")
-    return "\n".join(html)
-
-
-def _escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-    )
-
-
-def _inline_md_to_html(s: str) -> str:
-    """Convert inline markdown (bold, italic) to HTML."""
-    s = _escape_html(s)
-    # **bold** and __bold__
-    s = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", s)
-    s = re.sub(r"__(.+?)__", r"<strong>\1</strong>", s)
-    # *italic* and _italic_
-    s = re.sub(r"\*(.+?)\*", r"<em>\1</em>", s)
-    s = re.sub(r"_(.+?)_", r"<em>\1</em>", s)
-    return s
+    """Simple markdown-to-HTML so Docs and Gmail drafts are never sent as raw markdown.
+    Renders headers, lists, report tables and inline bold/italic/links through the shared
+    report model. Used when the markdown lib is unavailable or returns empty."""
+    return parse_report(text or "").to_html()
 
 
 # Inline styles matching Google Docs when pasted into Gmail (font, sizes, margins).
@@ -315,6 +252,7 @@ def backup_reports_to_drive(files: List[dict]) -> dict:
         media = MediaInMemoryUpload(content.encode("utf-8"), mimetype="text/markdown", resumable=False)
         service.files().create(body=body, media_body=media).execute()
         count += 1
+        report_progress("google_backup", count, len(files), name)
     return {"folder_id": folder_id, "url": url, "count": count}
 
 
@@ -0,0 +1,133 @@
+"""
+Compiled account filters (universal_account_filter.compile_filters) against the per-type matchers
+UniversalAccountFilter used before filters were compiled.
+"""
+
+import json
+import random
+import re
+from datetime import datetime, timedelta, timezone
+
+from universal_account_filter import AccountFilter, FilterType, compile_filters
+
+
+def _legacy_matches(case, filter_obj):
+    """The pre-compilation UniversalAccountFilter._case_matches_filter, per filter type."""
+    values = filter_obj.value if isinstance(filter_obj.value, list) else [filter_obj.value]
+    try:
+        if filter_obj.filter_type == FilterType.SBR_GROUP:
+            case_sbr = case.get('sbr_group', '').strip()
+            if filter_obj.operator == "in_list":
+                for value in values:
+                    if not filter_obj.case_sensitive:
+                        if value.lower() in case_sbr.lower():
+                            return True
+                    elif value in case_sbr:
+                        return True
+            return False
+        if filter_obj.filter_type == FilterType.CASE_STATUS:
+            case_status = case.get('status', '').strip()
+            if filter_obj.operator == "in_list":
+                for value in values:
+                    if not filter_obj.case_sensitive:
+                        if value.lower() == case_status.lower():
+                            return True
+                    elif value == case_status:
+                        return True
+            return False
+        if filter_obj.filter_type == FilterType.DATE_RANGE:
+            try:
+                case_date_str = case.get('created_date', case.get('updated_date', ''))
+                if not case_date_str:
+                    return True
+                case_date = datetime.fromisoformat(case_date_str.replace('Z', '+00:00'))
+                if filter_obj.operator == "within_days":
+                    cutoff_date = datetime.now() - timedelta(days=filter_obj.value.get('days', 30))
+                    return case_date >= cutoff_date
+            except Exception:
+                pass
+            return True
+        if filter_obj.filter_type == FilterType.CUSTOM_FILTER:
+            try:
+                if filter_obj.operator == "regex":
+                    text = json.dumps(case).lower() if not filter_obj.case_sensitive else json.dumps(case)
+                    return bool(re.search(filter_obj.value, text))
+            except Exception:
+                pass
+            return True
+        return True
+    except Exception:
+        return True
+
+
+def _legacy_apply(filters, cases):
+    for filter_obj in filters:
+        if filter_obj.enabled:
+            cases = [c for c in cases if _legacy_matches(c, filter_obj)]
+    return cases
+
+
+SBRS = ["Ansible", "Ansible Automation Platform", "OpenShift", "RHEL", ""]
+STATUSES = ["Waiting on Red Hat", "waiting on customer", "Closed", "New", ""]
+
+
+def _synthetic_cases(n, aware):
+    rng = random.Random(23)
+    now = datetime.now()
+    cases = []
+    for i in range(n):
+        when = now - timedelta(days=rng.randint(0, 120), hours=rng.randint(0, 23))
+        date = when.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ") if aware else when.isoformat()
+        case = {
+            'case_number': f"{4000000 + i:08d}",
+            'sbr_group': rng.choice(SBRS),
+            'status': rng.choice(STATUSES),
+            'summary': rng.choice(["upgrade fails", "RFE: add option", "controller crash"]),
+        }
+        if rng.random() > 0.1:
+            case['created_date'] = date
+        cases.append(case)
+    return cases
+
+
+FILTER_SETS = [
+    [AccountFilter(FilterType.SBR_GROUP, ["ansible"], "in_list")],
+    [AccountFilter(FilterType.SBR_GROUP, ["Ansible", "RHEL"], "in_list", case_sensitive=True)],
+    [AccountFilter(FilterType.CASE_STATUS, ["waiting on red hat", "New"], "in_list")],
+    [AccountFilter(FilterType.CASE_STATUS, ["Waiting on Red Hat"], "in_list", case_sensitive=True),
+     AccountFilter(FilterType.SBR_GROUP, ["openshift"], "in_list")],
+    [AccountFilter(FilterType.SBR_GROUP, "Ansible", "equals")],
+    [AccountFilter(FilterType.DATE_RANGE, {'days': 30}, "within_days"),
+     AccountFilter(FilterType.CASE_STATUS, ["closed"], "in_list", enabled=False)],
+    [AccountFilter(FilterType.CUSTOM_FILTER, "rfe:", "regex"),
+     AccountFilter(FilterType.SBR_GROUP, ["ansible"], "in_list")],
+    [AccountFilter(FilterType.CUSTOM_FILTER, "(unclosed", "regex")],
+]
+
+
+def test_compiled_filters_match_legacy_matchers():
+    cases = _synthetic_cases(2000, aware=False)
+    for filters in FILTER_SETS:
+        predicate = compile_filters(filters)
+        assert [c for c in cases if predicate(c)] == _legacy_apply(filters, cases), filters
+
+
+def test_aware_dates_are_compared_with_an_aware_cutoff():
+    """Hydra dates ("...Z") used to raise against the naive cutoff, so every case passed."""
+    cases = _synthetic_cases(500, aware=True)
+    filters = [AccountFilter(FilterType.DATE_RANGE, {'days': 30}, "within_days")]
+    cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    kept = [c for c in cases if compile_filters(filters)(c)]
+
+    assert _legacy_apply(filters, cases) == cases
+    assert kept == [
+        c for c in cases
+        if 'created_date' not in c or datetime.fromisoformat(c['created_date'].replace('Z', '+00:00')) >= cutoff
+    ]
+    assert len(kept) < len(cases)
+
+
+def test_case_insensitive_regex_ignores_pattern_case():
+    filters = [AccountFilter(FilterType.CUSTOM_FILTER, "RFE:", "regex")]
+    cases = [{'summary': "RFE: add option"}, {'summary': "rfe: lower"}, {'summary': "crash"}]
+    assert [c for c in cases if compile_filters(filters)(c)] == cases[:2]
@@ -0,0 +1,132 @@
+"""
+Local Hydra case store (core.case_store) and incremental sync (hydra_search.sync_cases).
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from taminator.core import case_store, hydra_search
+from taminator.core.case_store import CaseStore
+
+STARTED = datetime(2026, 6, 1, 12, 0, 0)
+
+
+def _row(number, status="Waiting on Red Hat", summary="Summary"):
+    return (number, summary, status, "", "unknown")
+
+
+def _doc(number, modified, status="Waiting on Red Hat"):
+    return {"case_number": number, "case_summary": f"Case {number}", "case_status": status,
+            "case_lastModifiedDate": modified}
+
+
+@pytest.fixture
+def store_path(tmp_path, monkeypatch):
+    path = tmp_path / "case_store.json"
+    monkeypatch.setattr(case_store, "_default_store_path", lambda: path)
+    for name in ("TAMINATOR_NO_CASE_STORE", "TAMINATOR_CASE_SYNC_FULL", "TAMINATOR_CASE_SYNC_MAX_AGE_DAYS"):
+        monkeypatch.delenv(name, raising=False)
+    return path
+
+
+def test_replace_records_watermark_and_window(store_path):
+    store = CaseStore(["123"])
+    assert store.needs_full_sync("2026-05-01")
+    store.replace([(_row("001"), "2026-05-20T00:00:00Z")], "2026-05-01", STARTED)
+    store.save()
+
+    store = CaseStore(["123"])
+    assert store.watermark == "2026-06-01T12:00:00Z"
+    assert not store.needs_full_sync("2026-05-01")
+    assert store.needs_full_sync("2026-04-01")  # wider window than the last full sync covered
+    assert store.needs_full_sync("2026-05-01", now=time.time() + 30 * 86400)
+    assert store.delta_since() == "2026-06-01T11:50:00Z"
+
+
+def test_merge_upserts_and_drops_closed(store_path):
+    store = CaseStore(["123"])
+    store.replace([(_row("001"), "2026-05-20T00:00:00Z"), (_row("002"), "2026-05-21T00:00:00Z")],
+                  "2026-05-01", STARTED)
+    changed = store.merge([
+        (_row("001"), "2026-05-20T00:00:00Z"),                    # unchanged
+        (_row("002", status="Closed"), "2026-06-02T00:00:00Z"),   # closed since the last sync
+        (_row("003"), "2026-06-02T00:00:00Z"),                    # new
+    ], started=datetime(2026, 6, 2, 12, 0, 0))
+    assert changed == 2
+    assert [r[0] for r in store.rows("2026-05-01", 500)] == ["001", "003"]
+    assert store.watermark == "2026-06-02T12:00:00Z"
+
+    kept = CaseStore(["123"], include_closed=True, store_file=store_path.parent / "other.json")
+    kept.merge([(_row("002", status="Closed"), "2026-06-02T00:00:00Z")])
+    assert [r[2] for r in kept.rows("2026-05-01", 500)] == ["Closed"]
+
+
+def test_rows_keep_newest_in_case_number_order(store_path):
+    store = CaseStore(["123"])
+    store.replace([
+        (_row("003"), "2026-05-03T00:00:00Z"),
+        (_row("001"), "2026-05-10T00:00:00Z"),
+        (_row("002"), "2026-05-01T00:00:00Z"),
+        (_row("004"), "2026-04-01T00:00:00Z"),  # before the window
+    ], "2026-03-01", STARTED)
+    assert [r[0] for r in store.rows("2026-04-15", 500)] == ["001", "002", "003"]
+    assert [r[0] for r in store.rows("2026-04-15", 2)] == ["001", "003"]
+
+
+def test_save_keeps_other_scopes(store_path):
+    first = CaseStore(["123"])
+    first.replace([(_row("001"), "2026-05-20T00:00:00Z")], "2026-05-01", STARTED)
+    first.save()
+    second = CaseStore(["456"], products=["Ansible"])
+    second.replace([(_row("002"), "2026-05-20T00:00:00Z")], "2026-05-01", STARTED)
+    second.save()
+    assert len(CaseStore(["123"])) == 1 and len(CaseStore(["456"], products=["ansible"])) == 1
+
+
+def _fake_hydra(monkeypatch, responses, calls):
+    """Serve each _search_all_pages call from responses ([(docs, numFound)]), recording its arguments."""
+    def fake(query, max_rows, **kwargs):
+        if kwargs.get("profile") is None:
+            return [], {}  # full-doc refetch of rows without a JIRA key: nothing more to find
+        calls.append({"query": query, "max_rows": max_rows, **kwargs})
+        docs, num_found = responses.pop(0)
+        return docs[:max_rows], {"response": {"numFound": num_found, "docs": docs[:hydra_search.HYDRA_PAGE_SIZE]}}
+    monkeypatch.setattr(hydra_search, "_search_all_pages", fake)
+
+
+def test_sync_large_scope_records_watermark(store_path, monkeypatch):
+    """A scope with more cases than max_rows pages the whole window once, then runs deltas."""
+    calls = []
+    full_docs = [_doc(f"{n:08d}", f"2026-05-{1 + n % 28:02d}T00:00:00Z") for n in range(600)]
+    _fake_hydra(monkeypatch, [(full_docs, 600), ([_doc("99999999", "2026-06-01T00:00:00Z")], 1)], calls)
+
+    cases, info = hydra_search.sync_cases(token="t", account_numbers=["123"], months_back=12, max_rows=500)
+    assert info == {"mode": "full", "fetched": 600, "changed": 600}
+    assert len(cases) == 500
+    assert calls[0]["max_rows"] >= 600 and calls[0]["sort"] == hydra_search.CASE_SYNC_SORT
+    assert CaseStore(["123"]).watermark is not None
+
+    cases, info = hydra_search.sync_cases(token="t", account_numbers=["123"], months_back=12, max_rows=500)
+    assert info["mode"] == "delta" and info["changed"] == 1
+    assert "case_lastModifiedDate:[" in calls[1]["query"]
+    assert "99999999" in [c[0] for c in cases]
+
+
+def test_sync_truncated_delta_forces_full_sync(store_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(hydra_search, "CASE_SYNC_MAX_DOCS", 2)
+    _fake_hydra(monkeypatch, [
+        ([_doc("001", "2026-05-01T00:00:00Z")], 1),
+        ([_doc("002", "2026-06-01T00:00:00Z"), _doc("003", "2026-06-01T00:00:00Z")], 5),
+        ([_doc("001", "2026-05-01T00:00:00Z")], 1),
+    ], calls)
+
+    hydra_search.sync_cases(token="t", account_numbers=["123"], months_back=12, max_rows=2)
+    cases, info = hydra_search.sync_cases(token="t", account_numbers=["123"], months_back=12, max_rows=2)
+    assert info["mode"] == "delta" and {c[0] for c in cases} == {"002", "003"}
+    assert CaseStore(["123"]).watermark is None
+
+    _, info = hydra_search.sync_cases(token="t", account_numbers=["123"], months_back=12, max_rows=2)
+    assert info["mode"] == "full"
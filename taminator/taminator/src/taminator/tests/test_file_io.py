@@ -0,0 +1,44 @@
+"""
+Atomic writes and the shared JSON cache file (core.file_io).
+"""
+
+import json
+
+from taminator.core.file_io import JsonFileCache
+
+
+def test_json_file_cache_keeps_other_writers_entries(tmp_path):
+    path = tmp_path / "cache.json"
+    first = JsonFileCache(path, "entries")
+    second = JsonFileCache(path, "entries")
+    first.put("a", 1)
+    first.save()
+    second.put("b", 2)
+    second.save()
+
+    assert json.loads(path.read_text()) == {"entries": {"a": 1, "b": 2}}
+    assert second.get("a") == 1
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_json_file_cache_merge_and_keep(tmp_path):
+    path = tmp_path / "cache.json"
+    first = JsonFileCache(path, "entries")
+    second = JsonFileCache(path, "entries")
+    first.put("a", [1])
+    first.put("old", [0])
+    first.save()
+    second.put("a", [2])
+    second.save(keep=lambda key, entry: key != "old", merge=lambda key, on_disk, ours: on_disk + ours)
+
+    assert json.loads(path.read_text()) == {"entries": {"a": [1, 2]}}
+
+
+def test_json_file_cache_ignores_unreadable_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("not json")
+    cache = JsonFileCache(path, "entries")
+    assert cache.get("a") is None
+    cache.save()  # nothing changed: the file is left alone
+    assert path.read_text() == "not json"
@@ -0,0 +1,46 @@
+"""
+Hydra field projection (core.hydra_search): full-doc fallback for rows without a JIRA key.
+"""
+
+from taminator.core import hydra_search
+
+
+def test_refetch_docs_without_jira(monkeypatch):
+    monkeypatch.delenv("TAMINATOR_HYDRA_FULL_DOCS", raising=False)
+    monkeypatch.delenv("TAMINATOR_DEBUG_HYDRA_JIRA", raising=False)
+    requested = []
+
+    def fake_by_numbers(case_numbers=None, profile="report-row", **kwargs):
+        requested.append((list(case_numbers), profile))
+        return [{"case_number": "002", "case_summary": "No key here", "case_custom_links": [{"key": "AAP-7"}]}]
+
+    monkeypatch.setattr(hydra_search, "search_cases_by_case_numbers", fake_by_numbers)
+    docs = [
+        {"case_number": "001", "case_summary": "Broken AAP-1"},
+        {"case_number": "002", "case_summary": "No key here"},
+        {"case_number": "003", "case_summary": "Nothing", "case_jira_key": "AAP-3"},
+    ]
+    rows = [hydra_search.format_doc_for_report(d)
+            for d in hydra_search.refetch_docs_without_jira(docs, "report-row", token="t")]
+
+    assert requested == [(["002"], None)]
+    assert [(r[0], r[3]) for r in rows] == [("001", "AAP-1"), ("002", "AAP-7"), ("003", "AAP-3")]
+
+
+def test_full_doc_profiles_are_not_refetched(monkeypatch):
+    monkeypatch.setenv("TAMINATOR_HYDRA_FULL_DOCS", "1")
+    monkeypatch.setattr(hydra_search, "search_cases_by_case_numbers", lambda **kwargs: 1 / 0)
+    docs = [{"case_number": "001", "case_summary": "No key"}]
+    assert hydra_search.refetch_docs_without_jira(docs, "report-row", token="t") is docs
+    assert hydra_search.refetch_docs_without_jira(docs, None, token="t") is docs
+
+
+def test_jira_ids_from_doc_scans_whole_doc():
+    doc = {
+        "case_number": "001",
+        "case_summary": "Upgrade fails, see AAP-2",
+        "case_jira_key": "AAP-1",
+        "case_comments": [{"text": "cloned to AAPRFE-3"}, {"links": {"key": "AAP-1"}}],
+    }
+    assert hydra_search.jira_ids_from_doc(doc) == ["AAP-1", "AAP-2", "AAPRFE-3"]
+    assert hydra_search.jira_ids_from_doc(doc)[0] == hydra_search.format_doc_for_report(doc)[3]
@@ -0,0 +1,79 @@
+"""
+On-disk JIRA issue cache (core.jira_cache): revalidation window and max-age expiry.
+"""
+
+import json
+import time
+
+from taminator.core import jira_cache
+from taminator.core.jira_cache import JiraIssueCache
+
+BASE_URL = "https://issues.example.com/rest/api/2"
+HOUR = 3600
+
+
+def _info(key, status="New", updated="2026-01-01T00:00:00.000+0000"):
+    return {"key": key, "status": status, "updated": updated}
+
+
+def test_revalidation_window_covers_oldest_sync(tmp_path):
+    cache = JiraIssueCache(BASE_URL, tmp_path / "jira_cache.json")
+    now = time.time()
+    cache.put("AAP-1", _info("AAP-1"), now - 2 * HOUR)
+    cache.put("AAP-2", _info("AAP-2"), now - 30 * 60)
+    assert cache.revalidation_window_minutes(["AAP-1", "AAP-2"], now) == 120 + jira_cache.SYNC_MARGIN_MINUTES
+    assert cache.revalidation_window_minutes(["AAP-1", "AAP-3"], now) is None
+
+    cache.touch(["AAP-1"], now)
+    assert cache.revalidation_window_minutes(["AAP-1", "AAP-2"], now) == 30 + jira_cache.SYNC_MARGIN_MINUTES
+
+
+def test_touch_does_not_extend_max_age(tmp_path, monkeypatch):
+    monkeypatch.delenv("TAMINATOR_JIRA_CACHE_MAX_AGE_HOURS", raising=False)
+    cache = JiraIssueCache(BASE_URL, tmp_path / "jira_cache.json")
+    now = time.time()
+    max_age = jira_cache.DEFAULT_MAX_ENTRY_AGE_HOURS * HOUR
+    cache.put("AAP-1", _info("AAP-1"), now - 25 * HOUR)
+    cache.put("AAP-2", _info("AAP-2"), now - max_age - HOUR)
+    cache.touch(["AAP-1", "AAP-2"], now)
+
+    # A nightly run still finds yesterday's download; a key not downloaded for longer than the max
+    # age is treated as missing even though revalidation kept confirming it
+    assert cache.get("AAP-1") == _info("AAP-1")
+    assert cache.get("AAP-2") is None
+
+
+def test_save_drops_expired_entries_and_merges_with_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv("TAMINATOR_JIRA_CACHE_MAX_AGE_HOURS", "48")
+    path = tmp_path / "jira_cache.json"
+    now = time.time()
+
+    other = JiraIssueCache(BASE_URL, path)
+    other.put("AAP-1", _info("AAP-1", status="Closed"), now - HOUR)
+    other.put("AAP-3", _info("AAP-3"), now - HOUR)
+    other.save()
+
+    cache = JiraIssueCache(BASE_URL, path)
+    cache.put("AAP-1", _info("AAP-1", status="New"), now - 2 * HOUR)
+    cache.put("AAP-2", _info("AAP-2"), now - 72 * HOUR)
+    cache.save()
+
+    issues = json.loads(path.read_text())["instances"][BASE_URL]["issues"]
+    assert sorted(issues) == ["AAP-1", "AAP-3"]
+    assert issues["AAP-1"]["info"]["status"] == "Closed"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["jira_cache.json"]
+
+
+def test_error_results_are_not_cached(tmp_path):
+    cache = JiraIssueCache(BASE_URL, tmp_path / "jira_cache.json")
+    cache.put("AAP-1", {"key": "AAP-1", "status": "NOT_FOUND"}, time.time())
+    cache.put("AAP-2", {"key": "AAP-2", "status": "ERROR"}, time.time())
+    assert cache.get("AAP-1") is None and cache.get("AAP-2") is None
+
+
+def test_malformed_max_age_uses_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("TAMINATOR_JIRA_CACHE_MAX_AGE_HOURS", "a week")
+    cache = JiraIssueCache(BASE_URL, tmp_path / "jira_cache.json")
+    cache.put("AAP-1", _info("AAP-1"), time.time() - 100 * HOUR)
+    assert cache.get("AAP-1") is not None
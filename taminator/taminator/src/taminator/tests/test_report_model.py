@@ -0,0 +1,63 @@
+"""
+JIRA row extraction from report tables (core.report_model).
+"""
+
+from pathlib import Path
+
+from taminator.core.report_model import parse_report
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[3] / "templates"
+
+
+def test_standardized_template_rows():
+    """| Case Number | JIRA ID | Summary | JIRA Status | Created |: key in the 2nd column."""
+    text = (TEMPLATES_DIR / "rfe_bug_report_standardized.md").read_text(encoding="utf-8")
+    issues = parse_report(text).jira_issues()
+    assert len(issues) == 22
+    assert issues[0] == ("AAP-12345", "New")
+    assert all(status == "New" for _, status in issues)
+
+
+def test_report_layouts_status_column():
+    text = (
+        "| RED HAT JIRA ID | Support Case | Description | Status/Notes |\n"
+        "|---|---|---|---|\n"
+        "| [AAP-1](https://issues.redhat.com/browse/AAP-1) | 123 | Desc | New | Clones: AAP-9 |\n"
+        "\n"
+        "| RED HAT JIRA ID | Support Case | Enhancement Request | Owner | Status |\n"
+        "|---|---|---|---|---|\n"
+        "| AAP-2 | 456 | Enh | someone | In Progress |\n"
+        "\n"
+        "| # | JIRA | Case | Description | Status |\n"
+        "|---|---|---|---|---|\n"
+        "| 1 | AAP-3 | 789 | Desc | Closed |\n"
+    )
+    rows = list(parse_report(text).iter_jira_rows())
+    assert [(r.jira_id, r.status, r.status_index) for r in rows] == [
+        ("AAP-1", "New", 3),
+        ("AAP-2", "In Progress", 4),
+        ("AAP-3", "Closed", 4),
+    ]
+
+
+def test_table_without_header_uses_last_cell():
+    text = "| AAP-4 | 123 | Desc | Backlog | Clones: AAP-8 |\n"
+    rows = list(parse_report(text).iter_jira_rows())
+    assert [(r.jira_id, r.status, r.status_index) for r in rows] == [("AAP-4", "Backlog", 3)]
+
+
+def test_jira_status_column_preferred_over_case_status():
+    text = (
+        "| Case | Case Status | JIRA ID | Summary | JIRA Status |\n"
+        "|---|---|---|---|---|\n"
+        "| 123 | Waiting on Red Hat | AAP-5 | Desc | Review |\n"
+        "\n"
+        "| JIRA ID | Case Status | Status | Owner |\n"
+        "|---|---|---|---|\n"
+        "| AAP-6 | Closed | Backlog | someone |\n"
+    )
+    rows = list(parse_report(text).iter_jira_rows())
+    assert [(r.jira_id, r.status, r.status_index) for r in rows] == [
+        ("AAP-5", "Review", 4),
+        ("AAP-6", "Backlog", 2),
+    ]
@@ -12,6 +12,8 @@ import json
 import yaml
 import argparse
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -21,6 +23,18 @@ from customer_template_renderer import CustomerTemplateRenderer
 from redhat_cppg_api_client import RedHatCPPGAPIClient
 from rfe_discussion_api_client import RFEDiscussionAPIClient
 
+def _pipeline_max_workers() -> int:
+    try:
+        return max(1, int(os.environ.get('TAMINATOR_PORTAL_WORKERS') or 4))
+    except ValueError:
+        return 4
+
+
+# Customers discovered and rendered at the same time in process_all_customers (TAMINATOR_PORTAL_WORKERS)
+PIPELINE_MAX_WORKERS = _pipeline_max_workers()
+# Concurrent portal posts; the per-endpoint rate limiter in RFEDiscussionAPIClient sets the actual pace
+POST_MAX_WORKERS = 2
+
 class UltimateRFEPortalSystem:
     """Complete RFE automation system"""
     
@@ -113,6 +127,16 @@ class UltimateRFEPortalSystem:
         Returns:
             Dict with processing results
         """
+        return self._post_and_save(self._prepare_customer(customer_key), test_mode)
+    
+    def _prepare_customer(self, customer_key: str) -> Dict[str, Any]:
+        """
+        Steps 1-2 for one customer: discover cases and render portal content. Safe to run for
+        several customers at once; errors are returned in the dict (key 'error'), not raised.
+        """
+        started = time.monotonic()
+        prepared = {'customer_key': customer_key, 'timings': {}}
+        timings = prepared['timings']
         try:
             self.logger.info(f"Processing RFE automation for {customer_key}")
             
@@ -124,37 +148,67 @@ class UltimateRFEPortalSystem:
             customer_name = customer_config.get('name', customer_key.title())
             account_number = customer_config.get('account_number')
             group_id = customer_config.get('group_id')
+            prepared.update(customer_name=customer_name, account_number=account_number, group_id=group_id)
             
             if not account_number:
                 raise ValueError(f"No account number configured for {customer_key}")
             
             # Step 1: Discover cases
             self.logger.info(f"Step 1: Discovering cases for {customer_name}")
+            step_started = time.monotonic()
             case_report = self.case_system.generate_case_report(
                 customer_account=account_number,
                 customer_name=customer_name,
                 months=1,
                 sbr_groups=["Ansible", "Ansible Automation Platform"]
             )
+            timings['discover_seconds'] = round(time.monotonic() - step_started, 3)
             
             if case_report.get('error'):
                 raise Exception(f"Case discovery failed: {case_report['error']}")
+            prepared['case_report'] = case_report
             
             # Step 2: Generate portal content
             self.logger.info(f"Step 2: Generating portal content for {customer_name}")
-            portal_content = self.template_renderer.render_portal_content(
+            step_started = time.monotonic()
+            prepared['portal_content'] = self.template_renderer.render_portal_content(
                 cases=case_report['cases']['all'],
                 customer_name=customer_name,
                 template_key=customer_key
             )
+            timings['render_seconds'] = round(time.monotonic() - step_started, 3)
+        except Exception as e:
+            self.logger.error(f"Error processing customer {customer_key}: {e}")
+            prepared['error'] = str(e)
+        prepared['started'] = started
+        return prepared
+    
+    def _post_and_save(self, prepared: Dict[str, Any], test_mode: bool) -> Dict[str, Any]:
+        """Steps 3-5 for one prepared customer: post (rate limited by the RFE client), build and save results."""
+        customer_key = prepared['customer_key']
+        timings = prepared['timings']
+        if prepared.get('error'):
+            return {
+                'customer_key': customer_key,
+                'error': prepared['error'],
+                'success': False,
+                'processing_timestamp': datetime.now().isoformat(),
+                'timings': timings,
+            }
+        try:
+            customer_name = prepared['customer_name']
+            group_id = prepared['group_id']
+            case_report = prepared['case_report']
             
             # Step 3: Post to portal (if not in test mode)
             posting_result = None
+            step_started = time.monotonic()
             if not test_mode and group_id:
                 self.logger.info(f"Step 3: Posting to portal for {customer_name}")
                 posting_result = self.rfe_client.post_rfe_discussion(
                     customer_key=customer_key,
-                    cases=case_report['cases']['all']
+                    cases=case_report['cases']['all'],
+                    discussion_body=prepared['portal_content']
                 )
             elif test_mode:
                 self.logger.info(f"Step 3: Test mode - skipping portal posting for {customer_name}")
@@ -162,19 +216,22 @@ class UltimateRFEPortalSystem:
             else:
                 self.logger.warning(f"Step 3: No group ID configured for {customer_name} - skipping portal posting")
                 posting_result = {'error': 'No group ID configured'}
+            timings['post_seconds'] = round(time.monotonic() - step_started, 3)
+            timings['total_seconds'] = round(time.monotonic() - prepared['started'], 3)
             
             # Step 4: Generate results
             results = {
                 'customer_key': customer_key,
                 'customer_name': customer_name,
-                'account_number': account_number,
+                'account_number': prepared['account_number'],
                 'group_id': group_id,
                 'processing_timestamp': datetime.now().isoformat(),
                 'test_mode': test_mode,
                 'case_report': case_report,
-                'portal_content': portal_content,
+                'portal_content': prepared['portal_content'],
                 'posting_result': posting_result,
-                'success': posting_result is not None and not posting_result.get('error')
+                'success': posting_result is not None and not posting_result.get('error'),
+                'timings': timings,
             }
             
             # Step 5: Save results
@@ -189,7 +246,8 @@ class UltimateRFEPortalSystem:
                 'customer_key': customer_key,
                 'error': str(e),
                 'success': False,
-                'processing_timestamp': datetime.now().isoformat()
+                'processing_timestamp': datetime.now().isoformat(),
+                'timings': timings,
             }
     
     def _save_processing_results(self, results: Dict[str, Any]):
@@ -208,6 +266,12 @@ class UltimateRFEPortalSystem:
             with open(results_file, 'w') as f:
                 json.dump(results, f, indent=2)
             
+            # Per-stage timing (discover / render / post), also kept in the JSON under 'timings'
+            timings = results.get('timings') or {}
+            if timings:
+                stages = ', '.join(f"{k.replace('_seconds', '')} {v:.2f}s" for k, v in timings.items())
+                self.logger.info(f"Timings for {customer_key}: {stages}")
+            
             # Save portal content
             if results.get('portal_content'):
                 content_file = f"{results_dir}/rfe-{customer_key}-{timestamp}.md"
@@ -223,6 +287,11 @@ class UltimateRFEPortalSystem:
         """
         Process RFE automation for all configured customers
         
+        Discovery and rendering run for up to PIPELINE_MAX_WORKERS customers at once; each
+        customer moves on to posting as soon as it is ready, and posts are paced only by the
+        RFE client's per-endpoint rate limiter. A run takes about as long as the slowest customer
+        (plus posting pace) instead of the sum of all customers.
+        
         Args:
             test_mode: If True, don't post to portal
             
@@ -230,16 +299,29 @@ class UltimateRFEPortalSystem:
             Dict with results for all customers
         """
         self.logger.info("Processing RFE automation for all customers")
+        started = time.monotonic()
+        customer_keys = list(self.customer_config.keys())
         
         all_results = {}
-        
-        for customer_key in self.customer_config.keys():
-            result = self.process_customer(customer_key, test_mode)
-            all_results[customer_key] = result
+        if customer_keys:
+            with ThreadPoolExecutor(max_workers=min(PIPELINE_MAX_WORKERS, len(customer_keys))) as prepare_pool, \
+                    ThreadPoolExecutor(max_workers=POST_MAX_WORKERS) as post_pool:
+                prepare_futures = {prepare_pool.submit(self._prepare_customer, k): k for k in customer_keys}
+                # Hand each customer to the posting stage the moment its discovery + render finishes
+                post_futures = {}
+                for future in as_completed(prepare_futures):
+                    post_futures[prepare_futures[future]] = post_pool.submit(self._post_and_save, future.result(), test_mode)
+                # Report customers in configuration order
+                for key in customer_keys:
+                    all_results[key] = post_futures[key].result()
         
         # Generate summary
         successful = [r for r in all_results.values() if r.get('success')]
         failed = [r for r in all_results.values() if not r.get('success')]
+        stage_totals: Dict[str, float] = {}
+        for r in all_results.values():
+            for stage, seconds in (r.get('timings') or {}).items():
+                stage_totals[stage] = round(stage_totals.get(stage, 0.0) + seconds, 3)
         
         summary = {
             'total_customers': len(all_results),
@@ -248,10 +330,13 @@ class UltimateRFEPortalSystem:
             'success_rate': len(successful) / len(all_results) * 100 if all_results else 0,
             'processing_timestamp': datetime.now().isoformat(),
             'test_mode': test_mode,
+            'wall_seconds': round(time.monotonic() - started, 3),
+            'stage_seconds': stage_totals,
             'results': all_results
         }
         
-        self.logger.info(f"All customers processed: {len(successful)}/{len(all_results)} successful")
+        self.logger.info(f"All customers processed: {len(successful)}/{len(all_results)} successful "
+                         f"in {summary['wall_seconds']:.1f}s (sequential stage total {sum(v for k, v in stage_totals.items() if k != 'total_seconds'):.1f}s)")
         return summary
     
     def validate_customer_config(self, customer_key: str) -> Dict[str, Any]:
@@ -14,7 +14,7 @@ import re
 import subprocess
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -51,6 +51,135 @@ class CustomerAccount:
     last_updated: Optional[str] = None
     confidence: str = "unknown"  # confirmed, extracted, manual, unknown
 
+CasePredicate = Callable[[Dict], bool]
+
+
+def _match_all(case: Dict) -> bool:
+    return True
+
+
+def _match_none(case: Dict) -> bool:
+    return False
+
+
+def _filter_values(filter_obj: AccountFilter) -> List[str]:
+    return [str(v) for v in (filter_obj.value if isinstance(filter_obj.value, list) else [filter_obj.value])]
+
+
+def _parse_case_date(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def compile_filter(filter_obj: AccountFilter, logger: Optional[logging.Logger] = None) -> CasePredicate:
+    """
+    Turn one AccountFilter into a case predicate. Everything that does not depend on the case is
+    done here once: filter values are lower-cased into tuples/sets, the date cutoff is computed and
+    custom regexes are compiled. Filters that cannot be evaluated (unknown type, bad regex, bad
+    date value) include every case, as the per-case matchers always did.
+    """
+    ftype = filter_obj.filter_type
+    sensitive = filter_obj.case_sensitive
+
+    if ftype == FilterType.SBR_GROUP:
+        if filter_obj.operator != "in_list":
+            return _match_none
+        needles = tuple(v if sensitive else v.lower() for v in _filter_values(filter_obj))
+
+        def match_sbr(case: Dict) -> bool:
+            sbr = (case.get('sbr_group') or '').strip()
+            if not sensitive:
+                sbr = sbr.lower()
+            return any(n in sbr for n in needles)
+        return match_sbr
+
+    if ftype == FilterType.CASE_STATUS:
+        if filter_obj.operator != "in_list":
+            return _match_none
+        wanted = frozenset(v if sensitive else v.lower() for v in _filter_values(filter_obj))
+
+        def match_status(case: Dict) -> bool:
+            status = (case.get('status') or '').strip()
+            return (status if sensitive else status.lower()) in wanted
+        return match_status
+
+    if ftype == FilterType.DATE_RANGE:
+        if filter_obj.operator != "within_days":
+            return _match_all
+        try:
+            days = filter_obj.value.get('days', 30)
+            cutoff = datetime.now() - timedelta(days=days)
+        except (AttributeError, TypeError) as e:
+            if logger:
+                logger.error(f"Error compiling date range filter: {e}")
+            return _match_all
+        # Case dates may be naive (local) or carry an offset (Hydra's ...Z); compare like with like
+        cutoff_aware = cutoff.astimezone()
+
+        def match_date(case: Dict) -> bool:
+            value = case.get('created_date', case.get('updated_date', ''))
+            if not value:
+                return True  # Include if no date available
+            try:
+                case_date = _parse_case_date(value)
+            except (TypeError, ValueError):
+                return True
+            return case_date >= (cutoff_aware if case_date.tzinfo else cutoff)
+        return match_date
+
+    if ftype == FilterType.CUSTOM_FILTER:
+        if filter_obj.operator != "regex":
+            return _match_all
+        try:
+            pattern = re.compile(str(filter_obj.value), 0 if sensitive else re.IGNORECASE)
+        except re.error as e:
+            if logger:
+                logger.error(f"Error compiling custom filter {filter_obj.value!r}: {e}")
+            return _match_all
+
+        def match_custom(case: Dict) -> bool:
+            return bool(pattern.search(json.dumps(case, default=str)))
+        return match_custom
+
+    if logger:
+        logger.warning(f"Unknown filter type: {ftype}")
+    return _match_all  # Include by default for unknown filters
+
+
+# Cheapest checks first so the fused predicate rejects most cases before the costly ones run
+_FILTER_COST = {
+    FilterType.CASE_STATUS: 0,
+    FilterType.SBR_GROUP: 1,
+    FilterType.DATE_RANGE: 2,
+    FilterType.CUSTOM_FILTER: 3,
+}
+
+
+def compile_filters(filters: Iterable[AccountFilter], logger: Optional[logging.Logger] = None) -> CasePredicate:
+    """Fuse all enabled filters into one predicate (AND, cheapest first, short-circuiting)."""
+    enabled = sorted((f for f in filters if f.enabled), key=lambda f: _FILTER_COST.get(f.filter_type, 4))
+    predicates = tuple(p for p in (compile_filter(f, logger) for f in enabled) if p is not _match_all)
+    if not predicates:
+        return _match_all
+    if _match_none in predicates:
+        return _match_none
+
+    def matches(case: Dict) -> bool:
+        for predicate in predicates:
+            try:
+                if not predicate(case):
+                    return False
+            except Exception:
+                continue  # Include by default on error
+        return True
+    return matches
+
+
+def _filters_signature(filters: Iterable[AccountFilter]) -> Tuple:
+    return tuple(
+        (f.filter_type, repr(f.value), f.operator, f.case_sensitive, f.enabled) for f in filters
+    )
+
+
 class UniversalAccountFilter:
     """Universal account filtering system for any TAM customer"""
     
@@ -69,6 +198,9 @@ class UniversalAccountFilter:
         self.customer_accounts = self._load_customer_accounts()
         self.account_filters = self._load_account_filters()
         
+        # account_id -> (filters signature, fused predicate); rebuilt when the account's filters change
+        self._compiled_filters: Dict[str, Tuple[Tuple, CasePredicate]] = {}
+        
         # Default filter templates
         self.default_filters = {
             "ansible_sbr": AccountFilter(
@@ -387,6 +519,27 @@ class UniversalAccountFilter:
         
         return account_info
     
+    def compiled_filter(self, account_id: str) -> Optional[CasePredicate]:
+        """The account's enabled filters fused into one predicate (compiled once, reused until they change)."""
+        account = self.customer_accounts.get(account_id)
+        if account is None:
+            return None
+        signature = _filters_signature(account.filters)
+        cached = self._compiled_filters.get(account_id)
+        if cached is None or cached[0] != signature:
+            cached = self._compiled_filters[account_id] = (signature, compile_filters(account.filters, self.logger))
+        return cached[1]
+    
+    def iter_filtered_cases(self, account_id: str, cases: Iterable[Dict]) -> Iterator[Dict]:
+        """Stream the cases that pass every enabled filter of the account (one pass, no intermediate lists)."""
+        predicate = self.compiled_filter(account_id)
+        if predicate is None:
+            self.logger.error(f"Account {account_id} not found")
+            return
+        for case in cases:
+            if predicate(case):
+                yield case
+    
     def apply_filters(self, account_id: str, cases: List[Dict]) -> List[Dict]:
         """Apply filters to a list of cases for a specific account"""
         
@@ -394,113 +547,18 @@ class UniversalAccountFilter:
             self.logger.error(f"Account {account_id} not found")
             return []
         
-        account = self.customer_accounts[account_id]
-        filtered_cases = cases.copy()
-        
-        for filter_obj in account.filters:
-            if not filter_obj.enabled:
-                continue
-            
-            filtered_cases = self._apply_single_filter(filter_obj, filtered_cases)
-            self.logger.info(f"Applied filter {filter_obj.filter_type.value}: {len(filtered_cases)} cases remaining")
-        
-        return filtered_cases
-    
-    def _apply_single_filter(self, filter_obj: AccountFilter, cases: List[Dict]) -> List[Dict]:
-        """Apply a single filter to a list of cases"""
-        
-        filtered_cases = []
-        
-        for case in cases:
-            if self._case_matches_filter(case, filter_obj):
-                filtered_cases.append(case)
-        
+        filtered_cases = list(self.iter_filtered_cases(account_id, cases))
+        self.logger.info(f"Applied filters for {account_id}: {len(filtered_cases)} of {len(cases)} cases remaining")
         return filtered_cases
     
     def _case_matches_filter(self, case: Dict, filter_obj: AccountFilter) -> bool:
         """Check if a case matches a specific filter"""
-        
         try:
-            if filter_obj.filter_type == FilterType.SBR_GROUP:
-                return self._match_sbr_group(case, filter_obj)
-            elif filter_obj.filter_type == FilterType.CASE_STATUS:
-                return self._match_case_status(case, filter_obj)
-            elif filter_obj.filter_type == FilterType.DATE_RANGE:
-                return self._match_date_range(case, filter_obj)
-            elif filter_obj.filter_type == FilterType.CUSTOM_FILTER:
-                return self._match_custom_filter(case, filter_obj)
-            else:
-                self.logger.warning(f"Unknown filter type: {filter_obj.filter_type}")
-                return True  # Include by default for unknown filters
-                
+            return compile_filter(filter_obj, self.logger)(case)
         except Exception as e:
             self.logger.error(f"Error applying filter {filter_obj.filter_type.value}: {e}")
             return True  # Include by default on error
     
-    def _match_sbr_group(self, case: Dict, filter_obj: AccountFilter) -> bool:
-        """Match SBR group filter"""
-        case_sbr = case.get('sbr_group', '').strip()
-        
-        if filter_obj.operator == "in_list":
-            filter_values = filter_obj.value if isinstance(filter_obj.value, list) else [filter_obj.value]
-            for filter_value in filter_values:
-                if not filter_obj.case_sensitive:
-                    if filter_value.lower() in case_sbr.lower():
-                        return True
-                else:
-                    if filter_value in case_sbr:
-                        return True
-        
-        return False
-    
-    def _match_case_status(self, case: Dict, filter_obj: AccountFilter) -> bool:
-        """Match case status filter"""
-        case_status = case.get('status', '').strip()
-        
-        if filter_obj.operator == "in_list":
-            filter_values = filter_obj.value if isinstance(filter_obj.value, list) else [filter_obj.value]
-            for filter_value in filter_values:
-                if not filter_obj.case_sensitive:
-                    if filter_value.lower() == case_status.lower():
-                        return True
-                else:
-                    if filter_value == case_status:
-                        return True
-        
-        return False
-    
-    def _match_date_range(self, case: Dict, filter_obj: AccountFilter) -> bool:
-        """Match date range filter"""
-        try:
-            case_date_str = case.get('created_date', case.get('updated_date', ''))
-            if not case_date_str:
-                return True  # Include if no date available
-            
-            case_date = datetime.fromisoformat(case_date_str.replace('Z', '+00:00'))
-            
-            if filter_obj.operator == "within_days":
-                days = filter_obj.value.get('days', 30)
-                cutoff_date = datetime.now() - timedelta(days=days)
-                return case_date >= cutoff_date
-            
-        except Exception as e:
-            self.logger.error(f"Error matching date range: {e}")
-        
-        return True  # Include by default on error
-    
-    def _match_custom_filter(self, case: Dict, filter_obj: AccountFilter) -> bool:
-        """Match custom filter using regex or other custom logic"""
-        try:
-            if filter_obj.operator == "regex":
-                pattern = filter_obj.value
-                case_text = json.dumps(case).lower() if not filter_obj.case_sensitive else json.dumps(case)
-                return bool(re.search(pattern, case_text))
-            
-        except Exception as e:
-            self.logger.error(f"Error matching custom filter: {e}")
-        
-        return True  # Include by default on error
-    
     def validate_account_setup(self, account_id: str) -> Dict[str, Any]:
         """Validate account setup and configuration"""
         
@@ -13,7 +13,8 @@ The browser then hides token settings and shows Red Hat SSO-oriented chrome (no
 implementation here; wire SSO at the edge when ready).
 """
 
-import csv
+import asyncio
+import contextvars
 import io
 import json
 import os
@@ -21,7 +22,10 @@ import re
 import subprocess
 import sys
 import threading
+import time
 import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
@@ -124,14 +128,18 @@ def _taminator_src_path():
     return candidates[0]  # fallback so insert/remove stay consistent
 
 
+_sys_path_lock = threading.Lock()
+
+
 def _ensure_taminator_on_path():
     """Ensure the taminator package is on sys.path (e.g. when running from packaged app)."""
     if "taminator" in sys.modules:
         return
     src_path = _taminator_src_path()
     if os.path.isdir(src_path) and os.path.isdir(os.path.join(src_path, "taminator")):
-        if src_path not in sys.path:
-            sys.path.insert(0, src_path)
+        with _sys_path_lock:
+            if src_path not in sys.path:
+                sys.path.insert(0, src_path)
 
 
 # Support Case column when JIRA is tracked but there is no access.redhat.com case
@@ -146,9 +154,9 @@ def _parse_jira_keys_from_paste(pasted: str) -> list:
     text = (pasted or "").strip()
     out = []
     _ensure_taminator_on_path()
-    from taminator.core.hydra_search import JIRA_ID_PATTERN
+    from taminator.core.hydra_search import jira_id_pattern
 
-    for m in JIRA_ID_PATTERN.finditer(text):
+    for m in jira_id_pattern().finditer(text):
         out.append(m.group(1).upper())
     # JIRA/Atlassian browse and selected path forms (picks up keys for projects not in the static prefix list)
     for m in re.finditer(r"/browse/([A-Za-z][A-Za-z0-9_]*-\d+)", text):
@@ -241,59 +249,19 @@ def _normalize_account_numbers(val) -> list:
     return [x.strip() for x in str(val).split(",") if x.strip()]
 
 
-def _dedupe_accounts(accounts: list) -> list:
-    """Merge two accounts only when they share an account number and the same SBR group."""
-    if not accounts:
-        return []
-    result = [dict(a) for a in accounts]
-    while True:
-        changed = False
-        for i in range(len(result)):
-            if changed:
-                break
-            nums_i = set(result[i].get("account_numbers") or [])
-            sbr_i = _sbr_groups_set(result[i])
-            for j in range(i + 1, len(result)):
-                nums_j = set(result[j].get("account_numbers") or [])
-                if nums_i & nums_j and _sbr_groups_set(result[j]) == sbr_i:
-                    merged_nums = _normalize_account_numbers(list(nums_i | nums_j)) or list(nums_i | nums_j)
-                    result[i]["account_numbers"] = merged_nums
-                    result[i]["account_number"] = merged_nums[0] if merged_nums else result[i].get("account_number")
-                    name_i = (result[i].get("customer_name") or "").strip()
-                    name_j = (result[j].get("customer_name") or "").strip()
-                    if name_j and not name_i:
-                        result[i]["customer_name"] = name_j
-                    if result[j].get("sbr_groups") and not result[i].get("sbr_groups"):
-                        result[i]["sbr_groups"] = result[j]["sbr_groups"]
-                    result.pop(j)
-                    changed = True
-                    break
-        if not changed:
-            break
-    return result
+def _accounts_store():
+    """Shared in-memory store for ACCOUNTS_FILE (indexed; re-read only when the file changes)."""
+    _ensure_taminator_on_path()
+    from taminator.core.accounts_store import get_accounts_store
+
+    return get_accounts_store(ACCOUNTS_FILE)
 
 
 def _load_accounts() -> list:
-    """Load accounts from ~/.config/taminator/accounts.json. Returns list of dicts with id, account_number, account_numbers, customer_name, sbr_groups. Duplicates (same account number + same SBR group) are merged."""
-    if not ACCOUNTS_FILE.exists():
-        return []
+    """Load accounts from ~/.config/taminator/accounts.json. Returns list of dicts with id, account_number, account_numbers, customer_name, sbr_groups. Duplicates (same account number + same SBR group) are merged.
+    The list is a fresh copy (safe to edit and pass to _save_accounts) that lookups below answer from the store's indexes."""
     try:
-        with open(ACCOUNTS_FILE) as f:
-            data = json.load(f)
-        out = []
-        for a in data.get("accounts", []):
-            a = dict(a)
-            nums = _normalize_account_numbers(a.get("account_numbers") or a.get("account_number"))
-            if not nums and a.get("account_number"):
-                nums = [str(a.get("account_number")).strip()]
-            a["account_numbers"] = nums
-            a["account_number"] = nums[0] if nums else ""
-            out.append(a)
-        deduped = _dedupe_accounts(out)
-        if len(deduped) < len(out):
-            _save_accounts(deduped)
-            return deduped
-        return deduped
+        return _accounts_store().snapshot().copy_accounts()
     except Exception:
         return []
 
@@ -312,6 +280,9 @@ def _collect_account_numbers_for_portal_search(accounts: list, account_ids: list
     """Union of Red Hat account numbers for selected customer ids; empty account_ids means all configured customers."""
     if not accounts:
         return []
+    snapshot = getattr(accounts, "snapshot", None)
+    if snapshot is not None:
+        return snapshot.account_numbers_for_ids(account_ids)
     want = {(x or "").strip() for x in (account_ids or []) if (x or "").strip()}
     nums_out = []
     if not want:
@@ -371,6 +342,10 @@ def _find_account_by_account_numbers(accounts: list, account_numbers: list, sbr_
     want = set(_normalize_account_numbers(account_numbers) or [])
     if not want:
         return (None, None)
+    snapshot = getattr(accounts, "snapshot", None)
+    if snapshot is not None:
+        i = snapshot.find_index_by_numbers(want, sbr_groups)
+        return (None, None) if i is None else (i, accounts[i])
     want_sbr = _sbr_groups_set(sbr_groups if sbr_groups is not None else [])
     for i, a in enumerate(accounts):
         have = set(a.get("account_numbers") or [])
@@ -379,13 +354,16 @@ def _find_account_by_account_numbers(accounts: list, account_numbers: list, sbr_
     return (None, None)
 
 
-def _ensure_account_from_dump(account_numbers: list, customer_name: str) -> dict:
+def _ensure_account_from_dump(account_numbers: list, customer_name: str, accounts: list = None) -> dict:
     """Ensure an account exists: add if none match these account numbers and SBR, else update (merge numbers, customer_name).
-    Only merges into an account that has the same SBR group; from dump we use no SBR ([]), so we only merge into accounts with no SBR."""
+    Only merges into an account that has the same SBR group; from dump we use no SBR ([]), so we only merge into accounts with no SBR.
+    accounts: list from _accounts_store().batch() to edit in place (caller saves once); default loads and saves on its own."""
     account_numbers = _normalize_account_numbers(account_numbers) or []
     if not account_numbers:
         return {}
-    accounts = _load_accounts()
+    if accounts is None:
+        with _accounts_store().batch() as batch_accounts:
+            return _ensure_account_from_dump(account_numbers, customer_name, batch_accounts)
     idx, existing = _find_account_by_account_numbers(accounts, account_numbers, sbr_groups=[])
     if idx is not None:
         # Merge: add any new account numbers, update customer_name if provided
@@ -398,7 +376,6 @@ def _ensure_account_from_dump(account_numbers: list, customer_name: str) -> dict
             "account_number": merged_nums[0] if merged_nums else existing.get("account_number"),
             "customer_name": name or existing.get("customer_name"),
         }
-        _save_accounts(accounts)
         return accounts[idx]
     # Add new account
     aid = _slug(customer_name) or _slug("Account-" + str(account_numbers[0]))
@@ -413,28 +390,21 @@ def _ensure_account_from_dump(account_numbers: list, customer_name: str) -> dict
     name = customer_name.strip() or f"Account {account_numbers[0]}"
     entry = {"id": aid, "account_numbers": account_numbers, "account_number": account_numbers[0], "customer_name": name, "created_at": datetime.utcnow().isoformat() + "Z"}
     accounts.append(entry)
-    _save_accounts(accounts)
     return entry
 
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write a report/config file atomically (temp file + os.replace)."""
+    _ensure_taminator_on_path()
+    from taminator.core.file_io import atomic_write_text
+
+    atomic_write_text(path, text)
+
+
 def _save_accounts(accounts: list) -> None:
-    """Save accounts to ~/.config/taminator/accounts.json. Each entry must have account_numbers (list); we also write account_number (first) for backward compat."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    out = []
-    for a in accounts:
-        a = dict(a)
-        nums = _normalize_account_numbers(a.get("account_numbers") or a.get("account_number"))
-        if not nums and a.get("account_number"):
-            nums = [str(a.get("account_number")).strip()]
-        a["account_numbers"] = nums
-        a["account_number"] = nums[0] if nums else ""
-        out.append(a)
-    with open(ACCOUNTS_FILE, "w") as f:
-        json.dump({"accounts": out}, f, indent=2)
-    try:
-        os.chmod(ACCOUNTS_FILE, 0o600)
-    except OSError:
-        pass
+    """Save accounts to ~/.config/taminator/accounts.json. Each entry must have account_numbers (list); we also write account_number (first) for backward compat.
+    Atomic (temp file + rename) and serialized with other writers in this process."""
+    _accounts_store().save(accounts)
 
 
 def _load_report_structure() -> dict:
@@ -642,6 +612,14 @@ def _find_report_path(customer: str):
     return None
 
 
+def _load_report(path: Path):
+    """Parsed report file from the shared report model (re-read only when the file changes)."""
+    _ensure_taminator_on_path()
+    from taminator.core.report_model import load_report
+
+    return load_report(path)
+
+
 def get_report_content(customer: str, path: str = None) -> tuple:
     """Return (content, error_message). If path is given and under REPORT_SEARCH_PATHS, read that file; else find by customer stem."""
     if path:
@@ -650,7 +628,7 @@ def get_report_content(customer: str, path: str = None) -> tuple:
             allowed = {str(d.resolve()) for d in REPORT_SEARCH_PATHS}
             if any(str(p).startswith(d.rstrip("/") + "/") or str(p) == d.rstrip("/") for d in allowed):
                 if p.is_file():
-                    return p.read_text(encoding="utf-8", errors="replace"), None
+                    return _load_report(p).text, None
                 return None, "File not found"
             # path not under allowed dirs
         except Exception as e:
@@ -659,7 +637,7 @@ def get_report_content(customer: str, path: str = None) -> tuple:
     if not report_path or not report_path.exists():
         return None, "Report not found"
     try:
-        return report_path.read_text(encoding="utf-8", errors="replace"), None
+        return _load_report(report_path).text, None
     except Exception as e:
         return None, str(e)
 
@@ -732,19 +710,14 @@ def get_roadmap() -> dict:
 
 def check_vpn() -> dict:
     """Check if Red Hat VPN appears to be up (can reach issues.redhat.com). Returns { ok: bool, message: str }."""
-    src_path = _taminator_src_path()
     try:
-        if src_path not in sys.path:
-            sys.path.insert(0, src_path)
+        _ensure_taminator_on_path()
         from taminator.core import jira_config
         base_url = jira_config.get_jira_base_url()
         if jira_config.is_jira_cloud(base_url):
             return {"ok": True, "message": "JIRA Cloud configured; VPN check skipped (not required for Cloud)."}
     except Exception:
         pass
-    finally:
-        if src_path in sys.path:
-            sys.path.remove(src_path)
     # Use stdlib urllib only: requests + charset_normalizer on large HTML can recurse
     # deeply on Apple Python 3.9 and abort the worker thread.
     try:
@@ -771,37 +744,55 @@ def _get_ui_tokens():
     When Vault is configured (VAULT_ADDR/VAULT_TOKEN), overlays jira/portal tokens from Vault.
     Supports encoded storage (base64 payload) and legacy plain JSON."""
     tokens_file = Path.home() / ".config" / "taminator" / "ui_tokens.json"
-    src_path = _taminator_src_path()
-    inserted = src_path not in sys.path
-    if inserted:
-        sys.path.insert(0, src_path)
+    _ensure_taminator_on_path()
     try:
-        try:
-            from taminator.core.token_store import load_ui_tokens
-            tokens = load_ui_tokens(tokens_file)
-        except ImportError:
-            tokens = {}
-            if tokens_file.exists():
-                try:
-                    with open(tokens_file) as f:
-                        tokens = json.load(f)
-                except Exception:
-                    pass
-        # Overlay from Vault when configured
-        try:
-            from taminator.core.hybrid_auth import hybrid_auth
-            if hybrid_auth.is_vault_available():
-                for vault_service, key in [("jira", "jira_token"), ("portal", "portal_token")]:
-                    t = hybrid_auth.get_token(vault_service, required=False)
-                    # Do not overwrite tokens already loaded from ui_tokens.json (Settings save wins).
-                    if t and not (tokens.get(key) or "").strip():
-                        tokens[key] = t
-        except Exception:
-            pass
-        return tokens
-    finally:
-        if inserted and src_path in sys.path:
-            sys.path.remove(src_path)
+        from taminator.core.token_store import load_ui_tokens
+        tokens = load_ui_tokens(tokens_file)
+    except ImportError:
+        tokens = {}
+        if tokens_file.exists():
+            try:
+                with open(tokens_file) as f:
+                    tokens = json.load(f)
+            except Exception:
+                pass
+    # Overlay from Vault when configured
+    try:
+        from taminator.core.hybrid_auth import hybrid_auth
+        from taminator.core.vault_client import vault_client
+        if hybrid_auth.is_vault_available():
+            # Both secrets in one parallel pass; the lookups below are then served from vault_client's cache
+            vault_client.get_tokens(["jira", "portal"])
+            for vault_service, key in [("jira", "jira_token"), ("portal", "portal_token")]:
+                t = hybrid_auth.get_token(vault_service, required=False)
+                # Do not overwrite tokens already loaded from ui_tokens.json (Settings save wins).
+                if t and not (tokens.get(key) or "").strip():
+                    tokens[key] = t
+    except Exception:
+        pass
+    return tokens
+
+
+# Env vars _env_with_ui_tokens may set from UI-saved tokens
+_UI_TOKEN_ENV_KEYS = (
+    "JIRA_TOKEN_API_TOKEN", "JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN",
+    "PORTAL_TOKEN", "REDHAT_USERNAME", "REDHAT_PASSWORD",
+)
+# Values those keys had before _apply_ui_tokens_to_environ overlaid UI tokens (None = unset)
+_environ_before_ui_tokens = {}
+_environ_lock = threading.RLock()
+
+
+def _process_environ() -> dict:
+    """os.environ as the server was started with, i.e. without the UI-token overlay."""
+    env = dict(os.environ)
+    with _environ_lock:
+        for key, value in _environ_before_ui_tokens.items():
+            if value is None:
+                env.pop(key, None)
+            else:
+                env[key] = value
+    return env
 
 
 def _env_with_ui_tokens():
@@ -809,7 +800,7 @@ def _env_with_ui_tokens():
     Hydra: REDHAT_USERNAME/PASSWORD from env or from UI-saved credentials.
     JIRA: JIRA_TOKEN_API_TOKEN for Red Hat; for JIRA Cloud also JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN.
     """
-    env = dict(os.environ)
+    env = _process_environ()
     tokens = _get_ui_tokens()
     if tokens.get("jira_token"):
         env["JIRA_TOKEN_API_TOKEN"] = tokens["jira_token"]
@@ -828,256 +819,45 @@ def _env_with_ui_tokens():
     return env
 
 
+def _apply_ui_tokens_to_environ():
+    """Overlay UI-saved tokens onto os.environ for commands run in-process (what run_cmd passes
+    to the subprocess). Re-derived from the original environment each time so edits in Settings
+    (including cleared values) take effect on the next command."""
+    with _environ_lock:
+        env = _env_with_ui_tokens()
+        for key in _UI_TOKEN_ENV_KEYS:
+            want = env.get(key)
+            if want == os.environ.get(key):
+                continue
+            if key not in _environ_before_ui_tokens:
+                _environ_before_ui_tokens[key] = os.environ.get(key)
+            if want is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = want
+
+
+def _parse_report(text: str):
+    """Parse report/doc markdown once into the shared report model (cached for recent texts)."""
+    _ensure_taminator_on_path()
+    from taminator.core.report_model import parse_report
+
+    return parse_report(text or "")
+
+
 def _markdown_to_html_fallback(text: str) -> str:
     """Convert common markdown to HTML without the markdown package. Used when markdown lib is not installed."""
-    import html as html_module
-    import re
-    if not (text or "").strip():
-        return ""
-    lines = (text or "").split("\n")
-    out = []
-    i = 0
-    in_fence = False
-    fence_char = None
-    list_tag = None
-
-    def inline_convert(s: str) -> str:
-        s = html_module.escape(s)
-        s = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2" target="_blank" rel="noopener">\1</a>', s)
-        s = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", s)
-        s = re.sub(r"\*([^*]+)\*", r"<em>\1</em>", s)
-        s = re.sub(r"`([^`]+)`", r"<code>\1</code>", s)
-        # Linear-time bare URL linkify; lookbehind + re.sub on long strings can recurse deeply on py3.9.
-        _url = re.compile(r"https?://[^\s<>\"')\]]{1,4000}")
-        parts = []
-        pos = 0
-        for m in _url.finditer(s):
-            parts.append(s[pos : m.start()])
-            u = m.group(0)
-            parts.append(f'<a href="{u}" target="_blank" rel="noopener">{u}</a>')
-            pos = m.end()
-        parts.append(s[pos:])
-        s = "".join(parts)
-        return s
-
-    while i < len(lines):
-        line = lines[i]
-        if re.match(r"^```", line):
-            if in_fence:
-                out.append("</code></pre>")
-                in_fence = False
-            else:
-                in_fence = True
-                out.append("<pre><code>")
-            i += 1
-            continue
-        if in_fence:
-            out.append(html_module.escape(line) + "\n")
-            i += 1
-            continue
-        if re.match(r"^###\s+", line):
-            t = re.sub(r"^###\s+", "", line).strip()
-            out.append("<h3>" + inline_convert(t) + "</h3>")
-            i += 1
-            continue
-        if re.match(r"^##\s+", line):
-            t = re.sub(r"^##\s+", "", line).strip()
-            out.append("<h2>" + inline_convert(t) + "</h2>")
-            i += 1
-            continue
-        if re.match(r"^#\s+", line):
-            t = re.sub(r"^#\s+", "", line).strip()
-            out.append("<h1>" + inline_convert(t) + "</h1>")
-            i += 1
-            continue
-        if re.match(r"^---+$", line) or re.match(r"^\*+$", line) or re.match(r"^_+$", line):
-            out.append("<hr/>")
-            i += 1
-            continue
-        if re.match(r"^-\s+", line) or re.match(r"^\*\s+", line) or re.match(r"^\d+\.\s+", line):
-            if list_tag != "ul":
-                if list_tag:
-                    out.append("</" + list_tag + ">")
-                out.append("<ul>")
-                list_tag = "ul"
-            rest = re.sub(r"^[-*]\s+|\d+\.\s+", "", line).strip()
-            out.append("<li>" + inline_convert(rest) + "</li>")
-            i += 1
-            continue
-        if list_tag:
-            out.append("</" + list_tag + ">")
-            list_tag = None
-        line_stripped = line.strip()
-        if not line_stripped:
-            out.append("<p></p>")
-            i += 1
-            continue
-        if "|" in line_stripped and line_stripped.count("|") >= 2:
-            table_rows = []
-            j = i
-            while j < len(lines):
-                row_line = lines[j].strip()
-                if not row_line or "|" not in row_line or row_line.count("|") < 2:
-                    break
-                cells = [c.strip() for c in row_line.split("|")]
-                if cells and cells[0] == "":
-                    cells = cells[1:]
-                if cells and cells[-1] == "":
-                    cells = cells[:-1]
-                if not cells:
-                    break
-                is_sep = all(re.match(r"^[\s\-:]+$", (c or "")) for c in cells)
-                if is_sep:
-                    j += 1
-                    continue
-                table_rows.append(cells)
-                j += 1
-            if table_rows:
-                out.append("<table border=\"1\" cellpadding=\"4\" cellspacing=\"0\" style=\"border-collapse:collapse; width:100%\">")
-                for row_idx, row_cells in enumerate(table_rows):
-                    tag = "th" if row_idx == 0 else "td"
-                    out.append("<tr>")
-                    for c in row_cells:
-                        out.append("<" + tag + ">" + inline_convert(c or "") + "</" + tag + ">")
-                    out.append("</tr>")
-                out.append("</table>")
-                i = j
-                i += 1
-                continue
-        out.append("<p>" + inline_convert(line_stripped) + "</p>")
-        i += 1
-    if list_tag:
-        out.append("</" + list_tag + ">")
-    if in_fence:
-        out.append("</code></pre>")
-    return "\n".join(out)
+    return _parse_report(text).to_html()
 
 
 def _markdown_to_plain_text(text: str) -> str:
     """Convert markdown to plain text (strip formatting for .txt reports). Tables become tab-separated rows."""
-    import re
-    if not (text or "").strip():
-        return ""
-    lines = (text or "").split("\n")
-
-    def strip_inline(s: str) -> str:
-        s = re.sub(r"\*\*([^*]+)\*\*", r"\1", s)
-        s = re.sub(r"\*([^*]+)\*", r"\1", s)
-        s = re.sub(r"`([^`]+)`", r"\1", s)
-        s = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", s)
-        return s.strip()
-
-    out = []
-    i = 0
-    in_fence = False
-    while i < len(lines):
-        line = lines[i]
-        if re.match(r"^```", line):
-            in_fence = not in_fence
-            i += 1
-            continue
-        if in_fence:
-            out.append(line)
-            i += 1
-            continue
-        # Markdown table: rows with | and multiple cells
-        if "|" in line and line.strip().count("|") >= 2:
-            table_rows = []
-            j = i
-            while j < len(lines):
-                row_line = lines[j].strip()
-                if not row_line or "|" not in row_line or row_line.count("|") < 2:
-                    break
-                cells = [strip_inline(c.strip()) for c in row_line.split("|")]
-                if cells and cells[0] == "":
-                    cells = cells[1:]
-                if cells and cells[-1] == "":
-                    cells = cells[:-1]
-                if not cells:
-                    break
-                is_sep = all(re.match(r"^[\s\-:]+$", (c or "")) for c in cells)
-                if is_sep:
-                    j += 1
-                    continue
-                table_rows.append(cells)
-                j += 1
-            if table_rows:
-                for row in table_rows:
-                    out.append("\t".join(row))
-                i = j
-                i += 1
-                continue
-        # Headings: strip leading #
-        if re.match(r"^#+\s+", line):
-            line = re.sub(r"^#+\s+", "", line).strip()
-        # Horizontal rules -> blank line
-        if re.match(r"^[-*_]+$", line):
-            out.append("")
-            i += 1
-            continue
-        # List items
-        line = re.sub(r"^\s*[-*]\s+|\s*\d+\.\s+", "- ", line, count=1)
-        line = strip_inline(line)
-        out.append(line)
-        i += 1
-    return "\n".join(out).strip() + "\n"
+    return _parse_report(text).to_plain_text()
 
 
 def _markdown_tables_to_csv(markdown_text: str) -> str:
     """Extract RFE and Bug tables from report markdown and return CSV with Section column (for Google Sheets etc.)."""
-    if not (markdown_text or "").strip():
-        return "Section,RED HAT JIRA ID,Support Case,Description,Status/Notes\n"
-    lines = (markdown_text or "").split("\n")
-    section_headers = ("Section", "RED HAT JIRA ID", "Support Case", "Description", "Status/Notes")
-    rows_out = []
-    current_section = None
-    table_header = None
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-        if re.match(r"^##\s+", stripped):
-            lower = stripped.lower()
-            if "rfe" in lower or "enhancement" in lower:
-                current_section = "RFE"
-            elif "bug" in lower:
-                current_section = "Bug"
-            else:
-                current_section = None
-            i += 1
-            continue
-        if "|" not in stripped or stripped.count("|") < 2:
-            i += 1
-            continue
-        cells = [c.strip() for c in stripped.split("|")]
-        if cells and cells[0] == "":
-            cells = cells[1:]
-        if cells and cells[-1] == "":
-            cells = cells[:-1]
-        if not cells:
-            i += 1
-            continue
-        is_sep = all(re.match(r"^[\s\-:]+$", (c or "")) for c in cells)
-        if is_sep:
-            i += 1
-            continue
-        if table_header is None and current_section == "RFE":
-            table_header = cells
-            i += 1
-            continue
-        if table_header is not None and cells == table_header:
-            i += 1
-            continue
-        if current_section and table_header is not None:
-            row = [current_section] + cells
-            rows_out.append(row)
-        i += 1
-    buf = io.StringIO()
-    w = csv.writer(buf)
-    w.writerow(section_headers)
-    for row in rows_out:
-        w.writerow(row)
-    return buf.getvalue()
+    return _parse_report(markdown_text).to_csv()
 
 
 def _load_docs_sections():
@@ -1159,7 +939,7 @@ def get_token_status():
         "hydra_credentials_set": bool(ui_tokens.get("redhat_username") and ui_tokens.get("redhat_password")),
     }
     try:
-        sys.path.insert(0, _taminator_src_path())
+        _ensure_taminator_on_path()
         from taminator.core.auth_box import auth_box
         from taminator.core.auth_types import AuthType
         if auth_box.get_token(AuthType.JIRA_TOKEN, required=False):
@@ -1169,9 +949,6 @@ def get_token_status():
             result["hydra"] = True
     except Exception:
         pass
-    finally:
-        if _taminator_src_path() in sys.path:
-            sys.path.remove(_taminator_src_path())
     return result
 
 
@@ -1184,7 +961,7 @@ def _get_effective_hydra_token():
     """
     token = None
     try:
-        sys.path.insert(0, _taminator_src_path())
+        _ensure_taminator_on_path()
         from taminator.core.hydra_search import get_bearer_token_from_env, get_bearer_token
         ui_tokens = _get_ui_tokens()
         if ui_tokens.get("redhat_username") and ui_tokens.get("redhat_password"):
@@ -1196,9 +973,6 @@ def _get_effective_hydra_token():
             token = get_bearer_token_from_env()
     except Exception:
         pass
-    finally:
-        if _taminator_src_path() in sys.path:
-            sys.path.remove(_taminator_src_path())
     if token:
         return token
     tokens = _get_ui_tokens()
@@ -1209,16 +983,13 @@ def _get_effective_hydra_token():
     if pt_env:
         return pt_env
     try:
-        sys.path.insert(0, _taminator_src_path())
+        _ensure_taminator_on_path()
         from taminator.core.auth_box import auth_box
         from taminator.core.auth_types import AuthType
         token = auth_box.get_token(AuthType.PORTAL_TOKEN, required=False)
         return token
     except Exception:
         return None
-    finally:
-        if _taminator_src_path() in sys.path:
-            sys.path.remove(_taminator_src_path())
 
 
 def _get_hydra_basic_auth():
@@ -1330,11 +1101,633 @@ def run_cmd(args, cwd=None, extra_env=None):
         return ("", str(e), -1)
 
 
+# check/update run in-process on this pool: no interpreter start-up or re-import per click, and
+# the caller gets the command's structured result next to the captured console text.
+# TAMINATOR_WEB_SUBPROCESS=1 restores one tam-rfe subprocess per command (full isolation). Debug
+# runs always use the subprocess because the TAMINATOR_DEBUG_* switches are process-wide env vars.
+COMMAND_WORKERS = 4
+_command_pool = None
+_command_pool_lock = threading.Lock()
+# One in-process update per report at a time (the web UI can fire Update twice)
+_report_locks = {}
+
+
+def _get_command_pool() -> ThreadPoolExecutor:
+    global _command_pool
+    with _command_pool_lock:
+        if _command_pool is None:
+            _command_pool = ThreadPoolExecutor(max_workers=COMMAND_WORKERS, thread_name_prefix="tam-rfe-cmd")
+        return _command_pool
+
+
+def _report_lock(customer: str) -> threading.Lock:
+    with _command_pool_lock:
+        return _report_locks.setdefault((customer or "").strip().lower(), threading.Lock())
+
+
+def _command_args(command: str, customer: str = None, test_data: bool = False, full_refresh: bool = False) -> list:
+    """tam-rfe argv (after the script name) for a check/update request."""
+    args = [command] + (["--test-data"] if test_data else [customer])
+    if command == "update":
+        # CLI expects: update <customer> -y (customer must be argv[2])
+        # --verbose: external trackers (JIRA links) when available
+        # --full-refresh: re-discover all cases from portal and repopulate report
+        args += ["-y", "--verbose"]
+        if full_refresh:
+            args.append("--full-refresh")
+    return args
+
+
+def _run_command_inprocess(command: str, customer: str = None, test_data: bool = False, full_refresh: bool = False,
+                           on_output=None) -> dict:
+    """Run check/update in this process with console output captured (and passed to on_output as
+    it is printed). Raises ImportError if the taminator package cannot be imported (caller falls
+    back to the subprocess)."""
+    _ensure_taminator_on_path()
+    from taminator.core.console import capture_output
+    if command == "check":
+        from taminator.commands.check import main as command_main
+        kwargs = {"customer": customer, "test_data": test_data}
+    else:
+        from taminator.commands.update import main as command_main
+        kwargs = {"customer": customer, "test_data": test_data, "auto_confirm": True, "full_refresh": full_refresh}
+
+    _apply_ui_tokens_to_environ()
+    lock = _report_lock("testcustomer" if test_data else customer) if command == "update" else None
+    stderr, code, result = "", 0, None
+    with capture_output(on_write=on_output) as buf:
+        if lock:
+            lock.acquire()
+        try:
+            result = command_main(**kwargs)
+        except Exception as e:
+            # Same outcome as an uncaught exception in the subprocess (e.g. AuthenticationError)
+            stderr, code = f"{type(e).__name__}: {e}", 1
+        finally:
+            if lock:
+                lock.release()
+    return {"stdout": buf.getvalue(), "stderr": stderr, "returncode": code, "result": result}
+
+
+def run_tam_command(command: str, customer: str = None, test_data: bool = False, full_refresh: bool = False,
+                    debug: bool = False, on_output=None) -> dict:
+    """Run `tam-rfe check` or `tam-rfe update -y` for the web UI.
+
+    Returns {"stdout", "stderr", "returncode", "result"}. result is the command's structured
+    return value when run in-process (see check_customer_report / update_customer_report) and
+    None when the subprocess was used. on_output receives console text as it is printed
+    (in-process only; the subprocess output arrives all at once in stdout).
+    """
+    if not debug and not _env_truthy("TAMINATOR_WEB_SUBPROCESS"):
+        try:
+            # copy_context: the worker inherits the caller's progress listener (background jobs)
+            return _get_command_pool().submit(
+                contextvars.copy_context().run,
+                _run_command_inprocess, command, customer, test_data, full_refresh, on_output,
+            ).result()
+        except ImportError:
+            pass
+    # Debug: set TAMINATOR_DEBUG_* so CLI logs API response details to stderr (shown in result).
+    # HYDRA_JIRA=missing-case doc keys + external trackers data; HYDRA_RESPONSE=query + numFound + first doc keys;
+    # JIRA=per-issue HTTP status/body; RHCASE=rhcase stdout/stderr when fallback is used.
+    extra_env = None
+    if debug:
+        extra_env = {
+            "TAMINATOR_DEBUG_HYDRA_JIRA": "1",
+            "TAMINATOR_DEBUG_HYDRA_RESPONSE": "1",
+            "TAMINATOR_DEBUG_JIRA": "1",
+            "TAMINATOR_DEBUG_RHCASE": "1",
+        }
+    stdout, stderr, code = run_cmd(_command_args(command, customer, test_data, full_refresh), extra_env=extra_env)
+    return {"stdout": stdout, "stderr": stderr, "returncode": code, "result": None}
+
+
+# Background jobs: long POSTs (api/update, api/cases/from-paste, api/google/backup) accept
+# {"async": true} (or ?async=1) and answer 202 with a job id straight away. The work runs on
+# a bounded pool; GET /api/jobs/<id> returns status/progress/result and
+# GET /api/jobs/<id>/events streams Server-Sent Events (status, progress, output, done).
+JOB_WORKERS = 2
+# Finished jobs are kept this long for late pollers
+JOB_RETENTION_SECONDS = 3600
+# Events kept per job for subscribers that connect late (oldest dropped first)
+MAX_JOB_EVENTS = 2000
+# Seconds between SSE keep-alive comments while a job is quiet
+JOB_EVENTS_KEEPALIVE = 15
+
+_jobs = {}
+_jobs_lock = threading.Lock()
+_job_pool = None
+
+
+class Job:
+    """One background web operation and the event log streamed to the UI."""
+
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.status = "queued"  # queued -> running -> done | failed
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = None
+        self.result = None
+        self.http_status = None
+        self._events = []  # (seq, event, data)
+        self._seq = 0
+        self._cond = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def emit(self, event: str, data: dict) -> None:
+        with self._cond:
+            self._seq += 1
+            self._events.append((self._seq, event, data))
+            if len(self._events) > MAX_JOB_EVENTS:
+                del self._events[: len(self._events) - MAX_JOB_EVENTS]
+            self._cond.notify_all()
+
+    def on_progress(self, stage, done, total, detail) -> None:
+        """taminator.core.progress listener."""
+        self.progress = {"stage": stage, "done": done, "total": total, "detail": detail}
+        self.emit("progress", self.progress)
+
+    def on_output(self, text: str) -> None:
+        """Console output of an in-process command, as it is printed."""
+        self.emit("output", {"text": text})
+
+    def events_after(self, seq: int, timeout: float) -> list:
+        """Events newer than seq; waits up to timeout seconds for one to arrive."""
+        with self._cond:
+            if not self.finished and not (self._events and self._events[-1][0] > seq):
+                self._cond.wait(timeout)
+            return [e for e in self._events if e[0] > seq]
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        out = {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+        }
+        if include_result:
+            out["http_status"] = self.http_status
+            out["result"] = self.result
+        return out
+
+
+def _sse_frame(seq: int, event: str, payload: dict) -> bytes:
+    """One Server-Sent Events message for a job event."""
+    return f"id: {seq}\nevent: {event}\ndata: {json.dumps(payload)}\n\n".encode()
+
+
+def _run_job(job: Job, work) -> None:
+    job.status = "running"
+    job.started_at = time.time()
+    job.emit("status", {"status": job.status})
+    try:
+        _ensure_taminator_on_path()
+        from taminator.core.progress import progress_listener
+    except ImportError:
+        progress_listener = None
+    try:
+        if progress_listener:
+            with progress_listener(job.on_progress):
+                payload, http_status = work(job)
+        else:
+            payload, http_status = work(job)
+    except Exception as e:
+        payload, http_status = {"ok": False, "error": str(e)}, 500
+    job.result = payload
+    job.http_status = http_status
+    job.finished_at = time.time()
+    job.status = "done" if http_status < 400 and payload.get("ok", True) else "failed"
+    job.emit("done", job.to_dict())
+
+
+def submit_job(kind: str, work) -> Job:
+    """Queue work(job) -> (payload, http_status) on the job pool and return the Job."""
+    global _job_pool
+    job = Job(kind)
+    now = time.time()
+    with _jobs_lock:
+        for jid in [j.id for j in _jobs.values() if j.finished and now - (j.finished_at or now) > JOB_RETENTION_SECONDS]:
+            del _jobs[jid]
+        _jobs[job.id] = job
+        if _job_pool is None:
+            _job_pool = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="web-job")
+    _job_pool.submit(_run_job, job, work)
+    return job
+
+
+def get_job(job_id: str):
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def _cases_from_paste(case_numbers: list) -> tuple:
+    """Discover pasted case numbers via Hydra, fetch their JIRA statuses and auto-configure
+    detected accounts. Returns (response payload, HTTP status) for api/cases/from-paste."""
+    _ensure_taminator_on_path()
+    try:
+        from taminator.core import hydra_search
+        from taminator.commands.check import JIRAClient
+        from taminator.core import jira_config
+        basic_auth = _get_hydra_basic_auth()
+        bearer_token = _get_effective_hydra_token()
+        token = None if basic_auth else bearer_token
+        if not basic_auth and not token:
+            return {"ok": False, "error": "Customer Portal token or Red Hat username/password required for case lookup. Configure in Settings."}, 400
+        cases, detected_accounts = hydra_search.discover_cases_by_case_numbers(
+            token=token,
+            case_numbers=case_numbers,
+            basic_auth=basic_auth,
+            basic_auth_fallback=_get_hydra_basic_auth_credentials() if not basic_auth else None,
+            bearer_fallback=bearer_token if basic_auth else None,
+        )
+        if not cases:
+            return {"ok": False, "error": "No cases found for those case numbers. Check VPN and Portal credentials.", "case_numbers": case_numbers[:20]}, 404
+        # Auto-configure accounts from detected account info
+        # One load and one write for every detected account
+        accounts_ensured = []
+        with _accounts_store().batch() as accounts:
+            for acc in detected_accounts:
+                nums = acc.get("account_numbers") or []
+                name = (acc.get("customer_name") or "").strip()
+                if nums:
+                    ensured = _ensure_account_from_dump(nums, name, accounts)
+                    if ensured:
+                        accounts_ensured.append(ensured)
+        # Fetch JIRA status for each case (report uses JIRA status, not internal/case status)
+        jira_ids = list(dict.fromkeys([c[3] for c in cases if c[3]]))
+        jira_statuses = {}
+        if jira_ids:
+            _base, _auth_header, _ = jira_config.get_jira_auth()
+            if _auth_header:
+                api_url = jira_config.get_jira_api_url()
+                client = JIRAClient(api_base_url=api_url, auth_header=_auth_header)
+                infos = client.get_multiple_statuses(jira_ids, show_progress=False)
+                for jid in jira_ids:
+                    jira_statuses[jid] = (infos.get(jid) or {}).get("status") or "—"
+            else:
+                for jid in jira_ids:
+                    jira_statuses[jid] = "—"
+        # Build report rows: case_number, jira_id, summary, jira_status (not case status)
+        report_rows = []
+        for case_number, summary, _case_status, jira_id, kind in cases:
+            jira_status = jira_statuses.get(jira_id, "—") if jira_id else "—"
+            report_rows.append({"case_number": case_number, "jira_id": jira_id or "TBD", "summary": summary, "jira_status": jira_status, "kind": kind})
+        # Markdown table snippet
+        def _cell(s):
+            return (str(s).replace("|", " ").replace("\n", " ").strip()[:200]) if s else ""
+        lines = ["| RED HAT JIRA ID | Support Case | Description | Status/Notes |", "| --- | --- | --- | --- |"]
+        for r in report_rows:
+            case_cell = f"[{r['case_number']}](https://access.redhat.com/support/cases/#/case/{r['case_number']})" if r["case_number"] else ""
+            jira_cell = r["jira_id"]
+            lines.append(f"| {jira_cell} | {case_cell} | {_cell(r['summary'][:80])} | {r['jira_status']} |")
+        report_markdown = "\n".join(lines)
+        return {
+            "ok": True,
+            "cases": report_rows,
+            "report_markdown": report_markdown,
+            "accounts_ensured": accounts_ensured,
+            "detected_accounts": detected_accounts,
+            "message": f"Found {len(cases)} case(s). " + (f"Added/updated {len(accounts_ensured)} account(s)." if accounts_ensured else ""),
+        }, 200
+    except Exception as e:
+        return {"ok": False, "error": str(e)}, 500
+
+
+def _google_backup() -> tuple:
+    """Upload every report in the Library to a new Google Drive folder. Returns (payload, HTTP status)."""
+    try:
+        _ensure_taminator_on_path()
+        from taminator.integrations.google_drive import backup_reports_to_drive, get_credentials
+        if not get_credentials():
+            return {"ok": False, "error": "Google Drive not connected. Click Connect Google below first."}, 400
+        reports = list_reports()
+        files = []
+        for r in reports:
+            path_str = r.get("path") or ""
+            name = r.get("name") or r.get("customer", "report") + ".md"
+            try:
+                content = Path(path_str).read_text(encoding="utf-8", errors="replace")
+                files.append({"name": name, "content": content})
+            except Exception:
+                continue
+        if not files:
+            return {"ok": False, "error": "No report files found to back up."}, 400
+        result = backup_reports_to_drive(files)
+        return {"ok": True, "url": result.get("url", ""), "count": result.get("count", 0)}, 200
+    except Exception as e:
+        return {"ok": False, "error": str(e)}, 400
+
+
+# --- Status indicators (GET api/status/indicators) ---
+# VPN, token, Google and Vault health are checked by a background thread every
+# STATUS_REFRESH_SECONDS (TAMINATOR_STATUS_REFRESH_SECONDS) and right after credentials change,
+# so page loads and UI polling read them from memory instead of probing issues.redhat.com,
+# keyring and Vault on every call.
+try:
+    STATUS_REFRESH_SECONDS = max(5.0, float(os.environ.get("TAMINATOR_STATUS_REFRESH_SECONDS") or 60))
+except ValueError:
+    STATUS_REFRESH_SECONDS = 60.0
+# Longest a single check may take before it is reported as failed for this round
+STATUS_CHECK_TIMEOUT = 15
+# POST routes after which cached tokens are dropped and the indicators re-checked
+STATUS_INVALIDATING_ROUTES = frozenset({
+    "api/config/set-token",
+    "api/config/set-hydra-credentials",
+    "api/config/set-jira-settings",
+    "api/google/set-credentials",
+    "api/google/connect",
+    "api/vault/set",
+    "api/vault/delete",
+    "api/vault/migrate",
+})
+
+
+def _check_google_connected() -> bool:
+    _ensure_taminator_on_path()
+    from taminator.integrations.google_drive import get_credentials
+    return bool(get_credentials())
+
+
+def _check_vault_available() -> bool:
+    _ensure_taminator_on_path()
+    from taminator.core.vault_client import vault_client
+    return bool(vault_client.is_available())
+
+
+def _compute_status_indicators() -> dict:
+    """Run the VPN, token, Google and Vault checks in parallel; failed or slow checks report not-ok."""
+    checks = {
+        "vpn": check_vpn,
+        "tokens": get_token_status,
+        "google": _check_google_connected,
+        "vault": _check_vault_available,
+    }
+    pool = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="status-check")
+    futures = {name: pool.submit(fn) for name, fn in checks.items()}
+    pool.shutdown(wait=False)
+    results = {}
+    deadline = time.monotonic() + STATUS_CHECK_TIMEOUT
+    for name, fut in futures.items():
+        try:
+            results[name] = fut.result(timeout=max(0.0, deadline - time.monotonic()))
+        except Exception:
+            results[name] = None
+    tokens = results["tokens"] or {"jira": False, "portal": False, "hydra": False, "hydra_credentials_set": False}
+    tokens["google"] = bool(results["google"])
+    return {
+        "vpn": {"ok": bool((results["vpn"] or {}).get("ok", False))},
+        "tokens": tokens,
+        "vault": {"available": bool(results["vault"])},
+        "checked_at": time.time(),
+    }
+
+
+class StatusIndicatorCache:
+    """Last status indicator result, refreshed by a daemon thread every interval seconds."""
+
+    def __init__(self, interval: float = STATUS_REFRESH_SECONDS):
+        self.interval = interval
+        self._payload = None
+        self._checked_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def refresh(self) -> dict:
+        """Run the checks now (callers arriving during a refresh wait for it and share its result)."""
+        requested = time.time()
+        with self._refresh_lock:
+            if self._payload is not None and self._checked_at >= requested:
+                return self._payload
+            payload = _compute_status_indicators()
+            self._payload, self._checked_at = payload, time.time()
+            return payload
+
+    def get(self) -> dict:
+        """Cached result; only the very first call (before any refresh finished) runs the checks inline."""
+        self.start()
+        payload = self._payload
+        if payload is None:
+            return self.refresh()
+        if time.time() - self._checked_at > 2 * self.interval:
+            self._wake.set()  # refresher fell behind (e.g. a slow check); nudge it
+        return payload
+
+    def invalidate(self) -> None:
+        """Re-check in the background now (credentials changed)."""
+        self.start()
+        self._wake.set()
+
+    def start(self) -> None:
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="status-indicators", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+_status_indicators = StatusIndicatorCache()
+
+
+def _credentials_changed() -> None:
+    """Drop cached tokens (Vault writes/deletes bypass auth_box) and re-check the status indicators."""
+    try:
+        _ensure_taminator_on_path()
+        from taminator.core.auth_box import auth_box
+        auth_box.invalidate_token_cache()
+    except Exception:
+        pass
+    _status_indicators.invalidate()
+
+
+# --- Request timing (GET api/metrics) ---
+# Upper bounds (ms) of the per-route latency histogram buckets; the last bucket is open-ended
+ROUTE_TIMING_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class RouteTimings:
+    """Per-route request counts and latency histograms for this server process."""
+
+    def __init__(self, buckets_ms=ROUTE_TIMING_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.started_at = time.time()
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, elapsed_ms: float, status) -> None:
+        with self._lock:
+            r = self._routes.get(route)
+            if r is None:
+                r = self._routes[route] = {
+                    "count": 0,
+                    "errors": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "histogram": [0] * (len(self.buckets_ms) + 1),
+                }
+            r["count"] += 1
+            if not isinstance(status, int) or status >= 500:
+                r["errors"] += 1
+            r["total_ms"] += elapsed_ms
+            r["max_ms"] = max(r["max_ms"], elapsed_ms)
+            i = 0
+            while i < len(self.buckets_ms) and elapsed_ms > self.buckets_ms[i]:
+                i += 1
+            r["histogram"][i] += 1
+
+    def _percentile(self, histogram: list, count: int, q: float, max_ms: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile, capped at the slowest request seen."""
+        target = q * count
+        seen = 0
+        for i, n in enumerate(histogram):
+            seen += n
+            if seen >= target:
+                return min(float(self.buckets_ms[i]), max_ms) if i < len(self.buckets_ms) else max_ms
+        return max_ms
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            routes = {k: dict(v, histogram=list(v["histogram"])) for k, v in self._routes.items()}
+        for r in routes.values():
+            n = r["count"]
+            r["total_ms"] = round(r["total_ms"], 2)
+            r["max_ms"] = round(r["max_ms"], 2)
+            r["mean_ms"] = round(r["total_ms"] / n, 2) if n else 0.0
+            r["p50_ms"] = self._percentile(r["histogram"], n, 0.5, r["max_ms"])
+            r["p95_ms"] = self._percentile(r["histogram"], n, 0.95, r["max_ms"])
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "buckets_ms": list(self.buckets_ms),
+            "routes": dict(sorted(routes.items())),
+        }
+
+
+_route_timings = RouteTimings()
+
+
+# Modules the request handlers import; serve(warm_imports=True) loads them once at startup so the
+# first page load does not pay for importing requests, Google client libraries, keyring, etc.
+WARM_IMPORT_MODULES = (
+    "taminator.core.hydra_search",
+    "taminator.core.jira_config",
+    "taminator.core.token_store",
+    "taminator.core.auth_box",
+    "taminator.core.hybrid_auth",
+    "taminator.core.vault_client",
+    "taminator.commands.check",
+    "taminator.commands.update",
+    "taminator.integrations.google_drive",
+)
+
+
+def warm_imports(modules=WARM_IMPORT_MODULES) -> dict:
+    """Import the handlers' taminator modules now. Returns {module: seconds or error string}."""
+    import importlib
+
+    _ensure_taminator_on_path()
+    out = {}
+    for name in modules:
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+            out[name] = round(time.perf_counter() - t0, 3)
+        except Exception as e:
+            out[name] = f"{type(e).__name__}: {e}"
+    return out
+
+
 class TaminatorHandler(BaseHTTPRequestHandler):
+    # API path (without surrounding slashes) -> handler method; built once, looked up per request
+    GET_ROUTES = {
+        "api/status": "_do_get_status",
+        "api/version": "_do_get_version",
+        "api/jobs": "_do_get_jobs",
+        "api/status/indicators": "_do_get_status_indicators",
+        "api/library": "_do_get_library",
+        "api/report": "_do_get_report",
+        "api/google/status": "_do_get_google_status",
+        "api/vpn/check": "_do_get_vpn_check",
+        "api/test/hydra": "_do_get_test_hydra",
+        "api/accounts": "_do_get_accounts",
+        "api/portal/search": "_do_get_portal_search",
+        "api/report-structure": "_do_get_report_structure",
+        "api/reports/paths": "_do_get_reports_paths",
+        "api/config/status": "_do_get_config_status",
+        "api/config/jira-settings": "_do_get_config_jira_settings",
+        "api/google/set-credentials": "_do_get_google_set_credentials",
+        "api/config/set-hydra-credentials": "_do_get_config_set_hydra_credentials",
+        "api/docs": "_do_get_docs",
+        "api/docs/roadmap": "_do_get_docs_roadmap",
+        "api/vault/status": "_do_get_vault_status",
+        "api/vault/list": "_do_get_vault_list",
+        "api/vault/get": "_do_get_vault_get",
+        "api/metrics": "_do_get_metrics",
+    }
+    # Parameterized paths, matched by prefix when no exact route exists
+    GET_PREFIX_ROUTES = (
+        ("api/jobs/", "_do_get_job"),
+    )
+    POST_ROUTES = {
+        "api/google/create-doc": "_do_post_google_create_doc",
+        "api/google/create-gmail-draft": "_do_post_google_create_gmail_draft",
+        "api/google/set-credentials": "_do_post_google_set_credentials",
+        "api/report-structure": "_do_post_report_structure",
+        "api/report-structure/preview": "_do_post_report_structure_preview",
+        "api/reports/build": "_do_post_reports_build",
+        "api/cases/from-paste": "_do_post_cases_from_paste",
+        "api/jira/from-paste": "_do_post_jira_from_paste",
+        "api/library/delete": "_do_post_library_delete",
+        "api/google/connect": "_do_post_google_connect",
+        "api/google/backup": "_do_post_google_backup",
+        "api/config/set-token": "_do_post_config_set_token",
+        "api/config/set-hydra-credentials": "_do_post_config_set_hydra_credentials",
+        "api/config/set-jira-settings": "_do_post_config_set_jira_settings",
+        "api/vault/set": "_do_post_vault_set",
+        "api/vault/delete": "_do_post_vault_delete",
+        "api/vault/migrate": "_do_post_vault_migrate",
+        "api/accounts": "_do_post_accounts",
+        "api/check": "_do_post_check",
+        "api/update": "_do_post_update",
+    }
+
     def log_message(self, format, *args):
         # Quiet logs unless needed
         pass
 
+    def log_request(self, code="-", size="-"):
+        # Called by send_response/send_error; remembered for the route timings
+        self._response_status = getattr(code, "value", code)
+
+    def _dispatch(self, method: str, route: str, handler, *args):
+        """Call handler(*args) and record its latency under "METHOD route"."""
+        self._response_status = None
+        t0 = time.perf_counter()
+        try:
+            handler(*args)
+        except Exception:
+            self._response_status = 500
+            raise
+        finally:
+            _route_timings.record(f"{method} {route}", (time.perf_counter() - t0) * 1000.0, self._response_status)
+
     def _cors_headers(self):
         """Allow browser/API clients when origin differs (localhost vs 127.0.0.1, file://, Electron)."""
         self.send_header("Access-Control-Allow-Origin", "*")
@@ -1353,6 +1746,59 @@ class TaminatorHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(json.dumps(data).encode())
 
+    def _wants_job(self, data: dict) -> bool:
+        """True when the client asked for a background job ({"async": true} or ?async=1)."""
+        if data.get("async") is True:
+            return True
+        qs = parse_qs(urlparse(self.path).query)
+        return (qs.get("async") or [""])[0].strip().lower() in ("1", "true", "yes")
+
+    def _send_job_or_run(self, data: dict, kind: str, work):
+        """Run work(job) -> (payload, status) as a background job (202 + job id) or inline."""
+        if self._wants_job(data):
+            job = submit_job(kind, work)
+            self.send_json({
+                "ok": True,
+                "job_id": job.id,
+                "status_url": f"/api/jobs/{job.id}",
+                "events_url": f"/api/jobs/{job.id}/events",
+            }, 202)
+            return
+        payload, status = work(None)
+        self.send_json(payload, status)
+
+    def _stream_job_events(self, job: Job):
+        """Server-Sent Events for a job until its 'done' event (resumes after Last-Event-ID)."""
+        try:
+            last = int(self.headers.get("Last-Event-ID") or 0)
+        except ValueError:
+            last = 0
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self._cors_headers()
+        self.end_headers()
+        try:
+            while True:
+                events = job.events_after(last, JOB_EVENTS_KEEPALIVE)
+                if not events:
+                    if job.finished:
+                        # done event was trimmed or already delivered; send the final state again
+                        events = [(last + 1, "done", job.to_dict())]
+                    else:
+                        self.wfile.write(b": keep-alive\n\n")
+                        self.wfile.flush()
+                        continue
+                for seq, event, payload in events:
+                    self.wfile.write(_sse_frame(seq, event, payload))
+                    last = seq
+                    if event == "done":
+                        self.wfile.flush()
+                        return
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
     def _get_app_version(self):
         # Prefer version set by Electron (installed app); then VERSION file(s)
         version = (os.environ.get("TAMINATOR_APP_VERSION") or "").strip()
@@ -1418,295 +1864,407 @@ class TaminatorHandler(BaseHTTPRequestHandler):
                 )
         self.wfile.write(body)
 
-    def do_GET(self):
-        parsed = urlparse(self.path)
-        path = parsed.path.strip("/")
-        qs = parse_qs(parsed.query)
-        if path.startswith("api/"):
-            if path == "api/status":
-                self.send_json({
-                    "status": "ok",
-                    "service": "rfe_bug_tracker",
-                    "display_name": "RFE and Bug Tracker",
-                    "ui": _ui_status_payload(),
-                })
-            elif path == "api/version":
-                self.send_json({"version": self._get_app_version()})
-            elif path == "api/status/indicators":
-                try:
-                    vpn = check_vpn()
-                except Exception:
-                    vpn = {"ok": False}
-                try:
-                    tokens = get_token_status()
-                except Exception:
-                    tokens = {"jira": False, "portal": False, "hydra": False, "hydra_credentials_set": False}
-                # Google check with short timeout so indicators load quickly
-                google_result = [False]  # mutable for thread
-                def _check_google():
-                    try:
-                        sys.path.insert(0, _taminator_src_path())
-                        from taminator.integrations.google_drive import get_credentials
-                        google_result[0] = bool(get_credentials())
-                    except Exception:
-                        pass
-                    finally:
-                        if _taminator_src_path() in sys.path:
-                            sys.path.remove(_taminator_src_path())
-                t = threading.Thread(target=_check_google, daemon=True)
-                t.start()
-                t.join(timeout=1.5)
-                tokens["google"] = google_result[0]
-                self.send_json({"vpn": {"ok": vpn.get("ok", False)}, "tokens": tokens})
-            elif path == "api/library":
-                # Library lists only report files that have been created (no "no file yet" placeholders)
-                reports = list_reports()
-                accounts_by_id = {
-                    (a.get("id") or "").strip().lower(): (a.get("customer_name") or a.get("id") or "").strip()
-                    for a in _load_accounts()
-                }
-                for r in reports:
-                    r["display_name"] = accounts_by_id.get((r.get("customer") or "").lower()) or r.get("customer") or ""
-                self.send_json({"reports": reports})
-            elif path == "api/report":
-                customer = (qs.get("customer") or [""])[0].strip()
-                if not customer:
-                    self.send_json({"error": "customer required"}, 400)
-                    return
-                content, err = get_report_content(customer)
-                if err:
-                    self.send_json({"ok": False, "error": err}, 404)
-                    return
-                self.send_json({"customer": customer, "content": content})
-            elif path == "api/google/status":
-                try:
-                    sys.path.insert(0, _taminator_src_path())
-                    from taminator.integrations.google_drive import is_configured, get_credentials
-                    configured = is_configured()
-                    connected = bool(get_credentials()) if configured else False
-                    self.send_json({"configured": configured, "connected": connected})
-                except Exception:
-                    self.send_json({"configured": False, "connected": False})
-                finally:
-                    if _taminator_src_path() in sys.path:
-                        sys.path.remove(_taminator_src_path())
-            elif path == "api/vpn/check":
-                self.send_json(check_vpn())
-            elif path == "api/test/hydra":
-                self.send_json(test_hydra_access())
-            elif path == "api/accounts":
-                try:
-                    accounts = _load_accounts()
-                    self.send_json({"accounts": accounts})
-                except Exception as e:
-                    self.send_json({"ok": False, "error": str(e)}, 500)
-            elif path == "api/portal/search":
-                q = (qs.get("q") or [""])[0].strip()
-                ids_raw = (qs.get("accounts") or [""])[0].strip()
-                account_ids = [x.strip() for x in ids_raw.split(",") if x.strip()]
-                try:
-                    accounts = _load_accounts()
-                except Exception as e:
-                    self.send_json({"ok": False, "error": str(e), "cases": [], "numFound": 0}, 500)
-                    return
-                nums = _collect_account_numbers_for_portal_search(accounts, account_ids)
-                # No configured account numbers: only allow Portal "discovery" when the user typed keywords
-                # (search by case summary / account name / case number across visible cases, time-bounded).
-                discovery = False
-                if not nums:
-                    if not q:
-                        self.send_json(
-                            {
-                                "ok": False,
-                                "error": "No account numbers in scope. Add accounts under Accounts & setup, or type keywords to search the Customer Portal for matching cases and account names.",
-                                "cases": [],
-                                "numFound": 0,
-                            },
-                            400,
-                        )
-                        return
-                    discovery = True
-                srcp = _taminator_src_path()
-                try:
-                    sys.path.insert(0, srcp)
-                    from taminator.core import hydra_search
-
-                    # Same credential resolution as api/test/hydra: Basic if password set; else SSO/Portal Bearer.
-                    basic_auth = _get_hydra_basic_auth()
-                    bearer_token = _get_effective_hydra_token()
-                    token = None if basic_auth else bearer_token
-                    if not basic_auth and not token:
-                        self.send_json(
-                            {
-                                "ok": False,
-                                "error": "Customer Portal token or Red Hat credentials required to search the Customer Portal.",
-                                "cases": [],
-                                "numFound": 0,
-                            },
-                            400,
-                        )
-                        return
-                    modified_after = None
-                    products_for_query = None
-                    if discovery:
-                        # Bound unscoped keyword search (configured accounts not required).
-                        modified_after = (datetime.utcnow() - timedelta(days=365)).strftime("%Y-%m-%d")
-                    elif _every_account_in_scope_has_sbr(accounts, account_ids):
-                        # Account number(s) + SBR on every selected row: no date cap (old RFEs); filter by product.
-                        products_for_query = _sbr_products_for_portal_search(accounts, account_ids) or None
-                    elif not q:
-                        # Account scope without full SBR setup: keep a time bound when listing all cases (no keywords).
-                        modified_after = (datetime.utcnow() - timedelta(days=90)).strftime("%Y-%m-%d")
-                    solr_q = hydra_search.build_solr_query_portal_search(
-                        q,
-                        nums if not discovery else [],
-                        include_closed=False,
-                        modified_after=modified_after,
-                        products=products_for_query,
-                    )
-                    try:
-                        rows_req = int((qs.get("rows") or ["50"])[0])
-                    except ValueError:
-                        rows_req = 50
-                    rows_req = max(1, min(rows_req, 150))
-                    result = hydra_search.search_cases(
-                        token=token,
-                        query=solr_q,
-                        start=0,
-                        rows=rows_req,
-                        basic_auth=basic_auth,
-                        timeout=45,
-                        basic_auth_fallback=_get_hydra_basic_auth_credentials() if not basic_auth else None,
-                        bearer_fallback=bearer_token if basic_auth else None,
-                    )
-                    docs = result.get("response", {}).get("docs", [])
-                    num_found = result.get("response", {}).get("numFound", len(docs))
-                    cases_out = [hydra_search.doc_to_portal_search_row(d) for d in docs]
-                    out = {"ok": True, "cases": cases_out, "numFound": num_found}
-                    if discovery:
-                        out["discovery"] = True
-                    self.send_json(out)
-                except Exception as e:
-                    self.send_json({"ok": False, "error": str(e), "cases": [], "numFound": 0}, 500)
-                finally:
-                    if srcp in sys.path:
-                        sys.path.remove(srcp)
-            elif path == "api/report-structure":
-                self.send_json(_load_report_structure())
-            elif path == "api/reports/paths":
-                # Resolved paths so the build API accepts report_dir when sent back
-                paths = [str(p.expanduser().resolve()) for p in REPORT_SEARCH_PATHS]
-                self.send_json({"paths": paths})
-            elif path == "api/config/status":
-                stdout, stderr, code = run_cmd(["config"])
-                self.send_json({"ok": code == 0, "stdout": stdout, "stderr": stderr})
-            elif path == "api/config/jira-settings":
-                try:
-                    tokens = _get_ui_tokens()
-                    base = (tokens.get("jira_base_url") or "").strip()
-                    self.send_json({
-                        "jira_base_url": base or "https://issues.redhat.com",
-                        "jira_email": (tokens.get("jira_email") or "").strip(),
-                        "jira_api_token_set": bool((tokens.get("jira_api_token") or "").strip()),
-                        "jira_token_set": bool((tokens.get("jira_token") or "").strip()),
-                        "is_jira_cloud": "atlassian.net" in (base or ""),
-                    })
-                except Exception as e:
-                    self.send_json({"ok": False, "error": str(e)}, 500)
-            elif path.rstrip("/") == "api/google/set-credentials":
-                self.send_json({"ok": False, "error": "Use POST to save credentials (click Save credentials in the UI)."}, 405)
-            elif path.rstrip("/") == "api/config/set-hydra-credentials":
-                self.send_json({"ok": False, "error": "Use POST to save Hydra credentials (click Save credentials in the UI)."}, 405)
-            elif path == "api/docs":
-                try:
-                    sections = _load_docs_sections()
-                    self.send_json({"sections": sections})
-                except Exception as e:
-                    self.send_json({"ok": False, "error": str(e), "sections": []}, 500)
-            elif path == "api/docs/roadmap":
-                self.send_json(get_roadmap())
-            elif path == "api/vault/status":
-                try:
-                    sys.path.insert(0, _taminator_src_path())
-                    from taminator.core.vault_client import vault_client
-                    from taminator.core.hybrid_auth import hybrid_auth
-                    vstatus = vault_client.get_status()
-                    hstatus = hybrid_auth.get_status()
-                    if _taminator_src_path() in sys.path:
-                        sys.path.remove(_taminator_src_path())
-                    self.send_json({
-                        "available": vstatus.get("available", False),
-                        "addr": vstatus.get("addr") or os.environ.get("VAULT_ADDR") or "Not configured",
-                        "version": vstatus.get("version", "N/A") if vstatus.get("available") else "N/A",
-                        "initialized": vstatus.get("initialized", False) if vstatus.get("available") else None,
-                        "sealed": vstatus.get("sealed", True) if vstatus.get("available") else None,
-                        "strategy": hstatus.get("strategy", "auth-box-only"),
-                        "error": vstatus.get("error") if not vstatus.get("available") else None,
-                    })
-                except Exception as e:
-                    if _taminator_src_path() in sys.path:
-                        sys.path.remove(_taminator_src_path())
-                    self.send_json({"available": False, "addr": os.environ.get("VAULT_ADDR") or "Not configured", "strategy": "auth-box-only", "error": str(e)}, 200)
-            elif path == "api/vault/list":
-                try:
-                    sys.path.insert(0, _taminator_src_path())
-                    from taminator.core.vault_client import vault_client
-                    tokens = vault_client.list_tokens()
-                    if _taminator_src_path() in sys.path:
-                        sys.path.remove(_taminator_src_path())
-                    self.send_json({"ok": True, "tokens": [k.replace("/", "") for k in (tokens or [])]})
-                except Exception as e:
-                    if _taminator_src_path() in sys.path:
-                        sys.path.remove(_taminator_src_path())
-                    self.send_json({"ok": False, "error": str(e), "tokens": []}, 500)
-            elif path == "api/vault/get":
-                service = (qs.get("service") or [""])[0].strip()
-                if not service:
-                    self.send_json({"ok": False, "error": "service required"}, 400)
-                    return
-                try:
-                    sys.path.insert(0, _taminator_src_path())
-                    from taminator.core.hybrid_auth import hybrid_auth
-                    token = hybrid_auth.get_token(service, required=False)
-                    if _taminator_src_path() in sys.path:
-                        sys.path.remove(_taminator_src_path())
-                    self.send_json({"ok": True, "value": token or ""})
-                except Exception as e:
-                    if _taminator_src_path() in sys.path:
-                        sys.path.remove(_taminator_src_path())
-                    self.send_json({"ok": False, "error": str(e), "value": ""}, 500)
-            else:
-                self.send_json({"ok": False, "error": "Not found"}, 404)
-            return
-        self.send_html(path or "index.html")
+    def _do_get_status(self, qs):
+        """GET api/status"""
+        self.send_json({
+            "status": "ok",
+            "service": "rfe_bug_tracker",
+            "display_name": "RFE and Bug Tracker",
+            "ui": _ui_status_payload(),
+        })
 
-    def _do_post_reports_build(self, data: dict):
-        """Handle POST api/reports/build: create a new report file from template."""
-        customer_slug = (_slug((data.get("customer_slug") or data.get("customer_id") or data.get("id") or "").strip()) or "").strip()
-        display_name = (data.get("display_name") or "").strip() or customer_slug.replace("_", " ").title()
-        account = (data.get("account") or data.get("account_number") or "").strip()
-        account_numbers = _normalize_account_numbers(data.get("account_numbers") or account)
-        if account_numbers:
-            account = ", ".join(account_numbers)
-        contact = (data.get("contact") or data.get("primary_contact") or "").strip()
-        tam = (data.get("tam") or data.get("tam_name") or "").strip()
-        sbr_groups = _normalize_sbr_groups(data.get("sbr_groups"))
-        report_dir = (data.get("report_dir") or "").strip()
-        if not customer_slug:
-            self.send_json({"ok": False, "error": "customer_slug or id is required"}, 400)
-            return
-        allowed_resolved = {str(p.resolve()) for p in REPORT_SEARCH_PATHS}
-        if report_dir:
-            dir_path = Path(report_dir).expanduser().resolve()
-            if str(dir_path) not in allowed_resolved:
-                self.send_json({"ok": False, "error": "report_dir must be one of the allowed paths"}, 400)
-                return
+    def _do_get_version(self, qs):
+        """GET api/version"""
+        self.send_json({"version": self._get_app_version()})
+
+    def _do_get_jobs(self, qs):
+        """GET api/jobs"""
+        with _jobs_lock:
+            jobs = sorted(_jobs.values(), key=lambda j: j.created_at, reverse=True)
+        self.send_json({"ok": True, "jobs": [j.to_dict(include_result=False) for j in jobs]})
+
+    def _do_get_job(self, path, qs):
+        """GET api/jobs/<id>[/events]"""
+        parts = path.split("/")
+        job = get_job(parts[2]) if len(parts) >= 3 else None
+        if not job:
+            self.send_json({"ok": False, "error": "Job not found"}, 404)
+        elif len(parts) == 4 and parts[3] == "events":
+            self._stream_job_events(job)
+        elif len(parts) == 3:
+            self.send_json({"ok": True, "job": job.to_dict()})
         else:
-            dir_path = REPORT_SEARCH_PATHS[0].resolve()
-        dir_path.mkdir(parents=True, exist_ok=True)
-        fmt = (data.get("format") or "markdown").strip().lower()
-        if fmt not in ("markdown", "html", "text", "csv"):
-            fmt = "markdown"
+            self.send_json({"ok": False, "error": "Not found"}, 404)
+
+    def _do_get_status_indicators(self, qs):
+        """GET api/status/indicators (served from the background-refreshed cache; ?refresh=1 re-checks now)"""
+        if (qs.get("refresh") or [""])[0].lower() in ("1", "true", "yes"):
+            self.send_json(_status_indicators.refresh())
+        else:
+            self.send_json(_status_indicators.get())
+
+    def _do_get_library(self, qs):
+        """GET api/library"""
+        # Library lists only report files that have been created (no "no file yet" placeholders)
+        reports = list_reports()
+        accounts_by_id = {
+            (a.get("id") or "").strip().lower(): (a.get("customer_name") or a.get("id") or "").strip()
+            for a in _load_accounts()
+        }
+        for r in reports:
+            r["display_name"] = accounts_by_id.get((r.get("customer") or "").lower()) or r.get("customer") or ""
+        self.send_json({"reports": reports})
+
+    def _do_get_report(self, qs):
+        """GET api/report"""
+        customer = (qs.get("customer") or [""])[0].strip()
+        if not customer:
+            self.send_json({"error": "customer required"}, 400)
+            return
+        content, err = get_report_content(customer)
+        if err:
+            self.send_json({"ok": False, "error": err}, 404)
+            return
+        self.send_json({"customer": customer, "content": content})
+
+    def _do_get_google_status(self, qs):
+        """GET api/google/status"""
+        try:
+            _ensure_taminator_on_path()
+            from taminator.integrations.google_drive import is_configured, get_credentials
+            configured = is_configured()
+            connected = bool(get_credentials()) if configured else False
+            self.send_json({"configured": configured, "connected": connected})
+        except Exception:
+            self.send_json({"configured": False, "connected": False})
+
+    def _do_get_vpn_check(self, qs):
+        """GET api/vpn/check"""
+        self.send_json(check_vpn())
+
+    def _do_get_test_hydra(self, qs):
+        """GET api/test/hydra"""
+        self.send_json(test_hydra_access())
+
+    def _do_get_accounts(self, qs):
+        """GET api/accounts"""
+        try:
+            accounts = _load_accounts()
+            self.send_json({"accounts": accounts})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_get_portal_search(self, qs):
+        """GET api/portal/search"""
+        q = (qs.get("q") or [""])[0].strip()
+        ids_raw = (qs.get("accounts") or [""])[0].strip()
+        account_ids = [x.strip() for x in ids_raw.split(",") if x.strip()]
+        try:
+            accounts = _load_accounts()
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e), "cases": [], "numFound": 0}, 500)
+            return
+        nums = _collect_account_numbers_for_portal_search(accounts, account_ids)
+        # No configured account numbers: only allow Portal "discovery" when the user typed keywords
+        # (search by case summary / account name / case number across visible cases, time-bounded).
+        discovery = False
+        if not nums:
+            if not q:
+                self.send_json(
+                    {
+                        "ok": False,
+                        "error": "No account numbers in scope. Add accounts under Accounts & setup, or type keywords to search the Customer Portal for matching cases and account names.",
+                        "cases": [],
+                        "numFound": 0,
+                    },
+                    400,
+                )
+                return
+            discovery = True
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core import hydra_search
+
+            # Same credential resolution as api/test/hydra: Basic if password set; else SSO/Portal Bearer.
+            basic_auth = _get_hydra_basic_auth()
+            bearer_token = _get_effective_hydra_token()
+            token = None if basic_auth else bearer_token
+            if not basic_auth and not token:
+                self.send_json(
+                    {
+                        "ok": False,
+                        "error": "Customer Portal token or Red Hat credentials required to search the Customer Portal.",
+                        "cases": [],
+                        "numFound": 0,
+                    },
+                    400,
+                )
+                return
+            modified_after = None
+            products_for_query = None
+            if discovery:
+                # Bound unscoped keyword search (configured accounts not required).
+                modified_after = (datetime.utcnow() - timedelta(days=365)).strftime("%Y-%m-%d")
+            elif _every_account_in_scope_has_sbr(accounts, account_ids):
+                # Account number(s) + SBR on every selected row: no date cap (old RFEs); filter by product.
+                products_for_query = _sbr_products_for_portal_search(accounts, account_ids) or None
+            elif not q:
+                # Account scope without full SBR setup: keep a time bound when listing all cases (no keywords).
+                modified_after = (datetime.utcnow() - timedelta(days=90)).strftime("%Y-%m-%d")
+            solr_q = hydra_search.build_solr_query_portal_search(
+                q,
+                nums if not discovery else [],
+                include_closed=False,
+                modified_after=modified_after,
+                products=products_for_query,
+            )
+            try:
+                rows_req = int((qs.get("rows") or ["50"])[0])
+            except ValueError:
+                rows_req = 50
+            rows_req = max(1, min(rows_req, 150))
+            result = hydra_search.search_cases(
+                token=token,
+                query=solr_q,
+                start=0,
+                rows=rows_req,
+                basic_auth=basic_auth,
+                timeout=45,
+                basic_auth_fallback=_get_hydra_basic_auth_credentials() if not basic_auth else None,
+                bearer_fallback=bearer_token if basic_auth else None,
+                profile="portal-row",
+            )
+            docs = hydra_search.refetch_docs_without_jira(
+                result.get("response", {}).get("docs", []),
+                "portal-row",
+                token=token,
+                basic_auth=basic_auth,
+                basic_auth_fallback=_get_hydra_basic_auth_credentials() if not basic_auth else None,
+                bearer_fallback=bearer_token if basic_auth else None,
+            )
+            num_found = result.get("response", {}).get("numFound", len(docs))
+            cases_out = [hydra_search.doc_to_portal_search_row(d) for d in docs]
+            out = {"ok": True, "cases": cases_out, "numFound": num_found}
+            if discovery:
+                out["discovery"] = True
+            self.send_json(out)
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e), "cases": [], "numFound": 0}, 500)
+
+    def _do_get_report_structure(self, qs):
+        """GET api/report-structure"""
+        self.send_json(_load_report_structure())
+
+    def _do_get_reports_paths(self, qs):
+        """GET api/reports/paths"""
+        # Resolved paths so the build API accepts report_dir when sent back
+        paths = [str(p.expanduser().resolve()) for p in REPORT_SEARCH_PATHS]
+        self.send_json({"paths": paths})
+
+    def _do_get_config_status(self, qs):
+        """GET api/config/status"""
+        stdout, stderr, code = run_cmd(["config"])
+        self.send_json({"ok": code == 0, "stdout": stdout, "stderr": stderr})
+
+    def _do_get_config_jira_settings(self, qs):
+        """GET api/config/jira-settings"""
+        try:
+            tokens = _get_ui_tokens()
+            base = (tokens.get("jira_base_url") or "").strip()
+            self.send_json({
+                "jira_base_url": base or "https://issues.redhat.com",
+                "jira_email": (tokens.get("jira_email") or "").strip(),
+                "jira_api_token_set": bool((tokens.get("jira_api_token") or "").strip()),
+                "jira_token_set": bool((tokens.get("jira_token") or "").strip()),
+                "is_jira_cloud": "atlassian.net" in (base or ""),
+            })
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_get_google_set_credentials(self, qs):
+        """GET api/google/set-credentials"""
+        self.send_json({"ok": False, "error": "Use POST to save credentials (click Save credentials in the UI)."}, 405)
+
+    def _do_get_config_set_hydra_credentials(self, qs):
+        """GET api/config/set-hydra-credentials"""
+        self.send_json({"ok": False, "error": "Use POST to save Hydra credentials (click Save credentials in the UI)."}, 405)
+
+    def _do_get_docs(self, qs):
+        """GET api/docs"""
+        try:
+            sections = _load_docs_sections()
+            self.send_json({"sections": sections})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e), "sections": []}, 500)
+
+    def _do_get_docs_roadmap(self, qs):
+        """GET api/docs/roadmap"""
+        self.send_json(get_roadmap())
+
+    def _do_get_vault_status(self, qs):
+        """GET api/vault/status"""
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.vault_client import vault_client
+            from taminator.core.hybrid_auth import hybrid_auth
+            vstatus = vault_client.get_status(refresh=True)
+            hstatus = hybrid_auth.get_status()
+            self.send_json({
+                "available": vstatus.get("available", False),
+                "addr": vstatus.get("addr") or os.environ.get("VAULT_ADDR") or "Not configured",
+                "version": vstatus.get("version", "N/A") if vstatus.get("available") else "N/A",
+                "initialized": vstatus.get("initialized", False) if vstatus.get("available") else None,
+                "sealed": vstatus.get("sealed", True) if vstatus.get("available") else None,
+                "strategy": hstatus.get("strategy", "auth-box-only"),
+                "error": vstatus.get("error") if not vstatus.get("available") else None,
+            })
+        except Exception as e:
+            self.send_json({"available": False, "addr": os.environ.get("VAULT_ADDR") or "Not configured", "strategy": "auth-box-only", "error": str(e)}, 200)
+
+    def _do_get_vault_list(self, qs):
+        """GET api/vault/list"""
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.vault_client import vault_client
+            tokens = vault_client.list_tokens()
+            self.send_json({"ok": True, "tokens": [k.replace("/", "") for k in (tokens or [])]})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e), "tokens": []}, 500)
+
+    def _do_get_vault_get(self, qs):
+        """GET api/vault/get"""
+        service = (qs.get("service") or [""])[0].strip()
+        if not service:
+            self.send_json({"ok": False, "error": "service required"}, 400)
+            return
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.hybrid_auth import hybrid_auth
+            token = hybrid_auth.get_token(service, required=False)
+            self.send_json({"ok": True, "value": token or ""})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e), "value": ""}, 500)
+
+    def _do_get_metrics(self, qs):
+        """GET api/metrics: request counts and latency histograms per route since the server started"""
+        self.send_json(_route_timings.snapshot())
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path.strip("/")
+        if not path.startswith("api/"):
+            self._dispatch("GET", "(static)", self.send_html, path or "index.html")
+            return
+        qs = parse_qs(parsed.query)
+        name = self.GET_ROUTES.get(path)
+        if name:
+            self._dispatch("GET", path, getattr(self, name), qs)
+            return
+        for prefix, name in self.GET_PREFIX_ROUTES:
+            if path.startswith(prefix):
+                self._dispatch("GET", prefix + "*", getattr(self, name), path, qs)
+                return
+        self._dispatch("GET", "(not found)", self.send_json, {"ok": False, "error": "Not found"}, 404)
+
+    def _apply_accounts_change(self, data: dict):
+        """POST api/accounts body: add (default), update or delete a configured account."""
+        action = (data.get("action") or "add").strip().lower()
+        accounts = _load_accounts()
+        aid = (data.get("id") or "").strip()
+        account_number = (data.get("account_number") or "").strip()
+        account_numbers = _normalize_account_numbers(data.get("account_numbers") or (account_number if account_number else None))
+        if not account_numbers and account_number:
+            account_numbers = [account_number]
+        customer_name = (data.get("customer_name") or "").strip()
+        if action == "delete":
+            if not aid:
+                self.send_json({"ok": False, "error": "id required to delete"}, 400)
+                return
+            new_list = [a for a in accounts if (a.get("id") or "").strip() != aid]
+            if len(new_list) == len(accounts):
+                self.send_json({"ok": False, "error": "Account not found"}, 404)
+                return
+            _save_accounts(new_list)
+            self.send_json({"ok": True, "message": "Account removed", "accounts": new_list})
+            return
+        if action == "update":
+            if not aid:
+                self.send_json({"ok": False, "error": "id required to update"}, 400)
+                return
+            idx = next((i for i, a in enumerate(accounts) if (a.get("id") or "").strip() == aid), None)
+            if idx is None:
+                self.send_json({"ok": False, "error": "Account not found"}, 404)
+                return
+            if account_numbers:
+                accounts[idx]["account_numbers"] = account_numbers
+                accounts[idx]["account_number"] = account_numbers[0]
+            if customer_name:
+                accounts[idx]["customer_name"] = customer_name
+            if "sbr_groups" in data:
+                accounts[idx]["sbr_groups"] = _normalize_sbr_groups(data["sbr_groups"])
+            _save_accounts(accounts)
+            self.send_json({"ok": True, "message": "Account updated", "accounts": accounts})
+            return
+        # add
+        if not customer_name or not account_numbers:
+            self.send_json({"ok": False, "error": "customer_name and at least one account number required"}, 400)
+            return
+        # Avoid duplicate accounts: only merge when same account numbers and same SBR group
+        idx, existing = _find_account_by_account_numbers(accounts, account_numbers, sbr_groups=data.get("sbr_groups") or [])
+        if idx is not None:
+            merged_nums = list(dict.fromkeys((existing.get("account_numbers") or []) + list(account_numbers)))
+            merged_nums = _normalize_account_numbers(merged_nums) or merged_nums
+            accounts[idx]["account_numbers"] = merged_nums
+            accounts[idx]["account_number"] = merged_nums[0] if merged_nums else ""
+            accounts[idx]["customer_name"] = customer_name
+            if "sbr_groups" in data:
+                accounts[idx]["sbr_groups"] = _normalize_sbr_groups(data["sbr_groups"])
+            _save_accounts(accounts)
+            self.send_json({"ok": True, "message": "Account updated (already had this account number)", "accounts": accounts})
+            return
+        if not aid:
+            aid = _slug(customer_name)
+        if not aid:
+            self.send_json({"ok": False, "error": "Could not derive id from customer name"}, 400)
+            return
+        if any((a.get("id") or "").strip() == aid for a in accounts):
+            self.send_json({"ok": False, "error": f"Account with id '{aid}' already exists"}, 400)
+            return
+        entry = {"id": aid, "account_numbers": account_numbers, "account_number": account_numbers[0], "customer_name": customer_name, "created_at": datetime.utcnow().isoformat() + "Z"}
+        sbr = _normalize_sbr_groups(data.get("sbr_groups"))
+        if sbr:
+            entry["sbr_groups"] = sbr
+        accounts.append(entry)
+        _save_accounts(accounts)
+        self.send_json({"ok": True, "message": "Account added", "accounts": accounts})
+
+    def _do_post_reports_build(self, data: dict):
+        """Handle POST api/reports/build: create a new report file from template."""
+        customer_slug = (_slug((data.get("customer_slug") or data.get("customer_id") or data.get("id") or "").strip()) or "").strip()
+        display_name = (data.get("display_name") or "").strip() or customer_slug.replace("_", " ").title()
+        account = (data.get("account") or data.get("account_number") or "").strip()
+        account_numbers = _normalize_account_numbers(data.get("account_numbers") or account)
+        if account_numbers:
+            account = ", ".join(account_numbers)
+        contact = (data.get("contact") or data.get("primary_contact") or "").strip()
+        tam = (data.get("tam") or data.get("tam_name") or "").strip()
+        sbr_groups = _normalize_sbr_groups(data.get("sbr_groups"))
+        report_dir = (data.get("report_dir") or "").strip()
+        if not customer_slug:
+            self.send_json({"ok": False, "error": "customer_slug or id is required"}, 400)
+            return
+        allowed_resolved = {str(p.resolve()) for p in REPORT_SEARCH_PATHS}
+        if report_dir:
+            dir_path = Path(report_dir).expanduser().resolve()
+            if str(dir_path) not in allowed_resolved:
+                self.send_json({"ok": False, "error": "report_dir must be one of the allowed paths"}, 400)
+                return
+        else:
+            dir_path = REPORT_SEARCH_PATHS[0].resolve()
+        dir_path.mkdir(parents=True, exist_ok=True)
+        fmt = (data.get("format") or "markdown").strip().lower()
+        if fmt not in ("markdown", "html", "text", "csv"):
+            fmt = "markdown"
         ext = {"markdown": ".md", "html": ".html", "text": ".txt", "csv": ".csv"}[fmt]
         report_path = dir_path / f"{customer_slug}{ext}"
         if report_path.exists() and not data.get("overwrite"):
@@ -1720,29 +2278,28 @@ class TaminatorHandler(BaseHTTPRequestHandler):
                 content = _markdown_to_plain_text(content)
             elif fmt == "csv":
                 content = _markdown_tables_to_csv(content)
-            report_path.write_text(content, encoding="utf-8")
+            _atomic_write_text(report_path, content)
 
             # Always add this account to configured accounts when creating a report so it appears on Check/Update and Library
             account_added = False
             try:
-                accounts = _load_accounts()
-                existing_ids = {(a.get("id") or "").strip().lower() for a in accounts}
-                if customer_slug and customer_slug.lower() not in existing_ids:
-                    nums = account_numbers or []
-                    entry = {"id": customer_slug, "account_numbers": nums, "account_number": (nums[0] if nums else ""), "customer_name": display_name, "created_at": datetime.utcnow().isoformat() + "Z"}
-                    if sbr_groups:
-                        entry["sbr_groups"] = sbr_groups
-                    accounts.append(entry)
-                    _save_accounts(accounts)
-                    account_added = True
+                with _accounts_store().batch() as accounts:
+                    existing_ids = {(a.get("id") or "").strip().lower() for a in accounts}
+                    if customer_slug and customer_slug.lower() not in existing_ids:
+                        nums = account_numbers or []
+                        entry = {"id": customer_slug, "account_numbers": nums, "account_number": (nums[0] if nums else ""), "customer_name": display_name, "created_at": datetime.utcnow().isoformat() + "Z"}
+                        if sbr_groups:
+                            entry["sbr_groups"] = sbr_groups
+                        accounts.append(entry)
+                        account_added = True
             except Exception as save_err:
                 # Don't fail the whole request if accounts save fails; report file was already created
                 self.send_json({"ok": True, "path": str(report_path), "customer": customer_slug, "message": f"Report created: {report_path}. Account could not be added to config: {save_err}", "account_added": False})
                 return
 
             # Populate the new report from JIRA and Customer Portal (same as "Update report")
-            update_stdout, update_stderr, update_code = run_cmd(["update", customer_slug, "-y"])
-            populated = update_code == 0
+            update_run = run_tam_command("update", customer_slug)
+            populated = update_run["returncode"] == 0
             msg = f"Report created: {report_path}"
             if populated:
                 msg += ". Fetched data from JIRA and Customer Portal."
@@ -1757,648 +2314,637 @@ class TaminatorHandler(BaseHTTPRequestHandler):
                 "message": msg,
                 "populated": populated,
                 "account_added": account_added,
-                "update_stdout": update_stdout,
-                "update_stderr": update_stderr,
+                "update_stdout": update_run["stdout"],
+                "update_stderr": update_run["stderr"],
             })
         except Exception as e:
             self.send_json({"ok": False, "error": str(e)}, 500)
 
-    def do_POST(self):
-        parsed = urlparse(self.path)
-        path = (parsed.path or "").strip().strip("/").rstrip("/")
-        try:
-            content_length = int(self.headers.get("Content-Length") or 0)
-        except ValueError:
-            content_length = 0
-        body = self.rfile.read(content_length).decode("utf-8", errors="replace") if content_length else "{}"
-        try:
-            data = json.loads(body) if body.strip() else {}
-        except json.JSONDecodeError:
-            data = {}
-        if path == "api/google/create-doc":
-            # Create Google Doc from report content; return URL.
-            customer = (data.get("customer") or "").strip()
-            title = (data.get("title") or "").strip() or (customer and f"RFE Report - {customer}")
-            content = data.get("content")
-            if not content and customer:
-                content, err = get_report_content(customer)
-                if err:
-                    self.send_json({"ok": False, "error": err}, 400)
-                    return
-            if not content:
-                self.send_json({"ok": False, "error": "Provide customer (to load report) or content and title."}, 400)
+    def _do_post_google_create_doc(self, data: dict):
+        """POST api/google/create-doc"""
+        # Create Google Doc from report content; return URL.
+        customer = (data.get("customer") or "").strip()
+        title = (data.get("title") or "").strip() or (customer and f"RFE Report - {customer}")
+        content = data.get("content")
+        if not content and customer:
+            content, err = get_report_content(customer)
+            if err:
+                self.send_json({"ok": False, "error": err}, 400)
                 return
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.integrations.google_drive import create_doc_from_text, get_credentials
-                if not get_credentials():
-                    self.send_json({"ok": False, "error": "Google Drive not connected. In Settings → Google Drive & Docs, add client ID/secret and click Connect Google."}, 400)
-                    return
-                result = create_doc_from_text(title or "RFE and Bug Tracker Report", content)
-                self.send_json({"ok": True, "url": result.get("url", ""), "id": result.get("id", "")})
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 400)
-            finally:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
+        if not content:
+            self.send_json({"ok": False, "error": "Provide customer (to load report) or content and title."}, 400)
             return
-        if path == "api/google/create-gmail-draft":
-            customer = (data.get("customer") or "").strip()
-            title = (data.get("title") or "").strip() or (customer and f"RFE Report - {customer}")
-            content = data.get("content")
-            if not content and customer:
-                content, err = get_report_content(customer)
-                if err:
-                    self.send_json({"ok": False, "error": err}, 400)
-                    return
-            if not content:
-                self.send_json({"ok": False, "error": "Provide customer (to load report) or content and title."}, 400)
+        try:
+            _ensure_taminator_on_path()
+            from taminator.integrations.google_drive import create_doc_from_text, get_credentials
+            if not get_credentials():
+                self.send_json({"ok": False, "error": "Google Drive not connected. In Settings → Google Drive & Docs, add client ID/secret and click Connect Google."}, 400)
                 return
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.integrations.google_drive import create_gmail_draft, get_credentials
-                if not get_credentials():
-                    self.send_json({"ok": False, "error": "Google not connected. In Settings → Google Drive & Docs, add client ID/secret and click Connect Google. Reconnect to enable Gmail drafts."}, 400)
-                    return
-                result = create_gmail_draft(title or "RFE and Bug Tracker Report", content)
-                self.send_json({"ok": True, "url": result.get("url", ""), "draft_id": result.get("draft_id", ""), "message_id": result.get("message_id", "")})
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 400)
-            finally:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
+            result = create_doc_from_text(title or "RFE and Bug Tracker Report", content)
+            self.send_json({"ok": True, "url": result.get("url", ""), "id": result.get("id", "")})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 400)
+
+    def _do_post_google_create_gmail_draft(self, data: dict):
+        """POST api/google/create-gmail-draft"""
+        customer = (data.get("customer") or "").strip()
+        title = (data.get("title") or "").strip() or (customer and f"RFE Report - {customer}")
+        content = data.get("content")
+        if not content and customer:
+            content, err = get_report_content(customer)
+            if err:
+                self.send_json({"ok": False, "error": err}, 400)
+                return
+        if not content:
+            self.send_json({"ok": False, "error": "Provide customer (to load report) or content and title."}, 400)
             return
-        if path.rstrip("/") == "api/google/set-credentials" or path == "api/google/set-credentials":
-            client_id = (data.get("client_id") or "").strip()
-            client_secret = (data.get("client_secret") or data.get("client_secret_value") or "").strip()
-            if not client_id or not client_secret:
-                self.send_json({"ok": False, "error": "client_id and client_secret are required"}, 400)
+        try:
+            _ensure_taminator_on_path()
+            from taminator.integrations.google_drive import create_gmail_draft, get_credentials
+            if not get_credentials():
+                self.send_json({"ok": False, "error": "Google not connected. In Settings → Google Drive & Docs, add client ID/secret and click Connect Google. Reconnect to enable Gmail drafts."}, 400)
                 return
-            config_dir = Path.home() / ".config" / "taminator"
-            config_dir.mkdir(parents=True, exist_ok=True)
-            credentials_file = config_dir / "google_credentials.json"
-            payload = {
-                "installed": {
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": ["http://localhost"],
-                }
+            result = create_gmail_draft(title or "RFE and Bug Tracker Report", content)
+            self.send_json({"ok": True, "url": result.get("url", ""), "draft_id": result.get("draft_id", ""), "message_id": result.get("message_id", "")})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 400)
+
+    def _do_post_google_set_credentials(self, data: dict):
+        """POST api/google/set-credentials"""
+        client_id = (data.get("client_id") or "").strip()
+        client_secret = (data.get("client_secret") or data.get("client_secret_value") or "").strip()
+        if not client_id or not client_secret:
+            self.send_json({"ok": False, "error": "client_id and client_secret are required"}, 400)
+            return
+        config_dir = Path.home() / ".config" / "taminator"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        credentials_file = config_dir / "google_credentials.json"
+        payload = {
+            "installed": {
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+                "redirect_uris": ["http://localhost"],
             }
-            try:
-                with open(credentials_file, "w") as f:
-                    json.dump(payload, f, indent=2)
-                os.chmod(credentials_file, 0o600)
-                self.send_json({"ok": True, "message": "Credentials saved. Click Connect Google to sign in."})
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 500)
+        }
+        try:
+            with open(credentials_file, "w") as f:
+                json.dump(payload, f, indent=2)
+            os.chmod(credentials_file, 0o600)
+            self.send_json({"ok": True, "message": "Credentials saved. Click Connect Google to sign in."})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_report_structure(self, data: dict):
+        """POST api/report-structure"""
+        try:
+            _save_report_structure(data)
+            self.send_json({"ok": True, "message": "Report structure saved.", "structure": _load_report_structure()})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_report_structure_preview(self, data: dict):
+        """POST api/report-structure/preview"""
+        try:
+            struct = dict(DEFAULT_REPORT_STRUCTURE)
+            for k in struct:
+                if k in data and data[k] is not None:
+                    if k == "section_order" and isinstance(data[k], list):
+                        struct[k] = [str(x) for x in data[k] if str(x) in ("customer_info", "rfe", "bug", "notes")] or struct[k]
+                    elif k == "section_included" and isinstance(data[k], dict):
+                        struct[k] = {sid: bool(data[k].get(sid, True)) for sid in ("customer_info", "rfe", "bug", "notes")}
+                    elif k not in ("section_order", "section_included"):
+                        struct[k] = str(data[k]).strip() or struct[k]
+            markdown = _build_report_from_structure(
+                struct, "sample", "Sample Customer", "12345", "contact@example.com", "TAM Name"
+            )
+            doc = _parse_report(markdown)
+            self.send_json({"markdown": markdown, "html": doc.to_html(), "text": doc.to_plain_text(), "csv": doc.to_csv()})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_cases_from_paste(self, data: dict):
+        """POST api/cases/from-paste"""
+        # Paste case numbers (or dump text); discover via Hydra, get JIRA statuses, auto-configure accounts.
+        pasted = (data.get("pasted") or "").strip()
+        case_numbers = data.get("case_numbers")
+        if isinstance(case_numbers, list):
+            case_numbers = [str(c).strip() for c in case_numbers if str(c).strip()]
+        else:
+            case_numbers = []
+        if not case_numbers and pasted:
+            # Parse case numbers from pasted text (e.g. Salesforce dump): 04xxxxxx or 8+ digit numbers
+            case_numbers = list(dict.fromkeys(re.findall(r"\b(04\d{6})\b|\b(\d{8,})\b", pasted)))
+            case_numbers = [c[0] or c[1] for c in case_numbers if c[0] or c[1]]
+        if not case_numbers:
+            self.send_json({"ok": False, "error": "Paste case numbers or a case list (e.g. from Salesforce), or send case_numbers array."}, 400)
             return
-        if path == "api/report-structure":
-            try:
-                _save_report_structure(data)
-                self.send_json({"ok": True, "message": "Report structure saved.", "structure": _load_report_structure()})
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 500)
+        self._send_job_or_run(data, "cases/from-paste", lambda job: _cases_from_paste(case_numbers))
+
+    def _do_post_jira_from_paste(self, data: dict):
+        """POST api/jira/from-paste"""
+        # JIRA keys/URLs only — for accounts with no case↔JIRA linkage in access.redhat.com (e.g. SNOW, ROSA FedRAMP).
+        pasted = (data.get("pasted") or "").strip()
+        if not pasted:
+            self.send_json({"ok": False, "error": "Paste at least one JIRA key or URL."}, 400)
             return
-        if path == "api/report-structure/preview":
-            try:
-                struct = dict(DEFAULT_REPORT_STRUCTURE)
-                for k in struct:
-                    if k in data and data[k] is not None:
-                        if k == "section_order" and isinstance(data[k], list):
-                            struct[k] = [str(x) for x in data[k] if str(x) in ("customer_info", "rfe", "bug", "notes")] or struct[k]
-                        elif k == "section_included" and isinstance(data[k], dict):
-                            struct[k] = {sid: bool(data[k].get(sid, True)) for sid in ("customer_info", "rfe", "bug", "notes")}
-                        elif k not in ("section_order", "section_included"):
-                            struct[k] = str(data[k]).strip() or struct[k]
-                markdown = _build_report_from_structure(
-                    struct, "sample", "Sample Customer", "12345", "contact@example.com", "TAM Name"
-                )
-                html = _markdown_to_html_fallback(markdown)
-                text = _markdown_to_plain_text(markdown)
-                csv_content = _markdown_tables_to_csv(markdown)
-                self.send_json({"markdown": markdown, "html": html, "text": text, "csv": csv_content})
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 500)
+        jira_keys = _parse_jira_keys_from_paste(pasted)
+        if not jira_keys:
+            self.send_json(
+                {
+                    "ok": False,
+                    "error": "No JIRA issue keys found. Paste issues.redhat.com browse links or issue keys (e.g. AAPRFE-100).",
+                },
+                400,
+            )
             return
-        if path == "api/reports/build":
-            self._do_post_reports_build(data)
+        if len(jira_keys) > 200:
+            self.send_json({"ok": False, "error": "Too many issues; paste at most 200 keys at a time."}, 400)
             return
-        if path == "api/cases/from-paste":
-            # Paste case numbers (or dump text); discover via Hydra, get JIRA statuses, auto-configure accounts.
-            pasted = (data.get("pasted") or "").strip()
-            case_numbers = data.get("case_numbers")
-            if isinstance(case_numbers, list):
-                case_numbers = [str(c).strip() for c in case_numbers if str(c).strip()]
-            else:
-                case_numbers = []
-            if not case_numbers and pasted:
-                # Parse case numbers from pasted text (e.g. Salesforce dump): 04xxxxxx or 8+ digit numbers
-                case_numbers = list(dict.fromkeys(re.findall(r"\b(04\d{6})\b|\b(\d{8,})\b", pasted)))
-                case_numbers = [c[0] or c[1] for c in case_numbers if c[0] or c[1]]
-            if not case_numbers:
-                self.send_json({"ok": False, "error": "Paste case numbers or a case list (e.g. from Salesforce), or send case_numbers array."}, 400)
-                return
-            _ensure_taminator_on_path()
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.core import hydra_search
-                from taminator.commands.check import JIRAClient
-                from taminator.core import jira_config
-                basic_auth = _get_hydra_basic_auth()
-                bearer_token = _get_effective_hydra_token()
-                token = None if basic_auth else bearer_token
-                if not basic_auth and not token:
-                    self.send_json({"ok": False, "error": "Customer Portal token or Red Hat username/password required for case lookup. Configure in Settings."}, 400)
-                    return
-                cases, detected_accounts = hydra_search.discover_cases_by_case_numbers(
-                    token=token,
-                    case_numbers=case_numbers,
-                    basic_auth=basic_auth,
-                    basic_auth_fallback=_get_hydra_basic_auth_credentials() if not basic_auth else None,
-                    bearer_fallback=bearer_token if basic_auth else None,
-                )
-                if not cases:
-                    self.send_json({"ok": False, "error": "No cases found for those case numbers. Check VPN and Portal credentials.", "case_numbers": case_numbers[:20]}, 404)
-                    return
-                # Auto-configure accounts from detected account info
-                accounts_ensured = []
-                for acc in detected_accounts:
-                    nums = acc.get("account_numbers") or []
-                    name = (acc.get("customer_name") or "").strip()
-                    if nums:
-                        ensured = _ensure_account_from_dump(nums, name)
-                        if ensured:
-                            accounts_ensured.append(ensured)
-                # Fetch JIRA status for each case (report uses JIRA status, not internal/case status)
-                jira_ids = list(dict.fromkeys([c[3] for c in cases if c[3]]))
-                jira_statuses = {}
-                if jira_ids:
-                    _base, _auth_header, _ = jira_config.get_jira_auth()
-                    if _auth_header:
-                        api_url = jira_config.get_jira_api_url()
-                        client = JIRAClient(api_base_url=api_url, auth_header=_auth_header)
-                        for jid in jira_ids:
-                            info = client.get_issue_status(jid)
-                            jira_statuses[jid] = (info or {}).get("status") or "—"
-                    else:
-                        for jid in jira_ids:
-                            jira_statuses[jid] = "—"
-                # Build report rows: case_number, jira_id, summary, jira_status (not case status)
-                report_rows = []
-                for case_number, summary, _case_status, jira_id, kind in cases:
-                    jira_status = jira_statuses.get(jira_id, "—") if jira_id else "—"
-                    report_rows.append({"case_number": case_number, "jira_id": jira_id or "TBD", "summary": summary, "jira_status": jira_status, "kind": kind})
-                # Markdown table snippet
-                def _cell(s):
-                    return (str(s).replace("|", " ").replace("\n", " ").strip()[:200]) if s else ""
-                lines = ["| RED HAT JIRA ID | Support Case | Description | Status/Notes |", "| --- | --- | --- | --- |"]
-                for r in report_rows:
-                    case_cell = f"[{r['case_number']}](https://access.redhat.com/support/cases/#/case/{r['case_number']})" if r["case_number"] else ""
-                    jira_cell = r["jira_id"]
-                    lines.append(f"| {jira_cell} | {case_cell} | {_cell(r['summary'][:80])} | {r['jira_status']} |")
-                report_markdown = "\n".join(lines)
-                self.send_json({
-                    "ok": True,
-                    "cases": report_rows,
-                    "report_markdown": report_markdown,
-                    "accounts_ensured": accounts_ensured,
-                    "detected_accounts": detected_accounts,
-                    "message": f"Found {len(cases)} case(s). " + (f"Added/updated {len(accounts_ensured)} account(s)." if accounts_ensured else ""),
-                })
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 500)
-            finally:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
-            return
-        if path == "api/jira/from-paste":
-            # JIRA keys/URLs only — for accounts with no case↔JIRA linkage in access.redhat.com (e.g. SNOW, ROSA FedRAMP).
-            pasted = (data.get("pasted") or "").strip()
-            if not pasted:
-                self.send_json({"ok": False, "error": "Paste at least one JIRA key or URL."}, 400)
-                return
-            jira_keys = _parse_jira_keys_from_paste(pasted)
-            if not jira_keys:
+        _ensure_taminator_on_path()
+        try:
+            from taminator.commands.check import JIRAClient
+            from taminator.core import jira_config
+            from taminator.commands.update import _format_case_cell, _format_jira_cell, _escape_table_cell
+
+            _base, _auth_header, _ = jira_config.get_jira_auth()
+            if not _auth_header:
                 self.send_json(
                     {
                         "ok": False,
-                        "error": "No JIRA issue keys found. Paste issues.redhat.com browse links or issue keys (e.g. AAPRFE-100).",
+                        "error": "JIRA is not configured. In Settings, add a Red Hat JIRA token (or JIRA Cloud credentials) to look up pasted issues.",
                     },
                     400,
                 )
                 return
-            if len(jira_keys) > 200:
-                self.send_json({"ok": False, "error": "Too many issues; paste at most 200 keys at a time."}, 400)
-                return
-            _ensure_taminator_on_path()
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.commands.check import JIRAClient
-                from taminator.core import jira_config
-                from taminator.commands.update import _format_case_cell, _format_jira_cell, _escape_table_cell
-
-                _base, _auth_header, _ = jira_config.get_jira_auth()
-                if not _auth_header:
-                    self.send_json(
-                        {
-                            "ok": False,
-                            "error": "JIRA is not configured. In Settings, add a Red Hat JIRA token (or JIRA Cloud credentials) to look up pasted issues.",
-                        },
-                        400,
-                    )
-                    return
-                api_url = jira_config.get_jira_api_url()
-                client = JIRAClient(api_base_url=api_url, auth_header=_auth_header)
-                rfe_row_lines = []
-                bug_row_lines = []
-                report_rows = []
-                for jid in jira_keys:
-                    info = client.get_issue_status(jid) or {}
-                    st = (info.get("status") or "").strip() or "—"
-                    if st in ("ERROR", "NOT_FOUND"):
-                        st = (info.get("error") or st).strip()
-                    summary = (info.get("summary") or "—").strip() or "—"
-                    itype = (info.get("issue_type") or "").strip()
-                    kind = _classify_jira_paste_row_kind(itype, summary)
-                    jira_cell = _format_jira_cell(jid)
-                    case_cell = _format_case_cell(NOT_IN_PORTAL_SUPPORT_CASE_LABEL)
-                    row_line = f"| {jira_cell} | {case_cell} | {_escape_table_cell(summary[:200])} | {_escape_table_cell(str(st)[:200])} |"
-                    if kind == "Bug":
-                        bug_row_lines.append(row_line)
-                    else:
-                        rfe_row_lines.append(row_line)
-                    report_rows.append(
-                        {
-                            "jira_id": jid,
-                            "summary": summary,
-                            "jira_status": st,
-                            "issue_type": itype,
-                            "kind": kind,
-                            "no_portal_case": True,
-                        }
-                    )
-                sep = "|-----------------|--------------|-------------|--------------|"
-                head = "| RED HAT JIRA ID | Support Case | Description | Status/Notes |"
-                parts = []
-                if rfe_row_lines:
-                    parts.append(
-                        "**Enhancement (RFE) — pasted, not linked in Customer Portal**\n\n"
-                        + head
-                        + "\n"
-                        + sep
-                        + "\n"
-                        + "\n".join(rfe_row_lines)
-                    )
-                if bug_row_lines:
-                    parts.append(
-                        "**Bugs — pasted, not linked in Customer Portal**\n\n"
-                        + head
-                        + "\n"
-                        + sep
-                        + "\n"
-                        + "\n".join(bug_row_lines)
-                    )
-                report_markdown = "\n\n".join(parts) if parts else ""
-                n = len(jira_keys)
-                self.send_json(
+            api_url = jira_config.get_jira_api_url()
+            client = JIRAClient(api_base_url=api_url, auth_header=_auth_header)
+            rfe_row_lines = []
+            bug_row_lines = []
+            report_rows = []
+            infos = client.get_multiple_statuses(jira_keys, show_progress=False)
+            for jid in jira_keys:
+                info = infos.get(jid) or {}
+                st = (info.get("status") or "").strip() or "—"
+                if st in ("ERROR", "NOT_FOUND"):
+                    st = (info.get("error") or st).strip()
+                summary = (info.get("summary") or "—").strip() or "—"
+                itype = (info.get("issue_type") or "").strip()
+                kind = _classify_jira_paste_row_kind(itype, summary)
+                jira_cell = _format_jira_cell(jid)
+                case_cell = _format_case_cell(NOT_IN_PORTAL_SUPPORT_CASE_LABEL)
+                row_line = f"| {jira_cell} | {case_cell} | {_escape_table_cell(summary[:200])} | {_escape_table_cell(str(st)[:200])} |"
+                if kind == "Bug":
+                    bug_row_lines.append(row_line)
+                else:
+                    rfe_row_lines.append(row_line)
+                report_rows.append(
                     {
-                        "ok": True,
-                        "jira_keys": jira_keys,
-                        "cases": report_rows,
-                        "report_markdown": report_markdown,
-                        "message": f"Found {n} JIRA issue(s). Support Case shows “{NOT_IN_PORTAL_SUPPORT_CASE_LABEL}” — copy the table into your report.",
+                        "jira_id": jid,
+                        "summary": summary,
+                        "jira_status": st,
+                        "issue_type": itype,
+                        "kind": kind,
+                        "no_portal_case": True,
                     }
                 )
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 500)
-            finally:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
+            sep = "|-----------------|--------------|-------------|--------------|"
+            head = "| RED HAT JIRA ID | Support Case | Description | Status/Notes |"
+            parts = []
+            if rfe_row_lines:
+                parts.append(
+                    "**Enhancement (RFE) — pasted, not linked in Customer Portal**\n\n"
+                    + head
+                    + "\n"
+                    + sep
+                    + "\n"
+                    + "\n".join(rfe_row_lines)
+                )
+            if bug_row_lines:
+                parts.append(
+                    "**Bugs — pasted, not linked in Customer Portal**\n\n"
+                    + head
+                    + "\n"
+                    + sep
+                    + "\n"
+                    + "\n".join(bug_row_lines)
+                )
+            report_markdown = "\n\n".join(parts) if parts else ""
+            n = len(jira_keys)
+            self.send_json(
+                {
+                    "ok": True,
+                    "jira_keys": jira_keys,
+                    "cases": report_rows,
+                    "report_markdown": report_markdown,
+                    "message": f"Found {n} JIRA issue(s). Support Case shows “{NOT_IN_PORTAL_SUPPORT_CASE_LABEL}” — copy the table into your report.",
+                }
+            )
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_library_delete(self, data: dict):
+        """POST api/library/delete"""
+        path_str = (data.get("path") or data.get("path_str") or "").strip()
+        if not path_str:
+            self.send_json({"ok": False, "error": "path is required"}, 400)
             return
-        if path.rstrip("/") == "api/library/delete" or path == "api/library/delete":
-            path_str = (data.get("path") or data.get("path_str") or "").strip()
-            if not path_str:
-                self.send_json({"ok": False, "error": "path is required"}, 400)
-                return
-            ok, err = delete_report(path_str)
-            if ok:
-                self.send_json({"ok": True, "message": "Report deleted"})
+        ok, err = delete_report(path_str)
+        if ok:
+            self.send_json({"ok": True, "message": "Report deleted"})
+        else:
+            self.send_json({"ok": False, "error": err or "Delete failed"}, 400)
+
+    def _do_post_google_connect(self, data: dict):
+        """POST api/google/connect"""
+        try:
+            _ensure_taminator_on_path()
+            from taminator.integrations.google_drive import run_oauth_flow
+            success, err = run_oauth_flow()
+            if success:
+                self.send_json({"ok": True, "message": "Connected. You can now back up to Drive and open reports in Google Docs."})
             else:
-                self.send_json({"ok": False, "error": err or "Delete failed"}, 400)
+                self.send_json({"ok": False, "error": err or "OAuth flow failed"}, 400)
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 400)
+
+    def _do_post_google_backup(self, data: dict):
+        """POST api/google/backup"""
+        self._send_job_or_run(data, "google/backup", lambda job: _google_backup())
+
+    def _do_post_config_set_token(self, data: dict):
+        """POST api/config/set-token"""
+        # Never log or expose token values (enterprise UX standard: security).
+        token_type = (data.get("type") or data.get("token_type") or "").strip().lower()
+        value = (data.get("value") or data.get("token") or "").strip()
+        if not token_type or not value:
+            self.send_json({"ok": False, "error": "type and value required"}, 400)
             return
-        if path == "api/google/connect":
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.integrations.google_drive import run_oauth_flow
-                success, err = run_oauth_flow()
-                if success:
-                    self.send_json({"ok": True, "message": "Connected. You can now back up to Drive and open reports in Google Docs."})
-                else:
-                    self.send_json({"ok": False, "error": err or "OAuth flow failed"}, 400)
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 400)
-            finally:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
+        allowed = ("jira", "portal", "jira_token", "portal_token")
+        if token_type not in allowed:
+            self.send_json({"ok": False, "error": "type must be jira or portal"}, 400)
             return
-        if path == "api/google/backup":
+        if token_type in ("jira", "jira_token"):
+            key = "jira_token"
+        else:
+            key = "portal_token"
+        config_dir = Path.home() / ".config" / "taminator"
+        tokens_file = config_dir / "ui_tokens.json"
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.token_store import load_ui_tokens, save_ui_tokens
+            existing = load_ui_tokens(tokens_file)
+            existing[key] = value
+            save_ui_tokens(existing, tokens_file)
+            # When Vault is configured, sync to Vault as well
             try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.integrations.google_drive import backup_reports_to_drive, get_credentials
-                if not get_credentials():
-                    self.send_json({"ok": False, "error": "Google Drive not connected. Click Connect Google below first."}, 400)
-                    return
-                reports = list_reports()
-                files = []
-                for r in reports:
-                    path_str = r.get("path") or ""
-                    name = r.get("name") or r.get("customer", "report") + ".md"
-                    try:
-                        content = Path(path_str).read_text(encoding="utf-8", errors="replace")
-                        files.append({"name": name, "content": content})
-                    except Exception:
-                        continue
-                if not files:
-                    self.send_json({"ok": False, "error": "No report files found to back up."}, 400)
-                    return
-                result = backup_reports_to_drive(files)
-                self.send_json({"ok": True, "url": result.get("url", ""), "count": result.get("count", 0)})
-            except Exception as e:
-                self.send_json({"ok": False, "error": str(e)}, 400)
-            finally:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
+                from taminator.core.hybrid_auth import hybrid_auth
+                if hybrid_auth.is_vault_available():
+                    service = "jira" if key == "jira_token" else "portal" if key == "portal_token" else None
+                    if service:
+                        hybrid_auth.set_token(service, value)
+            except Exception:
+                pass
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            self.send_json({"ok": False, "error": str(e)}, 500)
             return
-        if path == "api/config/set-token":
-            # Never log or expose token values (enterprise UX standard: security).
-            token_type = (data.get("type") or data.get("token_type") or "").strip().lower()
-            value = (data.get("value") or data.get("token") or "").strip()
-            if not token_type or not value:
-                self.send_json({"ok": False, "error": "type and value required"}, 400)
-                return
-            allowed = ("jira", "portal", "jira_token", "portal_token")
-            if token_type not in allowed:
-                self.send_json({"ok": False, "error": "type must be jira or portal"}, 400)
-                return
-            if token_type in ("jira", "jira_token"):
-                key = "jira_token"
+        self.send_json({"ok": True, "message": "Token saved. Restart the server or run a report for it to take effect."})
+
+    def _do_post_config_set_hydra_credentials(self, data: dict):
+        """POST api/config/set-hydra-credentials"""
+        username = (data.get("redhat_username") or "").strip()
+        password = (data.get("redhat_password") or "")
+        config_dir = Path.home() / ".config" / "taminator"
+        tokens_file = config_dir / "ui_tokens.json"
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.token_store import load_ui_tokens, save_ui_tokens
+            existing = load_ui_tokens(tokens_file)
+            if username:
+                existing["redhat_username"] = username
             else:
-                key = "portal_token"
-            config_dir = Path.home() / ".config" / "taminator"
-            tokens_file = config_dir / "ui_tokens.json"
-            src_path = _taminator_src_path()
-            try:
-                if src_path not in sys.path:
-                    sys.path.insert(0, src_path)
-                from taminator.core.token_store import load_ui_tokens, save_ui_tokens
-                existing = load_ui_tokens(tokens_file)
-                existing[key] = value
-                save_ui_tokens(existing, tokens_file)
-                # When Vault is configured, sync to Vault as well
-                try:
-                    from taminator.core.hybrid_auth import hybrid_auth
-                    if hybrid_auth.is_vault_available():
-                        service = "jira" if key == "jira_token" else "portal" if key == "portal_token" else None
-                        if service:
-                            hybrid_auth.set_token(service, value)
-                except Exception:
-                    pass
-            except Exception as e:
-                traceback.print_exc(file=sys.stderr)
-                self.send_json({"ok": False, "error": str(e)}, 500)
-                return
-            finally:
-                if src_path in sys.path:
-                    sys.path.remove(src_path)
-            self.send_json({"ok": True, "message": "Token saved. Restart the server or run a report for it to take effect."})
+                existing.pop("redhat_username", None)
+            if password:
+                existing["redhat_password"] = password
+            else:
+                existing.pop("redhat_password", None)
+            save_ui_tokens(existing, tokens_file)
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            self.send_json({"ok": False, "error": str(e)}, 500)
             return
-        if path.rstrip("/") == "api/config/set-hydra-credentials":
-            username = (data.get("redhat_username") or "").strip()
-            password = (data.get("redhat_password") or "")
-            config_dir = Path.home() / ".config" / "taminator"
-            tokens_file = config_dir / "ui_tokens.json"
-            src_path = _taminator_src_path()
-            try:
-                if src_path not in sys.path:
-                    sys.path.insert(0, src_path)
-                from taminator.core.token_store import load_ui_tokens, save_ui_tokens
-                existing = load_ui_tokens(tokens_file)
-                if username:
-                    existing["redhat_username"] = username
-                else:
-                    existing.pop("redhat_username", None)
-                if password:
-                    existing["redhat_password"] = password
+        self.send_json({"ok": True, "message": "Hydra credentials saved (stored encoded). Env vars override these."})
+
+    def _do_post_config_set_jira_settings(self, data: dict):
+        """POST api/config/set-jira-settings"""
+        config_dir = Path.home() / ".config" / "taminator"
+        tokens_file = config_dir / "ui_tokens.json"
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.token_store import load_ui_tokens, save_ui_tokens
+            existing = load_ui_tokens(tokens_file)
+            for key in ("jira_base_url", "jira_email", "jira_api_token", "jira_token"):
+                if key not in data:
+                    continue
+                val = data[key]
+                if val is None or (isinstance(val, str) and not val.strip()):
+                    existing.pop(key, None)
                 else:
-                    existing.pop("redhat_password", None)
-                save_ui_tokens(existing, tokens_file)
-            except Exception as e:
-                traceback.print_exc(file=sys.stderr)
-                self.send_json({"ok": False, "error": str(e)}, 500)
-                return
-            finally:
-                if src_path in sys.path:
-                    sys.path.remove(src_path)
-            self.send_json({"ok": True, "message": "Hydra credentials saved (stored encoded). Env vars override these."})
-            return
-        if path == "api/config/set-jira-settings":
-            config_dir = Path.home() / ".config" / "taminator"
-            tokens_file = config_dir / "ui_tokens.json"
-            src_path = _taminator_src_path()
-            try:
-                if src_path not in sys.path:
-                    sys.path.insert(0, src_path)
-                from taminator.core.token_store import load_ui_tokens, save_ui_tokens
-                existing = load_ui_tokens(tokens_file)
-                for key in ("jira_base_url", "jira_email", "jira_api_token", "jira_token"):
-                    if key not in data:
-                        continue
-                    val = data[key]
-                    if val is None or (isinstance(val, str) and not val.strip()):
-                        existing.pop(key, None)
-                    else:
-                        existing[key] = val.strip() if isinstance(val, str) else val
-                save_ui_tokens(existing, tokens_file)
-                self.send_json({"ok": True, "message": "JIRA settings saved."})
-            except Exception as e:
-                traceback.print_exc(file=sys.stderr)
-                self.send_json({"ok": False, "error": str(e)}, 500)
-            finally:
-                if src_path in sys.path:
-                    sys.path.remove(src_path)
-            return
-        if path == "api/vault/set":
-            service = (data.get("service") or "").strip()
-            token = (data.get("token") or "").strip()
-            if not service or not token:
-                self.send_json({"ok": False, "error": "service and token required"}, 400)
-                return
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.core.hybrid_auth import hybrid_auth
-                ok = hybrid_auth.set_token(service, token)
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
-                self.send_json({"ok": ok, "message": "Token stored." if ok else "Failed to store token."})
-            except Exception as e:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
-                self.send_json({"ok": False, "error": str(e)}, 500)
-            return
-        if path == "api/vault/delete":
-            service = (data.get("service") or "").strip()
-            if not service:
-                self.send_json({"ok": False, "error": "service required"}, 400)
-                return
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.core.vault_client import vault_client
-                ok = vault_client.delete_token(service)
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
-                self.send_json({"ok": ok, "message": "Token deleted." if ok else "Failed to delete."})
-            except Exception as e:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
-                self.send_json({"ok": False, "error": str(e)}, 500)
-            return
-        if path == "api/vault/migrate":
-            try:
-                sys.path.insert(0, _taminator_src_path())
-                from taminator.core.hybrid_auth import hybrid_auth
-                migrated, failed = hybrid_auth.migrate_to_vault()
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
-                self.send_json({"ok": True, "migrated": migrated, "failed": failed, "message": f"Migrated {migrated} tokens to Vault."})
-            except Exception as e:
-                if _taminator_src_path() in sys.path:
-                    sys.path.remove(_taminator_src_path())
-                self.send_json({"ok": False, "error": str(e)}, 500)
-            return
-        if path == "api/accounts":
-            action = (data.get("action") or "add").strip().lower()
-            accounts = _load_accounts()
-            aid = (data.get("id") or "").strip()
-            account_number = (data.get("account_number") or "").strip()
-            account_numbers = _normalize_account_numbers(data.get("account_numbers") or (account_number if account_number else None))
-            if not account_numbers and account_number:
-                account_numbers = [account_number]
-            customer_name = (data.get("customer_name") or "").strip()
-            if action == "delete":
-                if not aid:
-                    self.send_json({"ok": False, "error": "id required to delete"}, 400)
-                    return
-                new_list = [a for a in accounts if (a.get("id") or "").strip() != aid]
-                if len(new_list) == len(accounts):
-                    self.send_json({"ok": False, "error": "Account not found"}, 404)
-                    return
-                _save_accounts(new_list)
-                self.send_json({"ok": True, "message": "Account removed", "accounts": new_list})
-                return
-            if action == "update":
-                if not aid:
-                    self.send_json({"ok": False, "error": "id required to update"}, 400)
-                    return
-                idx = next((i for i, a in enumerate(accounts) if (a.get("id") or "").strip() == aid), None)
-                if idx is None:
-                    self.send_json({"ok": False, "error": "Account not found"}, 404)
-                    return
-                if account_numbers:
-                    accounts[idx]["account_numbers"] = account_numbers
-                    accounts[idx]["account_number"] = account_numbers[0]
-                if customer_name:
-                    accounts[idx]["customer_name"] = customer_name
-                if "sbr_groups" in data:
-                    accounts[idx]["sbr_groups"] = _normalize_sbr_groups(data["sbr_groups"])
-                _save_accounts(accounts)
-                self.send_json({"ok": True, "message": "Account updated", "accounts": accounts})
-                return
-            # add
-            if not customer_name or not account_numbers:
-                self.send_json({"ok": False, "error": "customer_name and at least one account number required"}, 400)
-                return
-            # Avoid duplicate accounts: only merge when same account numbers and same SBR group
-            idx, existing = _find_account_by_account_numbers(accounts, account_numbers, sbr_groups=data.get("sbr_groups") or [])
-            if idx is not None:
-                merged_nums = list(dict.fromkeys((existing.get("account_numbers") or []) + list(account_numbers)))
-                merged_nums = _normalize_account_numbers(merged_nums) or merged_nums
-                accounts[idx]["account_numbers"] = merged_nums
-                accounts[idx]["account_number"] = merged_nums[0] if merged_nums else ""
-                accounts[idx]["customer_name"] = customer_name
-                if "sbr_groups" in data:
-                    accounts[idx]["sbr_groups"] = _normalize_sbr_groups(data["sbr_groups"])
-                _save_accounts(accounts)
-                self.send_json({"ok": True, "message": "Account updated (already had this account number)", "accounts": accounts})
-                return
-            if not aid:
-                aid = _slug(customer_name)
-            if not aid:
-                self.send_json({"ok": False, "error": "Could not derive id from customer name"}, 400)
-                return
-            if any((a.get("id") or "").strip() == aid for a in accounts):
-                self.send_json({"ok": False, "error": f"Account with id '{aid}' already exists"}, 400)
-                return
-            entry = {"id": aid, "account_numbers": account_numbers, "account_number": account_numbers[0], "customer_name": customer_name, "created_at": datetime.utcnow().isoformat() + "Z"}
-            sbr = _normalize_sbr_groups(data.get("sbr_groups"))
-            if sbr:
-                entry["sbr_groups"] = sbr
-            accounts.append(entry)
-            _save_accounts(accounts)
-            self.send_json({"ok": True, "message": "Account added", "accounts": accounts})
+                    existing[key] = val.strip() if isinstance(val, str) else val
+            save_ui_tokens(existing, tokens_file)
+            self.send_json({"ok": True, "message": "JIRA settings saved."})
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_vault_set(self, data: dict):
+        """POST api/vault/set"""
+        service = (data.get("service") or "").strip()
+        token = (data.get("token") or "").strip()
+        if not service or not token:
+            self.send_json({"ok": False, "error": "service and token required"}, 400)
             return
-        if path not in ("api/check", "api/update"):
-            self.send_json({"ok": False, "error": "Not found"}, 404)
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.hybrid_auth import hybrid_auth
+            ok = hybrid_auth.set_token(service, token)
+            self.send_json({"ok": ok, "message": "Token stored." if ok else "Failed to store token."})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_vault_delete(self, data: dict):
+        """POST api/vault/delete"""
+        service = (data.get("service") or "").strip()
+        if not service:
+            self.send_json({"ok": False, "error": "service required"}, 400)
             return
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.vault_client import vault_client
+            ok = vault_client.delete_token(service)
+            self.send_json({"ok": ok, "message": "Token deleted." if ok else "Failed to delete."})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_vault_migrate(self, data: dict):
+        """POST api/vault/migrate"""
+        try:
+            _ensure_taminator_on_path()
+            from taminator.core.hybrid_auth import hybrid_auth
+            migrated, failed = hybrid_auth.migrate_to_vault()
+            self.send_json({"ok": True, "migrated": migrated, "failed": failed, "message": f"Migrated {migrated} tokens to Vault."})
+        except Exception as e:
+            self.send_json({"ok": False, "error": str(e)}, 500)
+
+    def _do_post_accounts(self, data: dict):
+        """POST api/accounts"""
+        # Serialize the read-modify-write of accounts.json with other requests
+        with _accounts_store().lock:
+            self._apply_accounts_change(data)
+
+    def _do_post_check(self, data: dict):
+        """POST api/check"""
+        self._run_check_or_update("check", data)
+
+    def _do_post_update(self, data: dict):
+        """POST api/update"""
+        self._run_check_or_update("update", data)
+
+    def _run_check_or_update(self, command: str, data: dict):
         customer = (data.get("customer") or "").strip()
         use_test_data = data.get("test_data") is True
         full_refresh = data.get("full_refresh") is True
         if not customer and not use_test_data:
             self.send_json({"ok": False, "error": "customer required (or test_data: true)"}, 400)
             return
-        if use_test_data:
-            args = ["--test-data"]
-        else:
-            args = [customer]
-        # Debug: set TAMINATOR_DEBUG_* so CLI logs API response details to stderr (shown in result).
-        # HYDRA_JIRA=missing-case doc keys + external trackers data; HYDRA_RESPONSE=query + numFound + first doc keys;
-        # JIRA=per-issue HTTP status/body; RHCASE=rhcase stdout/stderr when fallback is used.
-        extra_env = {}
-        if data.get("debug") is True:
-            extra_env["TAMINATOR_DEBUG_HYDRA_JIRA"] = "1"
-            extra_env["TAMINATOR_DEBUG_HYDRA_RESPONSE"] = "1"
-            extra_env["TAMINATOR_DEBUG_JIRA"] = "1"
-            extra_env["TAMINATOR_DEBUG_RHCASE"] = "1"
-        if path == "api/check":
-            stdout, stderr, code = run_cmd(["check"] + args, extra_env=extra_env or None)
-        else:
-            # CLI expects: update <customer> -y (customer must be argv[2])
-            # --verbose: external trackers (JIRA links) when available
-            # --full-refresh: re-discover all cases from portal and repopulate report
-            update_args = ["-y", "--verbose"]
-            if full_refresh:
-                update_args.append("--full-refresh")
-            stdout, stderr, code = run_cmd(["update"] + args + update_args, extra_env=extra_env or None)
-        self.send_json({
-            "ok": code == 0,
-            "returncode": code,
-            "stdout": stdout,
-            "stderr": stderr,
-        })
+
+        def work(job):
+            run = run_tam_command(command, customer or None, test_data=use_test_data, full_refresh=full_refresh,
+                                  debug=data.get("debug") is True, on_output=job.on_output if job else None)
+            return {
+                "ok": run["returncode"] == 0,
+                "returncode": run["returncode"],
+                "stdout": run["stdout"],
+                "stderr": run["stderr"],
+                "result": run["result"],
+            }, 200
+
+        self._send_job_or_run(data, command, work)
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        path = (parsed.path or "").strip().strip("/").rstrip("/")
+        try:
+            content_length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            content_length = 0
+        body = self.rfile.read(content_length).decode("utf-8", errors="replace") if content_length else "{}"
+        try:
+            data = json.loads(body) if body.strip() else {}
+        except json.JSONDecodeError:
+            data = {}
+        name = self.POST_ROUTES.get(path)
+        if not name:
+            self._dispatch("POST", "(not found)", self.send_json, {"ok": False, "error": "Not found"}, 404)
+            return
+        try:
+            self._dispatch("POST", path, getattr(self, name), data)
+        finally:
+            if path in STATUS_INVALIDATING_ROUTES:
+                _credentials_changed()
+
+# --- Optional worker pool mode (tam-rfe serve --worker-pool, or TAMINATOR_WEB_WORKER_POOL=1) ---
+# An asyncio loop accepts connections and reads each request; the request is then answered by the
+# usual blocking TaminatorHandler (same routes and JSON) on a pool of POOL_HANDLER_WORKERS threads,
+# so a burst of page-load calls (status indicators, library, portal search) is capped at that many
+# concurrent handlers instead of one new thread per connection. Handlers do not await anything:
+# their Hydra and JIRA calls block a pool thread (reusing those modules' shared pooled sessions).
+# Connections are closed after each response (no keep-alive). Job event streams are the exception
+# to the pool: they are written from the loop and hold no thread while a job is quiet.
+POOL_HANDLER_WORKERS = 16
+# Largest request head / body accepted in worker pool mode
+POOL_MAX_HEADER_BYTES = 64 * 1024
+POOL_MAX_BODY_BYTES = 32 * 1024 * 1024
+# Poll interval for job events streamed from the event loop
+POOL_SSE_POLL_SECONDS = 0.25
+
+
+class _PoolResponseWriter:
+    """File-like wfile for TaminatorHandler running on a pool thread: each write is sent by the event
+    loop and waits until the connection drained it, so a large response is never buffered whole."""
+
+    def __init__(self, loop, writer):
+        self._loop = loop
+        self._writer = writer
+
+    async def _send(self, data: bytes) -> None:
+        self._writer.write(data)
+        await self._writer.drain()
+
+    def write(self, data) -> int:
+        asyncio.run_coroutine_threadsafe(self._send(bytes(data)), self._loop).result()
+        return len(data)
+
+    def flush(self) -> None:
+        pass
 
 
-def serve(port=8765, open_browser=True):
+def _worker_pool_enabled() -> bool:
+    return os.environ.get("TAMINATOR_WEB_WORKER_POOL", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _pool_handle_request(method: str, target: str, version: str, headers, body: bytes, client_address, wfile) -> None:
+    """Run one parsed request through TaminatorHandler (on a pool thread); the connection closes after it."""
+    handler = TaminatorHandler.__new__(TaminatorHandler)
+    handler.client_address = client_address
+    handler.server = None
+    handler.command = method
+    handler.path = target
+    handler.request_version = version
+    handler.requestline = f"{method} {target} {version}"
+    handler.headers = headers
+    handler.rfile = io.BytesIO(body)
+    handler.wfile = wfile
+    handler.close_connection = True
+    do = getattr(handler, "do_" + method, None)
+    if do is None:
+        handler.send_error(501, f"Unsupported method ({method!r})")
+        return
+    do()
+
+
+async def _pool_stream_job_events(job: Job, headers, writer) -> None:
+    """SSE for a job served from the event loop (same events as TaminatorHandler._stream_job_events)."""
+    try:
+        last = int(headers.get("Last-Event-ID") or 0)
+    except ValueError:
+        last = 0
+    writer.write(
+        b"HTTP/1.0 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+        b"Access-Control-Allow-Origin: *\r\nAccess-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+        b"Access-Control-Allow-Headers: Content-Type, Authorization\r\n\r\n"
+    )
+    quiet_since = time.monotonic()
+    while True:
+        events = job.events_after(last, 0)
+        if not events and job.finished:
+            events = [(last + 1, "done", job.to_dict())]
+        for seq, event, payload in events:
+            writer.write(_sse_frame(seq, event, payload))
+            last = seq
+            if event == "done":
+                await writer.drain()
+                return
+        if events:
+            quiet_since = time.monotonic()
+        elif time.monotonic() - quiet_since >= JOB_EVENTS_KEEPALIVE:
+            writer.write(b": keep-alive\n\n")
+            quiet_since = time.monotonic()
+        await writer.drain()
+        await asyncio.sleep(POOL_SSE_POLL_SECONDS)
+
+
+async def _pool_handle_connection(reader, writer, pool) -> None:
+    import http.client
+
+    loop = asyncio.get_running_loop()
+    try:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return
+        request_line, _, header_bytes = head.partition(b"\r\n")
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+            headers = http.client.parse_headers(io.BytesIO(header_bytes))
+            length = int(headers.get("Content-Length") or 0)
+        except (ValueError, http.client.HTTPException):
+            writer.write(b"HTTP/1.0 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            return
+        if length < 0 or length > POOL_MAX_BODY_BYTES:
+            writer.write(b"HTTP/1.0 413 Payload Too Large\r\nContent-Length: 0\r\n\r\n")
+            return
+        body = await reader.readexactly(length) if length else b""
+
+        # Job event streams can stay open for minutes; keep them off the worker pool
+        parts = urlparse(target).path.strip("/").split("/")
+        if method == "GET" and len(parts) == 4 and parts[:2] == ["api", "jobs"] and parts[3] == "events":
+            job = get_job(parts[2])
+            if job:
+                await _pool_stream_job_events(job, headers, writer)
+                return
+
+        wfile = _PoolResponseWriter(loop, writer)
+        peer = writer.get_extra_info("peername") or ("", 0)
+        await loop.run_in_executor(pool, _pool_handle_request, method, target, version, headers, body, peer[:2], wfile)
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception as e:
+        print(f"[web] request failed: {e}", file=sys.stderr)
+    finally:
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+
+async def _serve_worker_pool(port: int, on_ready=None) -> None:
+    pool = ThreadPoolExecutor(max_workers=POOL_HANDLER_WORKERS, thread_name_prefix="web-pool")
+    server = await asyncio.start_server(
+        lambda r, w: _pool_handle_connection(r, w, pool),
+        "127.0.0.1",
+        port,
+        limit=POOL_MAX_HEADER_BYTES,
+    )
+    if on_ready:
+        on_ready(server)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.shutdown(wait=False)
+
+
+def serve(port=8765, open_browser=True, worker_pool=None, warm=None):
+    """Run the web UI server until interrupted.
+
+    worker_pool: True for the bounded worker pool mode (see _serve_worker_pool); default follows
+        TAMINATOR_WEB_WORKER_POOL.
+    warm: True to import WARM_IMPORT_MODULES in the background right after startup; default follows
+        TAMINATOR_WEB_WARM_IMPORTS.
+    """
     _ensure_taminator_on_path()
     if not os.path.isdir(WEB_DIR):
         print(f"Web directory not found: {WEB_DIR}", file=sys.stderr)
         sys.exit(1)
-    server = ThreadingHTTPServer(("127.0.0.1", port), TaminatorHandler)
+    if worker_pool is None:
+        worker_pool = _worker_pool_enabled()
+    if warm is None:
+        warm = os.environ.get("TAMINATOR_WEB_WARM_IMPORTS", "").strip().lower() in ("1", "true", "yes", "on")
+    if warm:
+        threading.Thread(target=warm_imports, name="web-warm-imports", daemon=True).start()
+    # First status check runs while the browser is still loading the page
+    _status_indicators.start()
     url = f"http://127.0.0.1:{port}"
-    print(f"RFE and Bug Tracker web UI: {url}")
-    if open_browser:
-        import webbrowser
-        webbrowser.open(url)
+
+    def announce(_server=None):
+        print(f"RFE and Bug Tracker web UI: {url}" + (" (worker pool)" if worker_pool else ""))
+        if open_browser:
+            import webbrowser
+            webbrowser.open(url)
+
+    if worker_pool:
+        try:
+            asyncio.run(_serve_worker_pool(port, on_ready=announce))
+        except KeyboardInterrupt:
+            print("\nShutting down.")
+        return
+    server = ThreadingHTTPServer(("127.0.0.1", port), TaminatorHandler)
+    announce()
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -2411,5 +2957,8 @@ if __name__ == "__main__":
     p = argparse.ArgumentParser(description="RFE and Bug Tracker web UI server")
     p.add_argument("--port", type=int, default=8765, help="Port (default 8765)")
     p.add_argument("--no-browser", action="store_true", help="Do not open browser")
+    p.add_argument("--worker-pool", dest="worker_pool", action="store_true", default=None,
+                   help="Answer requests on a bounded thread pool behind an asyncio listener (also TAMINATOR_WEB_WORKER_POOL=1)")
+    p.add_argument("--warm-imports", dest="warm", action="store_true", default=None, help="Preload handler modules at startup (also TAMINATOR_WEB_WARM_IMPORTS=1)")
     args = p.parse_args()
-    serve(port=args.port, open_browser=not args.no_browser)
+    serve(port=args.port, open_browser=not args.no_browser, worker_pool=args.worker_pool, warm=args.warm)